@@ -34,9 +34,24 @@ def get_metadata():
         return target_db.metadatas[None]
     return target_db.metadata
 
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Esclude dall'autogenerate l'indice full-text: article_fts e le sue
+    tabelle ombra sono create dalla migrazione FTS5 e non hanno un modello,
+    quindi senza questo filtro verrebbero proposte per la rimozione.
+    """
+    if type_ == "table" and name.startswith("article_fts"):
+        return False
+    return True
+
 def run_migrations_offline():
     url = config.get_main_option("sqlalchemy.url")
-    context.configure(url=url, target_metadata=get_metadata(), literal_binds=True)
+    context.configure(
+        url=url,
+        target_metadata=get_metadata(),
+        literal_binds=True,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -52,6 +67,7 @@ def run_migrations_online():
     conf_args = current_app.extensions["migrate"].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
+    conf_args.setdefault("include_object", include_object)
 
     connectable = get_engine()
 
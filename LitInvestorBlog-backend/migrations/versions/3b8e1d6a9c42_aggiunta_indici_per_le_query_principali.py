@@ -0,0 +1,40 @@
+# LitInvestorBlog-backend/migrations/versions/3b8e1d6a9c42_aggiunta_indici_per_le_query_principali.py
+
+"""Aggiunta indici per le query principali
+
+Revision ID: 3b8e1d6a9c42
+Revises: f0c3e9f827a4
+Create Date: 2026-10-18 10:12:31.402118
+
+"""
+
+from alembic import op
+
+revision = "3b8e1d6a9c42"
+down_revision = "f0c3e9f827a4"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_article_published_created_at", "article", ["published", "created_at"]),
+    ("ix_article_category_id_created_at", "article", ["category_id", "created_at"]),
+    ("ix_article_author_id_created_at", "article", ["author_id", "created_at"]),
+    ("ix_comment_article_id_created_at", "comment", ["article_id", "created_at"]),
+    ("ix_article_like_user_id_created_at", "article_like", ["user_id", "created_at"]),
+    (
+        "ix_article_favorite_user_id_created_at",
+        "article_favorite",
+        ["user_id", "created_at"],
+    ),
+    ("ix_shares_article_id_created_at", "shares", ["article_id", "created_at"]),
+]
+
+def upgrade():
+
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+def downgrade():
+
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
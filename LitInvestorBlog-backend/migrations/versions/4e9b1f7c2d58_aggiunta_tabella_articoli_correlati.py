@@ -0,0 +1,35 @@
+# LitInvestorBlog-backend/migrations/versions/4e9b1f7c2d58_aggiunta_tabella_articoli_correlati.py
+
+"""Aggiunta tabella article_related con i vicini precalcolati
+
+Revision ID: 4e9b1f7c2d58
+Revises: c5a7e2f09b14
+Create Date: 2026-10-18 15:21:07.418305
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "4e9b1f7c2d58"
+down_revision = "c5a7e2f09b14"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+
+    op.create_table(
+        "article_related",
+        sa.Column("article_id", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("related_id", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["article_id"], ["article.id"]),
+        sa.ForeignKeyConstraint(["related_id"], ["article.id"]),
+        sa.PrimaryKeyConstraint("article_id", "rank"),
+    )
+
+def downgrade():
+
+    op.drop_table("article_related")
@@ -0,0 +1,68 @@
+# LitInvestorBlog-backend/migrations/versions/8d2f4c7e1a93_aggiunta_indice_full_text_articoli.py
+
+"""Aggiunta indice full-text FTS5 sugli articoli
+
+Revision ID: 8d2f4c7e1a93
+Revises: 3b8e1d6a9c42
+Create Date: 2026-10-18 11:40:07.918254
+
+"""
+
+from alembic import op
+
+revision = "8d2f4c7e1a93"
+down_revision = "3b8e1d6a9c42"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE article_fts USING fts5(
+            title,
+            excerpt,
+            content,
+            content='article',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER article_fts_ai AFTER INSERT ON article BEGIN
+            INSERT INTO article_fts(rowid, title, excerpt, content)
+            VALUES (new.id, new.title, new.excerpt, new.content);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER article_fts_ad AFTER DELETE ON article BEGIN
+            INSERT INTO article_fts(article_fts, rowid, title, excerpt, content)
+            VALUES ('delete', old.id, old.title, old.excerpt, old.content);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER article_fts_au AFTER UPDATE OF title, excerpt, content
+        ON article BEGIN
+            INSERT INTO article_fts(article_fts, rowid, title, excerpt, content)
+            VALUES ('delete', old.id, old.title, old.excerpt, old.content);
+            INSERT INTO article_fts(rowid, title, excerpt, content)
+            VALUES (new.id, new.title, new.excerpt, new.content);
+        END
+        """
+    )
+
+    op.execute("INSERT INTO article_fts(article_fts) VALUES ('rebuild')")
+
+def downgrade():
+
+    op.execute("DROP TRIGGER IF EXISTS article_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS article_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS article_fts_ai")
+    op.execute("DROP TABLE IF EXISTS article_fts")
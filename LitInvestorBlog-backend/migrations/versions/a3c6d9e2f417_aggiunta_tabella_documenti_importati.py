@@ -0,0 +1,44 @@
+# LitInvestorBlog-backend/migrations/versions/a3c6d9e2f417_aggiunta_tabella_documenti_importati.py
+
+"""Aggiunta tabella imported_document per l'import dei manoscritti Word
+
+Revision ID: a3c6d9e2f417
+Revises: 4e9b1f7c2d58
+Create Date: 2026-10-18 16:48:33.902517
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "a3c6d9e2f417"
+down_revision = "4e9b1f7c2d58"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+
+    op.create_table(
+        "imported_document",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("path", sa.String(length=500), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("article_id", sa.Integer(), nullable=True),
+        sa.Column("imported_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["article_id"], ["article.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("path"),
+    )
+    with op.batch_alter_table("imported_document", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_imported_document_content_hash"),
+            ["content_hash"],
+            unique=False,
+        )
+
+def downgrade():
+
+    with op.batch_alter_table("imported_document", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_imported_document_content_hash"))
+
+    op.drop_table("imported_document")
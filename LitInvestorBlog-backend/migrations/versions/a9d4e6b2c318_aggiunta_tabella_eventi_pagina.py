@@ -0,0 +1,47 @@
+# LitInvestorBlog-backend/migrations/versions/a9d4e6b2c318_aggiunta_tabella_eventi_pagina.py
+
+"""Aggiunta tabella page_event per gli eventi di navigazione
+
+Revision ID: a9d4e6b2c318
+Revises: f3a8c1e7b260
+Create Date: 2026-10-18 20:31:17.842906
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "a9d4e6b2c318"
+down_revision = "f3a8c1e7b260"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+
+    op.create_table(
+        "page_event",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("type", sa.String(length=20), nullable=False),
+        sa.Column("path", sa.String(length=500), nullable=False),
+        sa.Column("article_id", sa.Integer(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("value", sa.Float(), nullable=True),
+        sa.Column("occurred_at", sa.DateTime(), nullable=False),
+        sa.Column("received_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_page_event_article_id_occurred_at",
+        "page_event",
+        ["article_id", "occurred_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_page_event_occurred_at", "page_event", ["occurred_at"], unique=False
+    )
+
+def downgrade():
+
+    op.drop_index("ix_page_event_occurred_at", table_name="page_event")
+    op.drop_index("ix_page_event_article_id_occurred_at", table_name="page_event")
+    op.drop_table("page_event")
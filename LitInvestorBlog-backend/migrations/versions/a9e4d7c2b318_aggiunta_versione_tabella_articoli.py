@@ -0,0 +1,48 @@
+# LitInvestorBlog-backend/migrations/versions/a9e4d7c2b318_aggiunta_versione_tabella_articoli.py
+
+"""Aggiunta versione della tabella article mantenuta da trigger
+
+Revision ID: a9e4d7c2b318
+Revises: c8f2d5a1e974
+Create Date: 2026-10-18 22:31:07.518204
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "a9e4d7c2b318"
+down_revision = "c8f2d5a1e974"
+branch_labels = None
+depends_on = None
+
+CATALOG_NAME = "article"
+
+def upgrade():
+
+    op.execute(
+        f"""
+        INSERT INTO catalog_version (name, version) VALUES ('{CATALOG_NAME}', 1)
+        ON CONFLICT (name) DO NOTHING
+        """
+    )
+
+    # Ogni modifica di article, contatori compresi, incrementa la versione
+    # nella stessa transazione: la firma degli ETag è una lettura per chiave
+    for suffix, action in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE")):
+        op.execute(
+            f"""
+            CREATE TRIGGER catalog_version_article_{suffix} AFTER {action} ON article
+            BEGIN
+                INSERT INTO catalog_version (name, version)
+                VALUES ('{CATALOG_NAME}', 1)
+                ON CONFLICT (name) DO UPDATE SET version = version + 1;
+            END
+            """
+        )
+
+def downgrade():
+
+    for suffix in ("ad", "au", "ai"):
+        op.execute(f"DROP TRIGGER IF EXISTS catalog_version_article_{suffix}")
+    op.execute(f"DELETE FROM catalog_version WHERE name = '{CATALOG_NAME}'")
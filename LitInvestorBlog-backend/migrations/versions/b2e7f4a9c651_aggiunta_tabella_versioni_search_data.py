@@ -0,0 +1,31 @@
+# LitInvestorBlog-backend/migrations/versions/b2e7f4a9c651_aggiunta_tabella_versioni_search_data.py
+
+"""Aggiunta tabella search_data_snapshot per i delta tra worker
+
+Revision ID: b2e7f4a9c651
+Revises: a9d4e6b2c318
+Create Date: 2026-10-18 21:05:42.319804
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "b2e7f4a9c651"
+down_revision = "a9d4e6b2c318"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+
+    op.create_table(
+        "search_data_snapshot",
+        sa.Column("version", sa.String(length=16), nullable=False),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("version"),
+    )
+
+def downgrade():
+
+    op.drop_table("search_data_snapshot")
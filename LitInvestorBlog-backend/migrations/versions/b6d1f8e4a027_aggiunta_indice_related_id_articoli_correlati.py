@@ -0,0 +1,32 @@
+# LitInvestorBlog-backend/migrations/versions/b6d1f8e4a027_aggiunta_indice_related_id_articoli_correlati.py
+
+"""Aggiunta indice su article_related.related_id
+
+Usato per trovare chi ha un articolo tra i vicini.
+
+Revision ID: b6d1f8e4a027
+Revises: a9e4d7c2b318
+Create Date: 2026-10-18 22:47:52.904316
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "b6d1f8e4a027"
+down_revision = "a9e4d7c2b318"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+
+    op.create_index(
+        op.f("ix_article_related_related_id"),
+        "article_related",
+        ["related_id"],
+        unique=False,
+    )
+
+def downgrade():
+
+    op.drop_index(op.f("ix_article_related_related_id"), table_name="article_related")
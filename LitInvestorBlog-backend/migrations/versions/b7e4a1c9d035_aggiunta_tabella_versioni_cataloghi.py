@@ -0,0 +1,31 @@
+# LitInvestorBlog-backend/migrations/versions/b7e4a1c9d035_aggiunta_tabella_versioni_cataloghi.py
+
+"""Aggiunta tabella catalog_version per il catalogo delle categorie in memoria
+
+Revision ID: b7e4a1c9d035
+Revises: a3c6d9e2f417
+Create Date: 2026-10-18 17:55:12.640219
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "b7e4a1c9d035"
+down_revision = "a3c6d9e2f417"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+
+    catalog_version = op.create_table(
+        "catalog_version",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.bulk_insert(catalog_version, [{"name": "category", "version": 1}])
+
+def downgrade():
+
+    op.drop_table("catalog_version")
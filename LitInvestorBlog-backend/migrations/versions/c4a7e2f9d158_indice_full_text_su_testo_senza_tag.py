@@ -0,0 +1,91 @@
+# LitInvestorBlog-backend/migrations/versions/c4a7e2f9d158_indice_full_text_su_testo_senza_tag.py
+
+"""Indice full-text sul testo degli articoli senza tag HTML
+
+article_fts legge il contenuto dalla vista article_search_text, che passa
+l'HTML per strip_html(): snippet() lavora così sul testo semplice e non
+taglia i tag a metà. strip_html() è la funzione SQL registrata dall'app su
+ogni connessione (src/utils/search_index.py).
+
+Revision ID: c4a7e2f9d158
+Revises: b6d1f8e4a027
+Create Date: 2026-10-18 23:31:12.406835
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "c4a7e2f9d158"
+down_revision = "b6d1f8e4a027"
+branch_labels = None
+depends_on = None
+
+def _drop_index():
+    op.execute("DROP TRIGGER IF EXISTS article_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS article_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS article_fts_ai")
+    op.execute("DROP TABLE IF EXISTS article_fts")
+
+def _create_index(source, content):
+    """article_fts su `source` e i trigger, con `content` calcolato da `row`"""
+    op.execute(
+        f"""
+        CREATE VIRTUAL TABLE article_fts USING fts5(
+            title,
+            excerpt,
+            content,
+            content='{source}',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        """
+    )
+
+    new, old = content.format(row="new"), content.format(row="old")
+    op.execute(
+        f"""
+        CREATE TRIGGER article_fts_ai AFTER INSERT ON article BEGIN
+            INSERT INTO article_fts(rowid, title, excerpt, content)
+            VALUES (new.id, new.title, new.excerpt, {new});
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER article_fts_ad AFTER DELETE ON article BEGIN
+            INSERT INTO article_fts(article_fts, rowid, title, excerpt, content)
+            VALUES ('delete', old.id, old.title, old.excerpt, {old});
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER article_fts_au AFTER UPDATE OF title, excerpt, content
+        ON article BEGIN
+            INSERT INTO article_fts(article_fts, rowid, title, excerpt, content)
+            VALUES ('delete', old.id, old.title, old.excerpt, {old});
+            INSERT INTO article_fts(rowid, title, excerpt, content)
+            VALUES (new.id, new.title, new.excerpt, {new});
+        END
+        """
+    )
+
+    op.execute("INSERT INTO article_fts(article_fts) VALUES ('rebuild')")
+
+def upgrade():
+
+    _drop_index()
+    op.execute(
+        """
+        CREATE VIEW article_search_text AS
+        SELECT id, title, excerpt, strip_html(content) AS content FROM article
+        """
+    )
+    _create_index("article_search_text", "strip_html({row}.content)")
+
+def downgrade():
+
+    _drop_index()
+    op.execute("DROP VIEW IF EXISTS article_search_text")
+    _create_index("article", "{row}.content")
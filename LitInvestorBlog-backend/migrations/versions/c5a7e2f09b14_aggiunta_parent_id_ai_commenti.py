@@ -0,0 +1,33 @@
+# LitInvestorBlog-backend/migrations/versions/c5a7e2f09b14_aggiunta_parent_id_ai_commenti.py
+
+"""Aggiunta parent_id ai commenti per le discussioni
+
+Revision ID: c5a7e2f09b14
+Revises: 8d2f4c7e1a93
+Create Date: 2026-10-18 14:03:52.260871
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "c5a7e2f09b14"
+down_revision = "8d2f4c7e1a93"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+
+    with op.batch_alter_table("comment", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("parent_id", sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_comment_parent_id_comment", "comment", ["parent_id"], ["id"]
+        )
+        batch_op.create_index("ix_comment_parent_id", ["parent_id"], unique=False)
+
+def downgrade():
+
+    with op.batch_alter_table("comment", schema=None) as batch_op:
+        batch_op.drop_index("ix_comment_parent_id")
+        batch_op.drop_constraint("fk_comment_parent_id_comment", type_="foreignkey")
+        batch_op.drop_column("parent_id")
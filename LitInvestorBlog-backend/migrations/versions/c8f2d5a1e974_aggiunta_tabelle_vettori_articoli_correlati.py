@@ -0,0 +1,50 @@
+# LitInvestorBlog-backend/migrations/versions/c8f2d5a1e974_aggiunta_tabelle_vettori_articoli_correlati.py
+
+"""Aggiunta tabelle article_term, related_term e related_refresh
+
+Revision ID: c8f2d5a1e974
+Revises: b2e7f4a9c651
+Create Date: 2026-10-18 21:48:13.602417
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "c8f2d5a1e974"
+down_revision = "b2e7f4a9c651"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+
+    op.create_table(
+        "article_term",
+        sa.Column("article_id", sa.Integer(), nullable=False),
+        sa.Column("term", sa.String(length=64), nullable=False),
+        sa.Column("weight", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["article_id"], ["article.id"]),
+        sa.PrimaryKeyConstraint("article_id", "term"),
+    )
+    op.create_index("ix_article_term_term", "article_term", ["term"], unique=False)
+
+    op.create_table(
+        "related_term",
+        sa.Column("term", sa.String(length=64), nullable=False),
+        sa.Column("idf", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("term"),
+    )
+
+    op.create_table(
+        "related_refresh",
+        sa.Column("article_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("queued_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("article_id"),
+    )
+
+def downgrade():
+
+    op.drop_table("related_refresh")
+    op.drop_table("related_term")
+    op.drop_index("ix_article_term_term", table_name="article_term")
+    op.drop_table("article_term")
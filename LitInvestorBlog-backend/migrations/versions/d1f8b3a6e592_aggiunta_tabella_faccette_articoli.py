@@ -0,0 +1,113 @@
+# LitInvestorBlog-backend/migrations/versions/d1f8b3a6e592_aggiunta_tabella_faccette_articoli.py
+
+"""Aggiunta tabella article_facet mantenuta da trigger
+
+Revision ID: d1f8b3a6e592
+Revises: b7e4a1c9d035
+Create Date: 2026-10-18 18:37:45.118064
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "d1f8b3a6e592"
+down_revision = "b7e4a1c9d035"
+branch_labels = None
+depends_on = None
+
+FACET_KEY = """
+    {row}.category_id,
+    {row}.author_id,
+    CAST(strftime('%Y', {row}.created_at) AS INTEGER),
+    CAST(strftime('%m', {row}.created_at) AS INTEGER)
+"""
+
+FACET_MATCH = """
+    category_id = {row}.category_id
+    AND author_id = {row}.author_id
+    AND year = CAST(strftime('%Y', {row}.created_at) AS INTEGER)
+    AND month = CAST(strftime('%m', {row}.created_at) AS INTEGER)
+"""
+
+def _increment(row, condition):
+    return f"""
+        INSERT INTO article_facet (
+            category_id, author_id, year, month, published_count
+        )
+        SELECT {FACET_KEY.format(row=row)}, 1
+        WHERE {condition}
+        ON CONFLICT (category_id, author_id, year, month)
+        DO UPDATE SET published_count = published_count + 1;
+    """
+
+def _decrement(row, condition):
+    return f"""
+        UPDATE article_facet SET published_count = published_count - 1
+        WHERE {condition} AND {FACET_MATCH.format(row=row)};
+        DELETE FROM article_facet
+        WHERE published_count <= 0 AND {FACET_MATCH.format(row=row)};
+    """
+
+def upgrade():
+
+    op.create_table(
+        "article_facet",
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column("author_id", sa.Integer(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("published_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("category_id", "author_id", "year", "month"),
+    )
+
+    op.execute(
+        f"""
+        CREATE TRIGGER article_facet_ai AFTER INSERT ON article
+        WHEN new.published BEGIN
+            {_increment("new", "new.published")}
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER article_facet_ad AFTER DELETE ON article
+        WHEN old.published BEGIN
+            {_decrement("old", "old.published")}
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER article_facet_au
+        AFTER UPDATE OF published, category_id, author_id, created_at ON article
+        BEGIN
+            {_decrement("old", "old.published")}
+            {_increment("new", "new.published")}
+        END
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO article_facet (
+            category_id, author_id, year, month, published_count
+        )
+        SELECT
+            category_id,
+            author_id,
+            CAST(strftime('%Y', created_at) AS INTEGER),
+            CAST(strftime('%m', created_at) AS INTEGER),
+            count(*)
+        FROM article
+        WHERE published
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+def downgrade():
+
+    op.execute("DROP TRIGGER IF EXISTS article_facet_au")
+    op.execute("DROP TRIGGER IF EXISTS article_facet_ad")
+    op.execute("DROP TRIGGER IF EXISTS article_facet_ai")
+    op.drop_table("article_facet")
@@ -0,0 +1,69 @@
+# LitInvestorBlog-backend/migrations/versions/e6c2a9d4f871_aggiunta_tabelle_rollup_analytics.py
+
+"""Aggiunta tabelle di rollup giornaliero e indici su created_at
+
+Revision ID: e6c2a9d4f871
+Revises: d1f8b3a6e592
+Create Date: 2026-10-18 19:12:08.504317
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "e6c2a9d4f871"
+down_revision = "d1f8b3a6e592"
+branch_labels = None
+depends_on = None
+
+# Il rollup incrementale legge per intervallo di created_at queste tabelle
+CREATED_AT_TABLES = (
+    "article",
+    "article_like",
+    "comment",
+    "shares",
+    "user",
+    "donations",
+)
+
+def upgrade():
+
+    op.create_table(
+        "analytics_daily",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("articles", sa.Integer(), nullable=False),
+        sa.Column("users", sa.Integer(), nullable=False),
+        sa.Column("comments", sa.Integer(), nullable=False),
+        sa.Column("likes", sa.Integer(), nullable=False),
+        sa.Column("shares", sa.Integer(), nullable=False),
+        sa.Column("donations", sa.Integer(), nullable=False),
+        sa.Column("revenue", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("day"),
+    )
+    op.create_table(
+        "article_daily",
+        sa.Column("article_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("likes", sa.Integer(), nullable=False),
+        sa.Column("comments", sa.Integer(), nullable=False),
+        sa.Column("shares", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("article_id", "day"),
+    )
+    op.create_table(
+        "rollup_state",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("watermark", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+    for table in CREATED_AT_TABLES:
+        op.create_index(f"ix_{table}_created_at", table, ["created_at"], unique=False)
+
+def downgrade():
+
+    for table in CREATED_AT_TABLES:
+        op.drop_index(f"ix_{table}_created_at", table_name=table)
+
+    op.drop_table("rollup_state")
+    op.drop_table("article_daily")
+    op.drop_table("analytics_daily")
@@ -0,0 +1,135 @@
+# LitInvestorBlog-backend/migrations/versions/f3a8c1e7b260_aggiunta_tabella_engagement_articoli.py
+
+"""Aggiunta tabella article_engagement mantenuta da trigger
+
+Revision ID: f3a8c1e7b260
+Revises: e6c2a9d4f871
+Create Date: 2026-10-18 19:54:31.287640
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "f3a8c1e7b260"
+down_revision = "e6c2a9d4f871"
+branch_labels = None
+depends_on = None
+
+ENGAGEMENT_SCORE = "likes * 3 + comments * 5 + shares * 4 + views * 0.1"
+
+# Tabella sorgente -> colonna di article_engagement che conta le sue righe
+COUNTED_TABLES = (
+    ("article_like", "likes"),
+    ("comment", "comments"),
+    ("shares", "shares"),
+)
+
+def upgrade():
+
+    op.create_table(
+        "article_engagement",
+        sa.Column("article_id", sa.Integer(), nullable=False),
+        sa.Column("likes", sa.Integer(), nullable=False),
+        sa.Column("comments", sa.Integer(), nullable=False),
+        sa.Column("shares", sa.Integer(), nullable=False),
+        sa.Column("views", sa.Integer(), nullable=False),
+        sa.Column(
+            "score", sa.Float(), sa.Computed(ENGAGEMENT_SCORE, persisted=True)
+        ),
+        sa.PrimaryKeyConstraint("article_id"),
+    )
+    op.create_index(
+        "ix_article_engagement_score", "article_engagement", ["score"], unique=False
+    )
+
+    for table, column in COUNTED_TABLES:
+        # L'incremento crea la riga se manca; il decremento non la ricrea
+        # quando l'articolo è già stato eliminato
+        op.execute(
+            f"""
+            CREATE TRIGGER article_engagement_{table}_ai AFTER INSERT ON {table}
+            BEGIN
+                INSERT INTO article_engagement (
+                    article_id, likes, comments, shares, views
+                )
+                VALUES (new.article_id, 0, 0, 0, 0)
+                ON CONFLICT (article_id) DO NOTHING;
+                UPDATE article_engagement SET {column} = {column} + 1
+                WHERE article_id = new.article_id;
+            END
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER article_engagement_{table}_ad AFTER DELETE ON {table}
+            BEGIN
+                UPDATE article_engagement SET {column} = max({column} - 1, 0)
+                WHERE article_id = old.article_id;
+            END
+            """
+        )
+
+    op.execute(
+        """
+        CREATE TRIGGER article_engagement_article_ai AFTER INSERT ON article
+        BEGIN
+            INSERT INTO article_engagement (
+                article_id, likes, comments, shares, views
+            )
+            VALUES (new.id, 0, 0, 0, coalesce(new.views_count, 0))
+            ON CONFLICT (article_id) DO NOTHING;
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER article_engagement_article_au
+        AFTER UPDATE OF views_count ON article
+        BEGIN
+            UPDATE article_engagement SET views = coalesce(new.views_count, 0)
+            WHERE article_id = new.id;
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER article_engagement_article_ad AFTER DELETE ON article
+        BEGIN
+            DELETE FROM article_engagement WHERE article_id = old.id;
+        END
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO article_engagement (article_id, likes, comments, shares, views)
+        SELECT
+            article.id,
+            coalesce(likes.total, 0),
+            coalesce(comments.total, 0),
+            coalesce(shares.total, 0),
+            coalesce(article.views_count, 0)
+        FROM article
+        LEFT JOIN (
+            SELECT article_id, count(*) AS total FROM article_like GROUP BY 1
+        ) AS likes ON likes.article_id = article.id
+        LEFT JOIN (
+            SELECT article_id, count(*) AS total FROM comment GROUP BY 1
+        ) AS comments ON comments.article_id = article.id
+        LEFT JOIN (
+            SELECT article_id, count(*) AS total FROM shares GROUP BY 1
+        ) AS shares ON shares.article_id = article.id
+        """
+    )
+
+def downgrade():
+
+    op.execute("DROP TRIGGER IF EXISTS article_engagement_article_ad")
+    op.execute("DROP TRIGGER IF EXISTS article_engagement_article_au")
+    op.execute("DROP TRIGGER IF EXISTS article_engagement_article_ai")
+    for table, _ in reversed(COUNTED_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS article_engagement_{table}_ad")
+        op.execute(f"DROP TRIGGER IF EXISTS article_engagement_{table}_ai")
+    op.drop_index("ix_article_engagement_score", table_name="article_engagement")
+    op.drop_table("article_engagement")
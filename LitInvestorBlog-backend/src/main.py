@@ -2,7 +2,7 @@
 
 import os
 import click
-from flask import Flask, send_from_directory, Blueprint
+from flask import Flask, send_from_directory, Blueprint, current_app
 from flask.cli import with_appcontext
 from flask_cors import CORS
 from flask_migrate import Migrate
@@ -26,9 +26,29 @@ from src.routes.filters import filters_bp
 from src.routes.content import content_bp
 from src.routes.stripe import stripe_bp
 from src.routes.search import search_bp
+from src.routes.events import events_bp
+from src.utils.article_cache import article_cache
+from src.utils.category_catalog import category_catalog
+from src.utils.counters import (
+    reconcile_counters,
+    reconcile_engagement,
+    reconcile_facets,
+)
+from src.utils.docx_import import import_documents
+from src.utils.event_queue import event_queue
+from src.utils.related_articles import related_index
+from src.utils.rollup import run_rollup
+from src.utils.search_index import rebuild_search_index
+from src.utils.user_version import user_version
+from src.utils.view_counter import view_counter
 
-def create_app():
-    """Application Factory Function"""
+def create_app(test_config=None):
+    """
+    Application Factory Function
+
+    `test_config` sovrascrive la configurazione predefinita (per esempio il
+    database) prima dell'inizializzazione delle estensioni.
+    """
     app = Flask(__name__)
 
     app.config["SECRET_KEY"] = "asdf#FGSgvasgf$5$WGT"
@@ -45,9 +65,17 @@ def create_app():
     app.config["SESSION_COOKIE_SAMESITE"] = "Lax"
     app.config["SESSION_COOKIE_SECURE"] = False
     app.config["SESSION_COOKIE_HTTPONLY"] = True
+    if test_config is not None:
+        app.config.update(test_config)
 
     db.init_app(app)
     oauth.init_app(app)
+    view_counter.init_app(app)
+    event_queue.init_app(app)
+    article_cache.init_app(app)
+    category_catalog.init_app(app)
+    related_index.init_app(app)
+    user_version.init_app(app)
     Migrate(app, db)
     CORS(app, origins="http://localhost:5173", supports_credentials=True)
 
@@ -94,9 +122,16 @@ def create_app():
     app.register_blueprint(content_bp, url_prefix="/api/content")
     app.register_blueprint(stripe_bp, url_prefix="/api/stripe")
     app.register_blueprint(search_bp, url_prefix="/api")
+    app.register_blueprint(events_bp, url_prefix="/api/events")
 
     app.cli.add_command(create_admin)
     app.cli.add_command(seed_db)
+    app.cli.add_command(rebuild_search_index_command)
+    app.cli.add_command(reconcile_counters_command)
+    app.cli.add_command(rebuild_related_command)
+    app.cli.add_command(refresh_related_command)
+    app.cli.add_command(import_docx_command)
+    app.cli.add_command(rollup_command)
 
     return app
 
@@ -164,6 +199,93 @@ def seed_db():
     else:
         print("Le categorie esistono già.")
 
+@click.command(name="import-docx")
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option("--author", "author_email", help="Email dell'autore delle bozze.")
+@click.option("--category", "category_slug", help="Slug della categoria.")
+@click.option("--workers", type=int, default=None, help="Processi da usare.")
+@with_appcontext
+def import_docx_command(directory, author_email, category_slug, workers):
+    """Importa come bozze i documenti .docx di una cartella."""
+    if author_email:
+        author = User.query.filter_by(email=author_email).first()
+    else:
+        author = User.query.filter_by(role="admin").order_by(User.id).first()
+    if not author:
+        print("Autore non trovato: indicalo con --author o crea un utente admin.")
+        return
+
+    if category_slug:
+        category = Category.query.filter_by(slug=category_slug).first()
+    else:
+        category = Category.query.order_by(Category.id).first()
+    if not category:
+        print("Categoria non trovata: indicala con --category o usa 'flask seed-db'.")
+        return
+
+    upload_folder = os.path.join(current_app.root_path, "static", "uploads")
+    os.makedirs(upload_folder, exist_ok=True)
+
+    summary = import_documents(
+        directory, author.id, category.id, upload_folder, workers=workers
+    )
+    for name in summary["created"]:
+        print(f"[NUOVO] {name}")
+    for name in summary["updated"]:
+        print(f"[AGGIORNATO] {name}")
+    for name in summary["skipped"]:
+        print(f"[INVARIATO] {name}")
+    for name, error in summary["failed"]:
+        print(f"[ERRORE] {name}: {error}")
+    print(
+        f"Import completato: {len(summary['created'])} nuove bozze, "
+        f"{len(summary['updated'])} aggiornate, {len(summary['skipped'])} invariate."
+    )
+
+@click.command(name="rebuild-search-index")
+@with_appcontext
+def rebuild_search_index_command():
+    """Ricostruisce l'indice di ricerca full-text degli articoli."""
+    indexed = rebuild_search_index()
+    print(f"Indice di ricerca ricostruito: {indexed} articoli indicizzati.")
+
+@click.command(name="rebuild-related")
+@with_appcontext
+def rebuild_related_command():
+    """Ricalcola l'indice degli articoli correlati."""
+    indexed = related_index.rebuild()
+    print(f"Articoli correlati ricalcolati per {indexed} articoli.")
+
+@click.command(name="refresh-related")
+@with_appcontext
+def refresh_related_command():
+    """Aggiorna i correlati degli articoli in coda in related_refresh."""
+    refreshed = related_index.drain()
+    print(f"Articoli correlati aggiornati per {refreshed} articoli in coda.")
+
+@click.command(name="rollup")
+@click.option("--full", is_flag=True, help="Ricostruisce tutto lo storico.")
+@with_appcontext
+def rollup_command(full):
+    """Aggiorna i totali giornalieri usati dalla dashboard analytics."""
+    since_day = run_rollup(full=full)
+    if since_day is None:
+        print("Rollup ricostruito per tutto lo storico.")
+    else:
+        print(f"Rollup aggiornato dal {since_day.isoformat()}.")
+
+@click.command(name="reconcile-counters")
+@with_appcontext
+def reconcile_counters_command():
+    """Ricalcola contatori, faccette ed engagement degli articoli."""
+    view_counter.flush()
+    fixed = reconcile_counters()
+    print(f"Contatori riallineati: {fixed} articoli corretti.")
+    facets = reconcile_facets()
+    print(f"Faccette ricostruite: {facets} righe.")
+    engagement = reconcile_engagement()
+    print(f"Engagement ricostruito: {engagement} articoli.")
+
 app = create_app()
 
 if __name__ == "__main__":
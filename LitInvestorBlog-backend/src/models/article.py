@@ -3,10 +3,16 @@
 from datetime import datetime
 from src.extensions import db
 from flask import session
+from sqlalchemy.orm import joinedload, load_only
 from src.models.like import ArticleLike
 
 class Article(db.Model):
     __tablename__ = "article"
+    __table_args__ = (
+        db.Index("ix_article_published_created_at", "published", "created_at"),
+        db.Index("ix_article_category_id_created_at", "category_id", "created_at"),
+        db.Index("ix_article_author_id_created_at", "author_id", "created_at"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
@@ -16,7 +22,7 @@ class Article(db.Model):
     image_url = db.Column(db.String(500), nullable=True)
     author_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
     category_id = db.Column(db.Integer, db.ForeignKey("category.id"), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(
         db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
@@ -36,36 +42,150 @@ class Article(db.Model):
     def __repr__(self):
         return f"<Article {self.title}>"
 
-    def to_dict(self):
-        user_has_liked = False
-        if "user_id" in session:
-            user_has_liked = db.session.query(
-                ArticleLike.query.filter_by(
-                    user_id=session["user_id"], article_id=self.id
-                ).exists()
-            ).scalar()
-
-        return {
-            "id": self.id,
-            "title": self.title,
-            "slug": self.slug,
-            "content": self.content,
-            "excerpt": self.excerpt,
-            "image_url": self.image_url,
-            "author_id": self.author_id,
-            "author_name": (
-                self.author.to_dict().get("full_name") if self.author else None
+    @staticmethod
+    def list_options(fields=None):
+        """
+        Opzioni di caricamento per le liste.
+
+        Seleziona in SQL solo le colonne richieste da `fields` (il testo completo
+        resta differito) e carica autore e categoria nella stessa query.
+        """
+        fields = fields or ARTICLE_FIELDS
+        columns = {"id"}
+        for field in fields:
+            columns.add(ARTICLE_FIELD_COLUMNS[field])
+
+        options = [load_only(*(getattr(Article, column) for column in columns))]
+        if AUTHOR_FIELDS & set(fields):
+            options.append(joinedload(Article.author))
+        if CATEGORY_FIELDS & set(fields):
+            options.append(joinedload(Article.category))
+        return options
+
+    def to_dict(self, user_has_liked=None, fields=None):
+        fields = fields or ARTICLE_FIELDS
+
+        if user_has_liked is None and "user_has_liked" in fields:
+            user_has_liked = False
+            if "user_id" in session:
+                user_has_liked = db.session.query(
+                    ArticleLike.query.filter_by(
+                        user_id=session["user_id"], article_id=self.id
+                    ).exists()
+                ).scalar()
+
+        author = self.author if AUTHOR_FIELDS & set(fields) else None
+        category = self.category if CATEGORY_FIELDS & set(fields) else None
+
+        values = {
+            "id": lambda: self.id,
+            "title": lambda: self.title,
+            "slug": lambda: self.slug,
+            "content": lambda: self.content,
+            "excerpt": lambda: self.excerpt,
+            "image_url": lambda: self.image_url,
+            "author_id": lambda: self.author_id,
+            "author_name": lambda: author.full_name if author else None,
+            "category_id": lambda: self.category_id,
+            "category_name": lambda: category.name if category else None,
+            "category_color": lambda: category.color if category else None,
+            "created_at": lambda: (
+                self.created_at.isoformat() if self.created_at else None
+            ),
+            "updated_at": lambda: (
+                self.updated_at.isoformat() if self.updated_at else None
             ),
-            "category_id": self.category_id,
-            "category_name": self.category.name if self.category else None,
-            "category_color": self.category.color if self.category else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "published": self.published,
-            "likes_count": self.likes_count,
-            "views_count": self.views_count,
-            "show_author_contacts": self.show_author_contacts,
-            "author_email": self.author.email if self.author else None,
-            "author_linkedin_url": self.author.linkedin_url if self.author else None,
-            "user_has_liked": user_has_liked,
+            "published": lambda: self.published,
+            "likes_count": lambda: self.likes_count,
+            "views_count": lambda: self.views_count,
+            "show_author_contacts": lambda: self.show_author_contacts,
+            "author_email": lambda: author.email if author else None,
+            "author_linkedin_url": lambda: author.linkedin_url if author else None,
+            "user_has_liked": lambda: user_has_liked,
         }
+
+        return {field: values[field]() for field in fields}
+
+# Campo serializzato -> colonna di `article` necessaria per calcolarlo
+ARTICLE_FIELD_COLUMNS = {
+    "id": "id",
+    "title": "title",
+    "slug": "slug",
+    "content": "content",
+    "excerpt": "excerpt",
+    "image_url": "image_url",
+    "author_id": "author_id",
+    "author_name": "author_id",
+    "category_id": "category_id",
+    "category_name": "category_id",
+    "category_color": "category_id",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "published": "published",
+    "likes_count": "likes_count",
+    "views_count": "views_count",
+    "show_author_contacts": "show_author_contacts",
+    "author_email": "author_id",
+    "author_linkedin_url": "author_id",
+    "user_has_liked": "id",
+}
+
+ARTICLE_FIELDS = tuple(ARTICLE_FIELD_COLUMNS)
+
+# Proiezione usata dalle liste: tutto tranne il testo completo
+CARD_FIELDS = tuple(field for field in ARTICLE_FIELDS if field != "content")
+
+# Tutto ciò che non dipende dall'utente in sessione
+SHARED_FIELDS = tuple(field for field in ARTICLE_FIELDS if field != "user_has_liked")
+
+AUTHOR_FIELDS = {"author_name", "author_email", "author_linkedin_url"}
+CATEGORY_FIELDS = {"category_name", "category_color"}
+
+def resolve_fields(spec, default=CARD_FIELDS):
+    """
+    Interpreta il parametro `fields` delle richieste.
+
+    Accetta "card", "full" o un elenco di campi separati da virgola; solleva
+    ValueError se un campo non esiste.
+    """
+    if not spec:
+        return default
+    if spec == "card":
+        return CARD_FIELDS
+    if spec == "full":
+        return ARTICLE_FIELDS
+
+    fields = [field.strip() for field in spec.split(",") if field.strip()]
+    unknown = [field for field in fields if field not in ARTICLE_FIELD_COLUMNS]
+    if unknown:
+        raise ValueError(f"Campi non validi: {', '.join(unknown)}")
+    if "id" not in fields:
+        fields.insert(0, "id")
+    return tuple(fields)
+
+def liked_article_ids(article_ids):
+    """Restituisce gli id, tra quelli dati, a cui l'utente in sessione ha messo like"""
+    if "user_id" not in session or not article_ids:
+        return set()
+
+    rows = db.session.query(ArticleLike.article_id).filter(
+        ArticleLike.user_id == session["user_id"],
+        ArticleLike.article_id.in_(article_ids),
+    )
+    return {row.article_id for row in rows}
+
+def articles_to_dict(articles, fields=None):
+    """Serializza una pagina di articoli con un numero fisso di query.
+
+    I like dell'utente corrente vengono letti con un'unica query IN; autore,
+    categoria e colonne vanno caricati in anticipo con Article.list_options()
+    passando gli stessi `fields`.
+    """
+    fields = fields or ARTICLE_FIELDS
+    liked_ids = set()
+    if "user_has_liked" in fields:
+        liked_ids = liked_article_ids([article.id for article in articles])
+    return [
+        article.to_dict(user_has_liked=article.id in liked_ids, fields=fields)
+        for article in articles
+    ]
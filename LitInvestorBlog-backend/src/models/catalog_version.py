@@ -0,0 +1,16 @@
+# LitInvestorBlog-backend/src/models/catalog_version.py
+
+from src.extensions import db
+
+class CatalogVersion(db.Model):
+    """
+    Contatore di versione dei cataloghi tenuti in memoria dai worker.
+
+    Ogni commit che modifica il catalogo incrementa la sua riga; gli altri
+    processi confrontano la versione con una lettura per chiave primaria.
+    """
+
+    __tablename__ = "catalog_version"
+
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=1)
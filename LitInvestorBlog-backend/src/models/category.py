@@ -1,7 +1,7 @@
 # LitInvestorBlog-backend/src/models/category.py
 
 from datetime import datetime
-from sqlalchemy import func
+from sqlalchemy import case, func
 from src.extensions import db
 from src.models.article import Article
 
@@ -24,13 +24,8 @@ class Category(db.Model):
     def __repr__(self):
         return f"<Category {self.name}>"
 
-    def to_dict(self):
-        latest_article_date = (
-            db.session.query(func.max(Article.created_at))
-            .filter(Article.category_id == self.id)
-            .scalar()
-        )
-
+    def base_dict(self):
+        """Campi propri della categoria, senza le statistiche sugli articoli"""
         return {
             "id": self.id,
             "name": self.name,
@@ -40,10 +35,51 @@ class Category(db.Model):
             "image_url": self.image_url,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "created_by": self.created_by,
-            "article_count": len(self.articles),
-            "latest_article_date": (
-                latest_article_date.isoformat() if latest_article_date else None
-            ),
             "creator_name": self.creator.username if self.creator else None,
             "is_active": self.is_active,
         }
+
+    def to_dict(self, stats=None):
+        """
+        Serializza la categoria con le statistiche dei suoi articoli.
+
+        `stats` è la tupla (article_count, published_count,
+        latest_article_date) già calcolata da category_stats(); se manca
+        viene letta con una sola query aggregata.
+        """
+        if stats is None:
+            stats = category_stats(self.id)
+        return {**self.base_dict(), **category_stats_dict(stats)}
+
+def category_stats_columns():
+    """Aggregati sugli articoli di una categoria usati da Category.to_dict"""
+    return (
+        func.count(Article.id).label("article_count"),
+        func.sum(case((Article.published.is_(True), 1), else_=0)).label(
+            "published_count"
+        ),
+        func.max(Article.created_at).label("latest_article_date"),
+    )
+
+def category_stats(category_id=None):
+    """
+    Statistiche degli articoli con un solo GROUP BY sulla tabella article.
+
+    Con category_id restituisce la tupla di quella categoria, altrimenti un
+    dict category_id -> tupla per tutte le categorie che hanno articoli.
+    """
+    query = db.session.query(Article.category_id, *category_stats_columns())
+    if category_id is not None:
+        row = query.filter(Article.category_id == category_id).one()
+        return tuple(row[1:])
+    return {row[0]: tuple(row[1:]) for row in query.group_by(Article.category_id)}
+
+def category_stats_dict(stats):
+    article_count, published_count, latest_article_date = stats or (0, 0, None)
+    return {
+        "article_count": article_count or 0,
+        "published_article_count": published_count or 0,
+        "latest_article_date": (
+            latest_article_date.isoformat() if latest_article_date else None
+        ),
+    }
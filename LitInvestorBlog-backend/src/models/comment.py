@@ -1,14 +1,28 @@
 # LitInvestorBlog-backend/src/models/comment.py
 
 from datetime import datetime
+from sqlalchemy import String, func, select, type_coerce
+from sqlalchemy.orm import joinedload
 from src.extensions import db
+from src.utils.pagination import encode_cursor, keyset_paginate
+
+COMMENTS_PAGE_SIZE = 20
+# Risposte incluse per ogni discussione; le altre si leggono a pagine
+REPLIES_PER_ROOT = 20
 
 class Comment(db.Model):
+    __table_args__ = (
+        db.Index("ix_comment_article_id_created_at", "article_id", "created_at"),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     content = db.Column(db.Text, nullable=False)
     article_id = db.Column(db.Integer, db.ForeignKey("article.id"), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    parent_id = db.Column(
+        db.Integer, db.ForeignKey("comment.id"), nullable=True, index=True
+    )
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
     article = db.relationship("Article", back_populates="comments")
     user = db.relationship("User", back_populates="comments")
@@ -20,5 +34,129 @@ class Comment(db.Model):
             "article_id": self.article_id,
             "user_id": self.user_id,
             "user_name": self.user.username if self.user else None,
+            "parent_id": self.parent_id,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
+
+def build_comment_tree(comments):
+    """
+    Assembla una lista di commenti in un albero in O(n) usando parent_id.
+
+    L'ordine della lista viene mantenuto sia tra le radici sia tra le
+    risposte; i commenti il cui padre non è nella lista diventano radici.
+    """
+    nodes = {comment.id: {**comment.to_dict(), "replies": []} for comment in comments}
+
+    roots = []
+    for comment in comments:
+        parent = nodes.get(comment.parent_id)
+        if parent is not None:
+            parent["replies"].append(nodes[comment.id])
+        else:
+            roots.append(nodes[comment.id])
+    return roots
+
+def _thread_cte(root_ids):
+    """CTE ricorsiva (id, root_id) delle risposte, a qualunque profondità"""
+    thread = (
+        select(Comment.id, Comment.parent_id.label("root_id"))
+        .where(Comment.parent_id.in_(root_ids))
+        .cte("thread", recursive=True)
+    )
+    return thread.union_all(
+        select(Comment.id, thread.c.root_id).where(Comment.parent_id == thread.c.id)
+    )
+
+def load_comment_thread(
+    article_id,
+    cursor=None,
+    per_page=COMMENTS_PAGE_SIZE,
+    replies_per_root=REPLIES_PER_ROOT,
+):
+    """
+    Una pagina di discussioni di un articolo con le loro prime risposte.
+
+    Le radici sono paginate a cursore dalla più recente; le risposte a
+    qualunque profondità arrivano con una sola CTE ricorsiva, limitate alle
+    prime `replies_per_root` in ordine cronologico per ogni radice (un padre
+    precede sempre le sue risposte, quindi l'albero resta completo). Ogni
+    radice riporta `replies_count` e, se ne restano altre,
+    `replies_next_cursor` da passare a load_thread_replies(). Gli autori
+    vengono caricati nella stessa query dei commenti.
+
+    Returns:
+        La coppia (albero dei commenti, next_cursor).
+    """
+    roots_query = Comment.query.options(joinedload(Comment.user)).filter(
+        Comment.article_id == article_id, Comment.parent_id.is_(None)
+    )
+    page = keyset_paginate(
+        roots_query, Comment.created_at, Comment.id, cursor, per_page
+    )
+    roots = page["items"]
+    if not roots:
+        return [], page["next_cursor"]
+
+    thread = _thread_cte([root.id for root in roots])
+    ranked = (
+        select(
+            thread.c.id,
+            thread.c.root_id,
+            func.row_number()
+            .over(
+                partition_by=thread.c.root_id,
+                order_by=(Comment.created_at, Comment.id),
+            )
+            .label("position"),
+            func.count().over(partition_by=thread.c.root_id).label("total"),
+        )
+        .join(Comment, Comment.id == thread.c.id)
+        .subquery()
+    )
+    rows = (
+        Comment.query.options(joinedload(Comment.user))
+        .join(ranked, ranked.c.id == Comment.id)
+        .filter(ranked.c.position <= replies_per_root)
+        .add_columns(
+            ranked.c.root_id,
+            ranked.c.total,
+            type_coerce(Comment.created_at, String),
+        )
+        .order_by(Comment.created_at, Comment.id)
+        .all()
+    )
+
+    replies = []
+    totals = {}
+    last_reply = {}
+    for reply, root_id, total, created_at in rows:
+        replies.append(reply)
+        totals[root_id] = total
+        last_reply[root_id] = (created_at, reply.id)
+
+    tree = build_comment_tree(roots + replies)
+    for node in tree:
+        total = totals.get(node["id"], 0)
+        node["replies_count"] = total
+        node["replies_next_cursor"] = (
+            encode_cursor(*last_reply[node["id"]]) if total > replies_per_root else None
+        )
+    return tree, page["next_cursor"]
+
+def load_thread_replies(root_id, cursor=None, per_page=REPLIES_PER_ROOT):
+    """
+    Le risposte di una discussione oltre quelle incluse da
+    load_comment_thread(), in ordine cronologico e a cursore.
+
+    Le risposte sono piatte, con parent_id per agganciarle all'albero.
+
+    Returns:
+        Un dict con `items` e `next_cursor`, come keyset_paginate().
+    """
+    thread = _thread_cte([root_id])
+    query = Comment.query.options(joinedload(Comment.user)).filter(
+        Comment.id.in_(select(thread.c.id))
+    )
+    return keyset_paginate(
+        query, Comment.created_at, Comment.id, cursor, per_page, descending=False
+    )
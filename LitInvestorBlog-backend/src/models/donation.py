@@ -17,7 +17,7 @@ class Donation(db.Model):
     payment_method = Column(String(50), nullable=False)
     transaction_id = Column(String(255), nullable=True)
     status = Column(String(20), default="pending")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def to_dict(self):
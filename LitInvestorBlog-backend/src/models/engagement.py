@@ -0,0 +1,55 @@
+# LitInvestorBlog-backend/src/models/engagement.py
+
+from src.extensions import db
+from src.models.article import Article
+
+# Punteggio di popolarità: una condivisione o un commento valgono più di un
+# like, una lettura molto meno. La stessa espressione è nella migrazione
+# che crea la tabella.
+ENGAGEMENT_SCORE = "likes * 3 + comments * 5 + shares * 4 + views * 0.1"
+
+class ArticleEngagement(db.Model):
+    """
+    Like, commenti, condivisioni e letture di ogni articolo.
+
+    La tabella è mantenuta dai trigger SQLite su article, article_like,
+    comment e shares (vedi la migrazione che la crea); score è una colonna
+    generata e indicizzata, così la classifica degli articoli popolari è
+    una lettura dell'indice. reconcile_engagement() la ricostruisce da zero.
+    """
+
+    __tablename__ = "article_engagement"
+
+    article_id = db.Column(db.Integer, primary_key=True)
+    likes = db.Column(db.Integer, nullable=False, default=0)
+    comments = db.Column(db.Integer, nullable=False, default=0)
+    shares = db.Column(db.Integer, nullable=False, default=0)
+    views = db.Column(db.Integer, nullable=False, default=0)
+    score = db.Column(
+        db.Float, db.Computed(ENGAGEMENT_SCORE, persisted=True), index=True
+    )
+
+def popular_articles(limit, fields=None, since=None, published_only=True):
+    """
+    Gli articoli con lo score più alto, in una query.
+
+    `fields` sceglie le colonne come in Article.list_options(); `since`
+    limita la classifica agli articoli creati da quella data.
+
+    Returns:
+        Una lista di coppie (articolo, engagement).
+    """
+    query = (
+        db.session.query(Article, ArticleEngagement)
+        .options(*Article.list_options(fields))
+        .join(ArticleEngagement, ArticleEngagement.article_id == Article.id)
+    )
+    if published_only:
+        query = query.filter(Article.published.is_(True))
+    if since is not None:
+        query = query.filter(Article.created_at >= since)
+    return (
+        query.order_by(ArticleEngagement.score.desc(), Article.id.desc())
+        .limit(limit)
+        .all()
+    )
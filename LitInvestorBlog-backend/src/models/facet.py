@@ -0,0 +1,20 @@
+# LitInvestorBlog-backend/src/models/facet.py
+
+from src.extensions import db
+
+class ArticleFacet(db.Model):
+    """
+    Numero di articoli pubblicati per categoria, autore e mese.
+
+    La tabella è mantenuta dai trigger SQLite su article (vedi la
+    migrazione che la crea), quindi resta allineata anche con gli UPDATE in
+    blocco; reconcile_facets() la ricostruisce da zero.
+    """
+
+    __tablename__ = "article_facet"
+
+    category_id = db.Column(db.Integer, primary_key=True)
+    author_id = db.Column(db.Integer, primary_key=True)
+    year = db.Column(db.Integer, primary_key=True)
+    month = db.Column(db.Integer, primary_key=True)
+    published_count = db.Column(db.Integer, nullable=False, default=0)
@@ -10,6 +10,7 @@ class ArticleFavorite(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     __table_args__ = (
         db.UniqueConstraint("article_id", "user_id", name="unique_article_favorite"),
+        db.Index("ix_article_favorite_user_id_created_at", "user_id", "created_at"),
     )
 
     article = db.relationship("Article", back_populates="favorites")
@@ -0,0 +1,15 @@
+# LitInvestorBlog-backend/src/models/imported_document.py
+
+from datetime import datetime
+from src.extensions import db
+
+class ImportedDocument(db.Model):
+    """Documento Word già importato come bozza, riconosciuto dall'hash"""
+
+    __tablename__ = "imported_document"
+
+    id = db.Column(db.Integer, primary_key=True)
+    path = db.Column(db.String(500), unique=True, nullable=False)
+    content_hash = db.Column(db.String(64), nullable=False, index=True)
+    article_id = db.Column(db.Integer, db.ForeignKey("article.id"), nullable=True)
+    imported_at = db.Column(db.DateTime, default=datetime.utcnow)
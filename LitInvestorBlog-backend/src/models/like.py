@@ -7,9 +7,10 @@ class ArticleLike(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     article_id = db.Column(db.Integer, db.ForeignKey("article.id"), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     __table_args__ = (
         db.UniqueConstraint("article_id", "user_id", name="unique_article_like"),
+        db.Index("ix_article_like_user_id_created_at", "user_id", "created_at"),
     )
 
     article = db.relationship("Article", back_populates="likes")
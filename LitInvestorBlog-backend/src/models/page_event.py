@@ -0,0 +1,32 @@
+# LitInvestorBlog-backend/src/models/page_event.py
+
+from datetime import datetime
+from src.extensions import db
+
+# Tipi di evento accettati da POST /api/events
+EVENT_TYPES = ("view", "scroll", "read_time")
+
+class PageEvent(db.Model):
+    """
+    Evento di navigazione inviato dal browser (lettura, scroll, tempo).
+
+    La tabella è di sola aggiunta: le righe arrivano a blocchi dalla coda
+    in memoria di src/utils/event_queue.py e non vengono mai modificate.
+    article_id non è una chiave esterna, così lo storico resta anche dopo
+    l'eliminazione di un articolo.
+    """
+
+    __tablename__ = "page_event"
+    __table_args__ = (
+        db.Index("ix_page_event_article_id_occurred_at", "article_id", "occurred_at"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    type = db.Column(db.String(20), nullable=False)
+    path = db.Column(db.String(500), nullable=False)
+    article_id = db.Column(db.Integer, nullable=True)
+    user_id = db.Column(db.Integer, nullable=True)
+    # Percentuale di scroll (0-100) o secondi di lettura; None per le letture
+    value = db.Column(db.Float, nullable=True)
+    occurred_at = db.Column(db.DateTime, nullable=False, index=True)
+    received_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,50 @@
+# LitInvestorBlog-backend/src/models/related.py
+
+from datetime import datetime
+from src.extensions import db
+
+class ArticleRelated(db.Model):
+    """Vicini precalcolati di un articolo, ordinati per rank crescente"""
+
+    __tablename__ = "article_related"
+
+    article_id = db.Column(db.Integer, db.ForeignKey("article.id"), primary_key=True)
+    rank = db.Column(db.Integer, primary_key=True)
+    related_id = db.Column(
+        db.Integer, db.ForeignKey("article.id"), nullable=False, index=True
+    )
+    score = db.Column(db.Float, nullable=False)
+    computed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class ArticleTerm(db.Model):
+    """
+    Vettore TF-IDF di un articolo pubblicato, una riga per termine.
+
+    Il vettore è troncato ai termini più pesanti e normalizzato L2, così il
+    prodotto scalare tra due articoli è la loro similarità coseno; l'indice
+    su term permette di trovare gli articoli che condividono un termine.
+    """
+
+    __tablename__ = "article_term"
+
+    article_id = db.Column(db.Integer, db.ForeignKey("article.id"), primary_key=True)
+    term = db.Column(db.String(64), primary_key=True)
+    weight = db.Column(db.Float, nullable=False)
+
+    __table_args__ = (db.Index("ix_article_term_term", "term"),)
+
+class RelatedTerm(db.Model):
+    """Vocabolario con gli IDF calcolati all'ultima ricostruzione completa"""
+
+    __tablename__ = "related_term"
+
+    term = db.Column(db.String(64), primary_key=True)
+    idf = db.Column(db.Float, nullable=False)
+
+class RelatedRefresh(db.Model):
+    """Articoli in attesa di aggiornamento nell'indice dei correlati"""
+
+    __tablename__ = "related_refresh"
+
+    article_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    queued_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
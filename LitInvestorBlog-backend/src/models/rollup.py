@@ -0,0 +1,42 @@
+# LitInvestorBlog-backend/src/models/rollup.py
+
+from src.extensions import db
+
+class AnalyticsDaily(db.Model):
+    """
+    Totali giornalieri del sito usati dalla dashboard analytics.
+
+    Le righe sono calcolate da `flask rollup` (vedi src/utils/rollup.py);
+    i giorni successivi all'ultima esecuzione si leggono dalle tabelle
+    sorgente.
+    """
+
+    __tablename__ = "analytics_daily"
+
+    day = db.Column(db.Date, primary_key=True)
+    articles = db.Column(db.Integer, nullable=False, default=0)
+    users = db.Column(db.Integer, nullable=False, default=0)
+    comments = db.Column(db.Integer, nullable=False, default=0)
+    likes = db.Column(db.Integer, nullable=False, default=0)
+    shares = db.Column(db.Integer, nullable=False, default=0)
+    donations = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Float, nullable=False, default=0)
+
+class ArticleDaily(db.Model):
+    """Like, commenti e condivisioni di un articolo in un giorno"""
+
+    __tablename__ = "article_daily"
+
+    article_id = db.Column(db.Integer, primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    likes = db.Column(db.Integer, nullable=False, default=0)
+    comments = db.Column(db.Integer, nullable=False, default=0)
+    shares = db.Column(db.Integer, nullable=False, default=0)
+
+class RollupState(db.Model):
+    """Istante dell'ultima esecuzione di ciascun rollup"""
+
+    __tablename__ = "rollup_state"
+
+    name = db.Column(db.String(50), primary_key=True)
+    watermark = db.Column(db.DateTime, nullable=False)
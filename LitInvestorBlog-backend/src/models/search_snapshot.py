@@ -0,0 +1,19 @@
+# LitInvestorBlog-backend/src/models/search_snapshot.py
+
+from datetime import datetime
+from src.extensions import db
+
+class SearchDataSnapshot(db.Model):
+    """
+    Versioni recenti del payload di /api/search-data, condivise tra i worker.
+
+    `payload` è il JSON compresso con gzip così come viene servito; un
+    worker che riceve `since` per una versione costruita da un altro worker
+    la legge da qui per calcolare il delta.
+    """
+
+    __tablename__ = "search_data_snapshot"
+
+    version = db.Column(db.String(16), primary_key=True)
+    payload = db.Column(db.LargeBinary, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
@@ -1,19 +1,22 @@
 # LitInvestorBlog-backend/src/models/share.py
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from src.extensions import db
 
 class Share(db.Model):
     __tablename__ = "shares"
+    __table_args__ = (
+        Index("ix_shares_article_id_created_at", "article_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("user.id"), nullable=True)
     article_id = Column(Integer, ForeignKey("article.id"), nullable=False)
     platform = Column(String(50), nullable=False)
     ip_address = Column(String(45), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
     user = relationship("User", back_populates="shares")
     article = relationship("Article", back_populates="shares")
@@ -16,7 +16,7 @@ class User(db.Model):
     last_name = db.Column(db.String(50), nullable=True)
     bio = db.Column(db.Text, nullable=True)
     avatar_url = db.Column(db.String(500), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     is_active = db.Column(db.Boolean, default=True)
     newsletter_subscribed = db.Column(db.Boolean, default=False)
     linkedin_url = db.Column(db.String(255), nullable=True)
@@ -43,11 +43,13 @@ class User(db.Model):
     def is_admin(self):
         return self.role == "admin"
 
-    def to_dict(self):
-
-        full_name_str = self.username
+    @property
+    def full_name(self):
         if self.first_name and self.last_name:
-            full_name_str = f"{self.first_name} {self.last_name}"
+            return f"{self.first_name} {self.last_name}"
+        return self.username
+
+    def to_dict(self):
 
         return {
             "id": self.id,
@@ -63,6 +65,6 @@ class User(db.Model):
             "newsletter_subscribed": self.newsletter_subscribed,
 
             "linkedin_url": self.linkedin_url,
-            "full_name": full_name_str,
+            "full_name": self.full_name,
 
         }
@@ -1,25 +1,87 @@
 # LitInvestorBlog-backend/src/routes/analytics.py
 
-from flask import Blueprint, request, jsonify, make_response
-from sqlalchemy import desc, func, and_
+from flask import Blueprint, request, jsonify
+from sqlalchemy import desc, func, literal, select, union_all
 from src.models.like import ArticleLike
 from src.models.donation import Donation
 from src.models.category import Category
 from src.extensions import db
 from src.middleware.auth import admin_required
 import logging
-import csv
-import io
-from datetime import datetime, timedelta
-from sqlalchemy import or_
+from datetime import datetime
 from src.models.like import ArticleLike as Like
 from src.models.comment import Comment
 from src.models.share import Share
-from src.models.article import Article
+from src.models.article import Article, articles_to_dict
+from src.models.engagement import popular_articles
 from src.models.user import User
+from src.utils.exports import EXPORT_BATCH_SIZE, export_formats, export_response
+from src.utils.rollup import ARTICLE_METRICS, SITE_METRICS, article_daily, site_daily
+from src.utils.time_series import (
+    BUCKETS,
+    bucket_count,
+    first_day,
+    resolve_range,
+    series_totals,
+    zero_fill,
+)
 
 analytics_bp = Blueprint("analytics", __name__)
 
+# Punti massimi di una serie per articolo prima di passare a bucket più ampi
+MAX_SERIES_POINTS = 400
+
+# Righe delle classifiche della dashboard
+LEADERBOARD_SIZE = 20
+
+def active_user_leaderboard(since, limit=LEADERBOARD_SIZE):
+    """
+    Gli utenti con più articoli e commenti scritti da `since`.
+
+    Articoli e commenti sono contati per utente con due GROUP BY (sugli
+    indici di created_at), uniti e sommati; rank() dà la posizione con
+    gli ex aequo e il LIMIT è applicato dal database, così vengono caricati
+    solo gli utenti in classifica.
+
+    Returns:
+        Una lista di tuple (utente, articoli, commenti, posizione).
+    """
+    activity = union_all(
+        select(
+            Article.author_id.label("user_id"),
+            func.count().label("articles"),
+            literal(0).label("comments"),
+        )
+        .where(Article.created_at >= since)
+        .group_by(Article.author_id),
+        select(Comment.user_id, literal(0), func.count())
+        .where(Comment.created_at >= since)
+        .group_by(Comment.user_id),
+    ).subquery()
+
+    articles = func.sum(activity.c.articles)
+    comments = func.sum(activity.c.comments)
+    rank = func.rank().over(order_by=desc(articles + comments))
+    totals = (
+        select(
+            activity.c.user_id,
+            articles.label("articles"),
+            comments.label("comments"),
+            rank.label("rank"),
+        )
+        .group_by(activity.c.user_id)
+        .order_by(rank, activity.c.user_id)
+        .limit(limit)
+        .subquery()
+    )
+
+    return (
+        db.session.query(User, totals.c.articles, totals.c.comments, totals.c.rank)
+        .join(totals, totals.c.user_id == User.id)
+        .order_by(totals.c.rank, User.id)
+        .all()
+    )
+
 @analytics_bp.route("/api/analytics/dashboard", methods=["GET"])
 @admin_required
 def get_dashboard_analytics():
@@ -28,110 +90,51 @@ def get_dashboard_analytics():
         time_range = request.args.get("range", "30d")
 
         end_date = datetime.utcnow()
-        if time_range == "7d":
-            start_date = end_date - timedelta(days=7)
-            previous_start = start_date - timedelta(days=7)
-        elif time_range == "30d":
-            start_date = end_date - timedelta(days=30)
-            previous_start = start_date - timedelta(days=30)
-        elif time_range == "90d":
-            start_date = end_date - timedelta(days=90)
-            previous_start = start_date - timedelta(days=90)
-        elif time_range == "1y":
-            start_date = end_date - timedelta(days=365)
-            previous_start = start_date - timedelta(days=365)
+        start_date, previous_start = resolve_range(time_range, end_date)
+        # Per le classifiche il range "all" parte dall'inizio dello storico
+        since = start_date or datetime.min
+
+        end_day = end_date.date()
+        if start_date is not None:
+            start_day = start_date.date()
+            series = site_daily(previous_start.date())
         else:
-            start_date = end_date - timedelta(days=30)
-            previous_start = start_date - timedelta(days=30)
-
-        total_articles = Article.query.filter(Article.created_at >= start_date).count()
-        previous_articles = Article.query.filter(
-            and_(Article.created_at >= previous_start, Article.created_at < start_date)
-        ).count()
-
-        total_users = User.query.filter(User.created_at >= start_date).count()
-        previous_users = User.query.filter(
-            and_(User.created_at >= previous_start, User.created_at < start_date)
-        ).count()
-
-        total_comments = Comment.query.filter(Comment.created_at >= start_date).count()
-        previous_comments = Comment.query.filter(
-            and_(Comment.created_at >= previous_start, Comment.created_at < start_date)
-        ).count()
-
-        total_revenue = (
-            db.session.query(func.sum(Donation.amount))
-            .filter(Donation.status == "completed")
-            .filter(Donation.created_at >= start_date)
-            .scalar()
-            or 0
-        )
-        previous_revenue = (
-            db.session.query(func.sum(Donation.amount))
-            .filter(Donation.status == "completed")
-            .filter(
-                and_(
-                    Donation.created_at >= previous_start,
-                    Donation.created_at < start_date,
-                )
+            series = site_daily()
+            start_day = first_day(series, default=end_day)
+
+        metrics = len(SITE_METRICS)
+        current = dict(zip(SITE_METRICS, series_totals(series, metrics, start_day)))
+        previous = dict.fromkeys(SITE_METRICS, 0)
+        if start_date is not None:
+            previous.update(
+                zip(SITE_METRICS, series_totals(series, metrics, end_day=start_day))
             )
-            .scalar()
-            or 0
-        )
 
-        total_donations = Donation.query.filter(
-            Donation.status == "completed", Donation.created_at >= start_date
-        ).count()
-
-        articles_over_time = []
-        current_date = start_date
-        while current_date <= end_date:
-            next_date = current_date + timedelta(days=1)
-            count = Article.query.filter(
-                and_(Article.created_at >= current_date, Article.created_at < next_date)
-            ).count()
-            articles_over_time.append(
-                {"date": current_date.strftime("%Y-%m-%d"), "articles": count}
-            )
-            current_date = next_date
-
-        users_over_time = []
-        current_date = start_date
-        while current_date <= end_date:
-            next_date = current_date + timedelta(days=1)
-            count = User.query.filter(
-                and_(User.created_at >= current_date, User.created_at < next_date)
-            ).count()
-            users_over_time.append(
-                {"date": current_date.strftime("%Y-%m-%d"), "users": count}
-            )
-            current_date = next_date
-
-        revenue_over_time = []
-        current_date = start_date
-        while current_date <= end_date:
-            next_date = current_date + timedelta(days=1)
-            amount = (
-                db.session.query(func.sum(Donation.amount))
-                .filter(Donation.status == "completed")
-                .filter(
-                    and_(
-                        Donation.created_at >= current_date,
-                        Donation.created_at < next_date,
-                    )
-                )
-                .scalar()
-                or 0
-            )
-            revenue_over_time.append(
-                {"date": current_date.strftime("%Y-%m-%d"), "revenue": float(amount)}
-            )
-            current_date = next_date
+        points = zero_fill(start_day, end_day, series, SITE_METRICS)
+        articles_over_time = [
+            {"date": point["date"], "articles": point["articles"]} for point in points
+        ]
+        users_over_time = [
+            {"date": point["date"], "users": point["users"]} for point in points
+        ]
+        revenue_over_time = [
+            {"date": point["date"], "revenue": float(point["revenue"])}
+            for point in points
+        ]
+        engagement_data = [
+            {
+                "date": point["date"],
+                "likes": point["likes"],
+                "comments": point["comments"],
+                "shares": point["shares"],
+            }
+            for point in points
+        ]
 
         top_categories = (
             db.session.query(Category.name, func.count(Article.id).label("count"))
             .join(Article)
-            .filter(Article.created_at >= start_date)
+            .filter(Article.created_at >= since)
             .group_by(Category.name)
             .order_by(desc("count"))
             .limit(10)
@@ -141,85 +144,45 @@ def get_dashboard_analytics():
         top_authors = (
             db.session.query(User.username, func.count(Article.id).label("articles"))
             .join(Article)
-            .filter(Article.created_at >= start_date)
+            .filter(Article.created_at >= since)
             .group_by(User.username)
             .order_by(desc("articles"))
             .limit(10)
             .all()
         )
 
-        engagement_data = []
-        current_date = start_date
-        while current_date <= end_date:
-            next_date = current_date + timedelta(days=1)
-
-            likes = ArticleLike.query.filter(
-                and_(
-                    ArticleLike.created_at >= current_date,
-                    ArticleLike.created_at < next_date,
-                )
-            ).count()
-
-            comments = Comment.query.filter(
-                and_(Comment.created_at >= current_date, Comment.created_at < next_date)
-            ).count()
-
-            shares = Share.query.filter(
-                and_(Share.created_at >= current_date, Share.created_at < next_date)
-            ).count()
-
-            engagement_data.append(
-                {
-                    "date": current_date.strftime("%Y-%m-%d"),
-                    "likes": likes,
-                    "comments": comments,
-                    "shares": shares,
-                }
-            )
-            current_date = next_date
-
-        popular_articles = (
-            db.session.query(Article)
-            .outerjoin(Like)
-            .outerjoin(Comment)
-            .outerjoin(Share)
-            .filter(Article.created_at >= start_date)
-            .group_by(Article.id)
-            .order_by(
-                desc(
-                    func.count(Like.id) + func.count(Comment.id) + func.count(Share.id)
-                )
-            )
-            .limit(20)
-            .all()
+        popular = popular_articles(
+            LEADERBOARD_SIZE, since=since, published_only=False
         )
-
-        active_users = (
-            db.session.query(User)
-            .outerjoin(Article)
-            .outerjoin(Comment)
-            .filter(
-                or_(Article.created_at >= start_date, Comment.created_at >= start_date)
+        popular_data = [
+            {
+                **data,
+                "views": engagement.views,
+                "likes": engagement.likes,
+                "comments": engagement.comments,
+                "shares": engagement.shares,
+                "score": engagement.score,
+            }
+            for data, (_, engagement) in zip(
+                articles_to_dict([article for article, _ in popular]), popular
             )
-            .group_by(User.id)
-            .order_by(desc(func.count(Article.id) + func.count(Comment.id)))
-            .limit(20)
-            .all()
-        )
+        ]
+
+        active_users = active_user_leaderboard(since)
 
         return jsonify(
             {
                 "success": True,
                 "overview": {
-                    "totalArticles": total_articles,
-                    "previousArticles": previous_articles,
-                    "totalUsers": total_users,
-                    "previousUsers": previous_users,
-                    "totalComments": total_comments,
-                    "previousComments": previous_comments,
-                    "totalRevenue": float(total_revenue),
-                    "previousRevenue": float(previous_revenue),
-                    "totalDonations": total_donations,
+                    "totalArticles": current["articles"],
+                    "previousArticles": previous["articles"],
+                    "totalUsers": current["users"],
+                    "previousUsers": previous["users"],
+                    "totalComments": current["comments"],
+                    "previousComments": previous["comments"],
+                    "totalRevenue": float(current["revenue"]),
+                    "previousRevenue": float(previous["revenue"]),
+                    "totalDonations": current["donations"],
                     "maxDonation": float(
                         db.session.query(func.max(Donation.amount))
                         .filter_by(status="completed")
@@ -240,39 +203,15 @@ def get_dashboard_analytics():
                     ],
                     "engagement": engagement_data,
                 },
-                "articles": [
-                    {
-                        **article.to_dict(),
-                        "views": 0,
-                        "likes": len(article.likes) if hasattr(article, "likes") else 0,
-                        "comments": (
-                            len(article.comments) if hasattr(article, "comments") else 0
-                        ),
-                        "shares": (
-                            len(article.shares) if hasattr(article, "shares") else 0
-                        ),
-                    }
-                    for article in popular_articles
-                ],
+                "articles": popular_data,
                 "users": [
                     {
                         **user.to_dict(),
-                        "articles_count": (
-                            len(
-                                [a for a in user.articles if a.created_at >= start_date]
-                            )
-                            if hasattr(user, "articles")
-                            else 0
-                        ),
-                        "comments_count": (
-                            len(
-                                [c for c in user.comments if c.created_at >= start_date]
-                            )
-                            if hasattr(user, "comments")
-                            else 0
-                        ),
+                        "articles_count": articles_count,
+                        "comments_count": comments_count,
+                        "rank": rank,
                     }
-                    for user in active_users
+                    for user, articles_count, comments_count, rank in active_users
                 ],
             }
         )
@@ -284,48 +223,49 @@ def get_dashboard_analytics():
 @analytics_bp.route("/api/analytics/article/<int:article_id>", methods=["GET"])
 @admin_required
 def get_article_analytics(article_id):
-    """Ottieni analytics per un articolo specifico"""
+    """
+    Ottieni analytics per un articolo specifico.
+
+    Query string: range (default "all", dalla pubblicazione) e bucket
+    ("day", "week" o "month"). Se il range contiene più di
+    MAX_SERIES_POINTS bucket la granularità passa a quella successiva, così
+    la risposta ha dimensione limitata anche per gli articoli più vecchi.
+    """
     try:
+        time_range = request.args.get("range", "all")
+        bucket = request.args.get("bucket", "day")
+        if bucket not in BUCKETS:
+            return (
+                jsonify({"success": False, "message": "Parametro bucket non valido"}),
+                400,
+            )
+
         article = Article.query.get_or_404(article_id)
 
         likes_count = Like.query.filter_by(article_id=article_id).count()
         comments_count = Comment.query.filter_by(article_id=article_id).count()
         shares_count = Share.query.filter_by(article_id=article_id).count()
 
-        engagement_over_time = []
-        start_date = article.created_at
         end_date = datetime.utcnow()
-        current_date = start_date
-
-        while current_date <= end_date:
-            next_date = current_date + timedelta(days=1)
-
-            daily_likes = Like.query.filter(
-                Like.article_id == article_id,
-                and_(Like.created_at >= current_date, Like.created_at < next_date),
-            ).count()
-
-            daily_comments = Comment.query.filter(
-                Comment.article_id == article_id,
-                and_(
-                    Comment.created_at >= current_date, Comment.created_at < next_date
-                ),
-            ).count()
-
-            daily_shares = Share.query.filter(
-                Share.article_id == article_id,
-                and_(Share.created_at >= current_date, Share.created_at < next_date),
-            ).count()
-
-            engagement_over_time.append(
-                {
-                    "date": current_date.strftime("%Y-%m-%d"),
-                    "likes": daily_likes,
-                    "comments": daily_comments,
-                    "shares": daily_shares,
-                }
-            )
-            current_date = next_date
+        start_day = (article.created_at or end_date).date()
+        start_date, _ = resolve_range(time_range, end_date)
+        if start_date is not None:
+            start_day = max(start_day, start_date.date())
+        end_day = end_date.date()
+
+        while (
+            bucket != BUCKETS[-1]
+            and bucket_count(start_day, end_day, bucket) > MAX_SERIES_POINTS
+        ):
+            bucket = BUCKETS[BUCKETS.index(bucket) + 1]
+
+        engagement_over_time = zero_fill(
+            start_day,
+            end_day,
+            article_daily(article_id, start_day),
+            ARTICLE_METRICS,
+            bucket,
+        )
 
         shares_by_platform = (
             db.session.query(Share.platform, func.count(Share.id).label("count"))
@@ -345,6 +285,8 @@ def get_article_analytics(article_id):
                     "shares": shares_count,
                     "views": 0,
                 },
+                "range": time_range,
+                "bucket": bucket,
                 "engagement_over_time": engagement_over_time,
                 "shares_by_platform": [
                     {"platform": share.platform, "count": share.count}
@@ -357,130 +299,175 @@ def get_article_analytics(article_id):
         logging.error(f"Errore nel caricamento analytics articolo: {e}")
         return jsonify({"success": False, "message": "Errore interno del server"}), 500
 
+# Colonne degli export: (nome, etichetta CSV, tipo)
+ARTICLE_EXPORT_COLUMNS = (
+    ("id", "ID", "int"),
+    ("title", "Titolo", "str"),
+    ("author", "Autore", "str"),
+    ("category", "Categoria", "str"),
+    ("published", "Pubblicato", "bool"),
+    ("created_at", "Data Creazione", "datetime"),
+    ("likes", "Likes", "int"),
+    ("comments", "Commenti", "int"),
+    ("shares", "Condivisioni", "int"),
+)
+
+USER_EXPORT_COLUMNS = (
+    ("id", "ID", "int"),
+    ("username", "Username", "str"),
+    ("email", "Email", "str"),
+    ("role", "Ruolo", "str"),
+    ("created_at", "Data Registrazione", "datetime"),
+    ("articles", "Articoli Pubblicati", "int"),
+    ("comments", "Commenti", "int"),
+    ("likes", "Likes Dati", "int"),
+)
+
+# Versione ridotta delle colonne di /api/donations/export
+DONATION_REPORT_EXPORT_COLUMNS = (
+    ("id", "ID", "int"),
+    ("donor_name", "Nome Donatore", "str"),
+    ("donor_email", "Email", "str"),
+    ("amount", "Importo", "float"),
+    ("message", "Messaggio", "str"),
+    ("anonymous", "Anonimo", "bool"),
+    ("status", "Stato", "str"),
+    ("created_at", "Data", "datetime"),
+)
+
+OVERVIEW_EXPORT_COLUMNS = (
+    ("date", "Data", "str"),
+    ("articles", "Articoli", "int"),
+    ("users", "Utenti", "int"),
+    ("comments", "Commenti", "int"),
+    ("likes", "Likes", "int"),
+    ("shares", "Condivisioni", "int"),
+    ("donations", "Donazioni", "int"),
+    ("revenue", "Entrate", "float"),
+)
+
+def _count_by(column):
+    """Subquery con il numero di righe per valore di `column`"""
+    return (
+        db.session.query(column.label("key"), func.count().label("total"))
+        .group_by(column)
+        .subquery()
+    )
+
+def _article_export_rows(start_date):
+    likes = _count_by(Like.article_id)
+    comments = _count_by(Comment.article_id)
+    shares = _count_by(Share.article_id)
+    query = (
+        db.session.query(
+            Article.id,
+            Article.title,
+            User.username,
+            Category.name,
+            Article.published,
+            Article.created_at,
+            func.coalesce(likes.c.total, 0),
+            func.coalesce(comments.c.total, 0),
+            func.coalesce(shares.c.total, 0),
+        )
+        .outerjoin(User, Article.author_id == User.id)
+        .outerjoin(Category, Article.category_id == Category.id)
+        .outerjoin(likes, likes.c.key == Article.id)
+        .outerjoin(comments, comments.c.key == Article.id)
+        .outerjoin(shares, shares.c.key == Article.id)
+        .order_by(Article.id)
+    )
+    if start_date is not None:
+        query = query.filter(Article.created_at >= start_date)
+    return query.yield_per(EXPORT_BATCH_SIZE)
+
+def _user_export_rows(start_date):
+    articles = _count_by(Article.author_id)
+    comments = _count_by(Comment.user_id)
+    likes = _count_by(Like.user_id)
+    query = (
+        db.session.query(
+            User.id,
+            User.username,
+            User.email,
+            User.role,
+            User.created_at,
+            func.coalesce(articles.c.total, 0),
+            func.coalesce(comments.c.total, 0),
+            func.coalesce(likes.c.total, 0),
+        )
+        .outerjoin(articles, articles.c.key == User.id)
+        .outerjoin(comments, comments.c.key == User.id)
+        .outerjoin(likes, likes.c.key == User.id)
+        .order_by(User.id)
+    )
+    if start_date is not None:
+        query = query.filter(User.created_at >= start_date)
+    return query.yield_per(EXPORT_BATCH_SIZE)
+
+def _donation_export_rows(start_date):
+    query = db.session.query(
+        Donation.id,
+        Donation.donor_name,
+        Donation.donor_email,
+        Donation.amount,
+        Donation.message,
+        Donation.anonymous,
+        Donation.status,
+        Donation.created_at,
+    ).order_by(desc(Donation.created_at))
+    if start_date is not None:
+        query = query.filter(Donation.created_at >= start_date)
+    return query.yield_per(EXPORT_BATCH_SIZE)
+
+def _overview_export_rows(start_date):
+    end_day = datetime.utcnow().date()
+    if start_date is not None:
+        start_day = start_date.date()
+        series = site_daily(start_day)
+    else:
+        series = site_daily()
+        start_day = first_day(series, default=end_day)
+
+    for point in zero_fill(start_day, end_day, series, SITE_METRICS):
+        yield [point["date"], *(point[name] for name in SITE_METRICS)]
+
+# Tipo di export -> (colonne, righe dato l'inizio del range)
+EXPORTS = {
+    "overview": (OVERVIEW_EXPORT_COLUMNS, _overview_export_rows),
+    "articles": (ARTICLE_EXPORT_COLUMNS, _article_export_rows),
+    "users": (USER_EXPORT_COLUMNS, _user_export_rows),
+    "donations": (DONATION_REPORT_EXPORT_COLUMNS, _donation_export_rows),
+}
+
 @analytics_bp.route("/api/analytics/export", methods=["GET"])
 @admin_required
 def export_analytics():
-    """Esporta dati analytics"""
+    """
+    Esporta dati analytics in CSV, NDJSON compresso con gzip o Parquet.
+
+    Il file viene inviato a blocchi mentre le righe sono lette dal database,
+    con i conteggi calcolati da subquery raggruppate: memoria e numero di
+    query non crescono con le righe esportate. `range` limita le righe a
+    quelle create nel periodo; i conteggi restano quelli complessivi.
+    """
     try:
         export_type = request.args.get("type", "overview")
         format_type = request.args.get("format", "csv")
-        request.args.get("range", "30d")
+        time_range = request.args.get("range", "30d")
 
-        if format_type != "csv":
+        if format_type not in export_formats():
+            return jsonify({"success": False, "message": "Formato non supportato"}), 400
+        if export_type not in EXPORTS:
             return (
-                jsonify({"success": False, "message": "Solo formato CSV supportato"}),
+                jsonify({"success": False, "message": "Tipo di export non valido"}),
                 400,
             )
 
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        if export_type == "articles":
-            writer.writerow(
-                [
-                    "ID",
-                    "Titolo",
-                    "Autore",
-                    "Categoria",
-                    "Pubblicato",
-                    "Data Creazione",
-                    "Likes",
-                    "Commenti",
-                    "Condivisioni",
-                ]
-            )
-
-            articles = Article.query.all()
-            for article in articles:
-                likes_count = Like.query.filter_by(article_id=article.id).count()
-                comments_count = Comment.query.filter_by(article_id=article.id).count()
-                shares_count = Share.query.filter_by(article_id=article.id).count()
-
-                writer.writerow(
-                    [
-                        article.id,
-                        article.title,
-                        article.author.username if article.author else "",
-                        article.category.name if article.category else "",
-                        "Sì" if article.published else "No",
-                        article.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-                        likes_count,
-                        comments_count,
-                        shares_count,
-                    ]
-                )
-
-        elif export_type == "users":
-            writer.writerow(
-                [
-                    "ID",
-                    "Username",
-                    "Email",
-                    "Ruolo",
-                    "Data Registrazione",
-                    "Articoli Pubblicati",
-                    "Commenti",
-                    "Likes Dati",
-                ]
-            )
-
-            users = User.query.all()
-            for user in users:
-                articles_count = Article.query.filter_by(author_id=user.id).count()
-                comments_count = Comment.query.filter_by(user_id=user.id).count()
-                likes_count = Like.query.filter_by(user_id=user.id).count()
-
-                writer.writerow(
-                    [
-                        user.id,
-                        user.username,
-                        user.email,
-                        user.role,
-                        user.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-                        articles_count,
-                        comments_count,
-                        likes_count,
-                    ]
-                )
-
-        elif export_type == "donations":
-            writer.writerow(
-                [
-                    "ID",
-                    "Nome Donatore",
-                    "Email",
-                    "Importo",
-                    "Messaggio",
-                    "Anonimo",
-                    "Stato",
-                    "Data",
-                ]
-            )
-
-            donations = Donation.query.order_by(desc(Donation.created_at)).all()
-            for donation in donations:
-                writer.writerow(
-                    [
-                        donation.id,
-                        donation.donor_name or "",
-                        donation.donor_email or "",
-                        donation.amount,
-                        donation.message or "",
-                        "Sì" if donation.anonymous else "No",
-                        donation.status,
-                        donation.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-                    ]
-                )
-
-        output.seek(0)
-
-        response = make_response(output.getvalue())
-        response.headers["Content-Type"] = "text/csv"
-        response.headers["Content-Disposition"] = (
-            f"attachment; filename=analytics_{export_type}_{datetime.now().strftime('%Y%m%d')}.csv"
-        )
-
-        return response
+        start_date, _ = resolve_range(time_range)
+        columns, rows = EXPORTS[export_type]
+        filename = f"analytics_{export_type}_{datetime.now().strftime('%Y%m%d')}"
+        return export_response(columns, rows(start_date), format_type, filename)
 
     except Exception as e:
         logging.error(f"Errore nell'export analytics: {e}")
@@ -1,30 +1,68 @@
 # LitInvestorBlog-backend/src/routes/articles.py
 
-from flask import Blueprint, request, jsonify, session
-from sqlalchemy import or_, extract
+from flask import Blueprint, request, jsonify, session, make_response
+from sqlalchemy import delete, false, func, literal, select, update, String
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from datetime import datetime
-import re
-from sqlalchemy.exc import IntegrityError
 
-from src.models.article import Article
+from src.models.article import (
+    Article,
+    SHARED_FIELDS,
+    articles_to_dict,
+    liked_article_ids,
+    resolve_fields,
+)
 from src.models.like import ArticleLike
 from src.models.favorite import ArticleFavorite
-from src.models.comment import Comment
+from src.models.comment import Comment, load_comment_thread
+from src.models.engagement import popular_articles
+from src.models.imported_document import ImportedDocument
 from src.models.category import Category
+from src.models.related import ArticleRelated, ArticleTerm
+from src.models.rollup import ArticleDaily
+from src.models.share import Share
 from src.models.user import User
 
 from src.extensions import db
 from src.routes.auth import login_required, author_required
+from src.utils.article_cache import article_cache, touch_article
+from src.utils.category_catalog import category_catalog
+from src.utils.http_cache import (
+    articles_probe,
+    conditional,
+    make_etag,
+    not_modified,
+    related_versions,
+    with_validators,
+)
+from src.utils.pagination import cursor_args, keyset_paginate
+from src.utils.related_articles import TOP_K, queue_related_refresh
+from src.utils.search_index import build_match_query, search_articles
+from src.utils.slugs import create_slug
+from src.utils.view_counter import view_counter
 
 articles_bp = Blueprint("articles", __name__)
 
-def create_slug(title):
-    """Crea uno slug dall'titolo dell'articolo"""
-    slug = re.sub(r"[^\w\s-]", "", title.lower())
-    slug = re.sub(r"[-\s]+", "-", slug)
-    return slug.strip("-")
+def archive_range(year, month=None):
+    """
+    Intervallo semiaperto [inizio, fine) per i filtri d'archivio.
+
+    Gli estremi sono date ISO confrontate come testo con created_at, così il
+    filtro può usare gli indici su created_at invece di estrarre anno e mese
+    da ogni riga.
+    """
+    if month:
+        start = f"{year:04d}-{month:02d}-01"
+        end = (
+            f"{year + 1:04d}-01-01" if month == 12 else f"{year:04d}-{month + 1:02d}-01"
+        )
+    else:
+        start = f"{year:04d}-01-01"
+        end = f"{year + 1:04d}-01-01"
+    return literal(start, String), literal(end, String)
 
 @articles_bp.route("/", methods=["GET"])
+@conditional(articles_probe)
 def get_articles():
     try:
 
@@ -38,33 +76,67 @@ def get_articles():
         month = request.args.get("month", type=int)
         exclude_id = request.args.get("exclude_id", type=int)
         search_query = request.args.get("q", type=str)
+        fields = resolve_fields(request.args.get("fields"))
 
-        query = Article.query.filter(Article.published.is_(True))
+        query = Article.query.options(*Article.list_options(fields)).filter(
+            Article.published.is_(True)
+        )
 
         if exclude_id:
             query = query.filter(Article.id != exclude_id)
 
-        if search_query:
+        if category_slug:
+            category_id = category_catalog.slug_to_id(category_slug)
+            if category_id is None:
+                query = query.filter(false())
+            else:
+                query = query.filter(Article.category_id == category_id)
+        if author_id:
+            query = query.filter(Article.author_id == author_id)
+        if year:
+            start, end = archive_range(year, month)
+            query = query.filter(Article.created_at >= start, Article.created_at < end)
+
+        match_query = build_match_query(search_query) if search_query else None
+        if search_query and not match_query:
+            query = query.filter(false())
+        elif match_query:
 
             print(f"FILTRO DI RICERCA ATTIVATO CON TERMINE: {search_query}")
 
-            search_term = f"%{search_query}%"
-            query = query.filter(
-                or_(
-                    Article.title.ilike(search_term),
-                    Article.content.ilike(search_term),
-                    Article.excerpt.ilike(search_term),
-                )
+            results = search_articles(query, match_query).paginate(
+                page=page, per_page=per_page, error_out=False
             )
+            articles = articles_to_dict([row[0] for row in results.items], fields)
+            for article_data, row in zip(articles, results.items):
+                article_data["search_snippet"] = row.search_snippet
 
-        if category_slug:
-            query = query.join(Category).filter(Category.slug == category_slug)
-        if author_id:
-            query = query.filter(Article.author_id == author_id)
-        if year:
-            query = query.filter(extract("year", Article.created_at) == year)
-            if month:
-                query = query.filter(extract("month", Article.created_at) == month)
+            return (
+                jsonify(
+                    {
+                        "articles": articles,
+                        "total_articles": results.total,
+                        "total_pages": results.pages,
+                        "current_page": page,
+                    }
+                ),
+                200,
+            )
+
+        cursor_mode = cursor_args()
+        if cursor_mode:
+            cursor, include_total = cursor_mode
+            page_data = keyset_paginate(
+                query, Article.created_at, Article.id, cursor, per_page, include_total
+            )
+            response = {
+                "articles": articles_to_dict(page_data["items"], fields),
+                "next_cursor": page_data["next_cursor"],
+                "per_page": per_page,
+            }
+            if include_total:
+                response["total_articles"] = page_data["total"]
+            return jsonify(response), 200
 
         paginated_articles = query.order_by(Article.created_at.desc()).paginate(
             page=page, per_page=per_page, error_out=False
@@ -73,9 +145,7 @@ def get_articles():
         return (
             jsonify(
                 {
-                    "articles": [
-                        article.to_dict() for article in paginated_articles.items
-                    ],
+                    "articles": articles_to_dict(paginated_articles.items, fields),
                     "total_articles": paginated_articles.total,
                     "total_pages": paginated_articles.pages,
                     "current_page": page,
@@ -84,69 +154,194 @@ def get_articles():
             200,
         )
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         print(f"Errore in get_articles: {e}")
         return jsonify({"error": "An internal error occurred"}), 500
 
+def load_article_detail(article_id=None, slug=None, signature=None):
+    """
+    Parte anonima della pagina di dettaglio: articolo e prima pagina dei
+    commenti, già organizzati in discussioni.
+
+    Viene servita dalla cache quando possibile; `signature` è la firma di
+    article_detail_probe() e una voce costruita con una firma diversa (per
+    esempio prima di un commit su un altro worker) viene ricostruita. I
+    dati legati all'utente (user_has_liked) e le visualizzazioni ancora nel
+    buffer vanno aggiunti dopo con article_detail_response(). Restituisce
+    None se l'articolo non esiste.
+    """
+    payload = article_cache.get(article_id=article_id, slug=slug, signature=signature)
+    if payload is not None:
+        return payload
+
+    query = Article.query.options(*Article.list_options(SHARED_FIELDS))
+    if article_id is not None:
+        article = query.filter(Article.id == article_id).first()
+    else:
+        article = query.filter(Article.slug == slug).first()
+    if article is None:
+        return None
+
+    comments, comments_next_cursor = load_comment_thread(article.id)
+
+    payload = article.to_dict(fields=SHARED_FIELDS)
+    payload["comments"] = comments
+    payload["comments_next_cursor"] = comments_next_cursor
+    article_cache.set(article.id, article.slug, payload, signature)
+    return payload
+
+def article_detail_probe(article_id=None, slug=None):
+    """
+    Validatori economici per la pagina di dettaglio.
+
+    Legge solo la riga dell'articolo senza il testo e il riepilogo dei
+    commenti dall'indice (article_id, created_at); la firma include le
+    versioni di categorie e utenti, i cui nomi finiscono nel payload.
+    Restituisce (id, firma, last_modified) oppure None se l'articolo non
+    esiste.
+    """
+    query = db.session.query(
+        Article.id, Article.updated_at, Article.likes_count, Article.views_count
+    )
+    if article_id is not None:
+        row = query.filter(Article.id == article_id).first()
+    else:
+        row = query.filter(Article.slug == slug).first()
+    if row is None:
+        return None
+
+    comments_count, last_comment_at = (
+        db.session.query(func.count(Comment.id), func.max(Comment.created_at))
+        .filter(Comment.article_id == row.id)
+        .one()
+    )
+    last_modified = max(filter(None, (row.updated_at, last_comment_at)), default=None)
+    signature = (tuple(row), comments_count, last_comment_at, related_versions())
+    return row.id, signature, last_modified
+
+def article_detail_response(payload):
+    article_data = dict(payload)
+    article_data["views_count"] = (payload["views_count"] or 0) + view_counter.pending(
+        payload["id"]
+    )
+    article_data["user_has_liked"] = payload["id"] in liked_article_ids([payload["id"]])
+    return jsonify({"article": article_data}), 200
+
+def article_detail(article_id=None, slug=None, count_view=True):
+    """Risposta di dettaglio con supporto a ETag/Last-Modified e 304"""
+    probe = article_detail_probe(article_id=article_id, slug=slug)
+    if probe is None:
+        return jsonify({"error": "Articolo non trovato"}), 404
+    probe_id, signature, last_modified = probe
+
+    if count_view:
+        view_counter.record(probe_id)
+
+    etag = make_etag(signature, session.get("user_id"))
+    cached = not_modified(etag, last_modified)
+    if cached is not None:
+        return cached
+
+    payload = load_article_detail(article_id=probe_id, signature=signature)
+    if payload is None:
+        return jsonify({"error": "Articolo non trovato"}), 404
+
+    response = make_response(article_detail_response(payload))
+    return with_validators(response, etag, last_modified)
+
 @articles_bp.route("/<int:article_id>", methods=["GET"])
 def get_article(article_id):
     try:
-        article = Article.query.get_or_404(article_id)
-
-        article.views_count += 1
-        db.session.commit()
-
-        comments = (
-            Comment.query.filter_by(article_id=article_id)
-            .order_by(Comment.created_at.desc())
-            .all()
-        )
-
-        article_data = article.to_dict()
-        article_data["comments"] = [comment.to_dict() for comment in comments]
-
-        return jsonify({"article": article_data}), 200
-
+        return article_detail(article_id=article_id)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @articles_bp.route("/<string:slug>", methods=["GET"])
 def get_article_by_slug(slug):
     try:
-        article = Article.query.filter_by(slug=slug).first_or_404()
+        return article_detail(slug=slug)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
 
-        article.views_count += 1
-        db.session.commit()
+@articles_bp.route("/id/<int:article_id>", methods=["GET"])
+def get_article_by_id(article_id):
+    try:
+        return article_detail(article_id=article_id, count_view=False)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
 
-        comments = (
-            Comment.query.filter_by(article_id=article.id)
-            .order_by(Comment.created_at.desc())
+@articles_bp.route("/<int:article_id>/related", methods=["GET"])
+def get_related_articles(article_id):
+    """
+    Articoli correlati letti dall'indice precalcolato article_related.
+
+    Se l'articolo non è ancora nell'indice si ripiega sugli articoli più
+    recenti della stessa categoria.
+    """
+    try:
+        limit = max(1, min(request.args.get("limit", 4, type=int), TOP_K))
+        fields = resolve_fields(request.args.get("fields"))
+
+        articles = (
+            Article.query.options(*Article.list_options(fields))
+            .join(ArticleRelated, ArticleRelated.related_id == Article.id)
+            .filter(
+                ArticleRelated.article_id == article_id,
+                Article.published.is_(True),
+            )
+            .order_by(ArticleRelated.rank)
+            .limit(limit)
             .all()
         )
 
-        article_data = article.to_dict()
-        article_data["comments"] = [comment.to_dict() for comment in comments]
+        if not articles:
+            category_id = db.session.scalar(
+                select(Article.category_id).where(Article.id == article_id)
+            )
+            if category_id is None:
+                return jsonify({"error": "Articolo non trovato"}), 404
+            articles = (
+                Article.query.options(*Article.list_options(fields))
+                .filter(
+                    Article.category_id == category_id,
+                    Article.id != article_id,
+                    Article.published.is_(True),
+                )
+                .order_by(Article.created_at.desc())
+                .limit(limit)
+                .all()
+            )
 
-        return jsonify({"article": article_data}), 200
+        return jsonify({"articles": articles_to_dict(articles, fields=fields)}), 200
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
-@articles_bp.route("/id/<int:article_id>", methods=["GET"])
-def get_article_by_id(article_id):
-    try:
-        article = Article.query.get_or_404(article_id)
+# Massimo di articoli restituiti da /popular
+POPULAR_MAX = 50
 
-        article_data = article.to_dict()
+@articles_bp.route("/popular", methods=["GET"])
+def get_popular_articles():
+    """
+    Articoli pubblicati ordinati per score di engagement.
 
-        comments = (
-            Comment.query.filter_by(article_id=article_id)
-            .order_by(Comment.created_at.desc())
-            .all()
-        )
-        article_data["comments"] = [comment.to_dict() for comment in comments]
+    La classifica è letta dall'indice su article_engagement.score, tenuto
+    aggiornato dai trigger: il costo non dipende dal numero di like,
+    commenti e condivisioni.
+    """
+    try:
+        limit = max(1, min(request.args.get("limit", 10, type=int), POPULAR_MAX))
+        fields = resolve_fields(request.args.get("fields"))
 
-        return jsonify({"article": article_data}), 200
+        articles = [article for article, _ in popular_articles(limit, fields=fields)]
+        return jsonify({"articles": articles_to_dict(articles, fields=fields)}), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -188,6 +383,9 @@ def create_article():
         )
 
         db.session.add(article)
+        if article.published:
+            db.session.flush()
+            queue_related_refresh([article.id])
         db.session.commit()
 
         return (
@@ -205,6 +403,9 @@ def create_article():
         print(f"Errore in create_article: {e}")
         return jsonify({"error": str(e)}), 500
 
+# Campi che entrano nel punteggio degli articoli correlati
+RELATED_FIELDS = {"title", "content", "excerpt", "category_id", "published"}
+
 @articles_bp.route("/<int:article_id>", methods=["PUT"])
 @author_required
 def update_article(article_id):
@@ -219,6 +420,7 @@ def update_article(article_id):
             )
 
         data = request.get_json()
+        was_published = article.published
 
         if "title" in data:
             article.title = data["title"]
@@ -240,6 +442,9 @@ def update_article(article_id):
 
         article.updated_at = datetime.utcnow()
 
+        # Le bozze non sono nell'indice dei correlati
+        if (was_published or article.published) and RELATED_FIELDS & set(data):
+            queue_related_refresh([article.id])
         db.session.commit()
 
         return (
@@ -256,6 +461,163 @@ def update_article(article_id):
         db.session.rollback()
         return jsonify({"error": str(e)}), 500
 
+BULK_OPERATIONS = {
+    "publish": {"published": True},
+    "unpublish": {"published": False},
+    "feature": {"featured": True},
+    "unfeature": {"featured": False},
+    "set_category": {},
+    "delete": None,
+}
+
+# Operazioni che cambiano l'insieme o le categorie degli articoli pubblicati
+RELATED_OPERATIONS = {"publish", "unpublish", "set_category", "delete"}
+
+BULK_MAX_IDS = 1000
+
+def delete_articles(article_ids):
+    """
+    Elimina gli articoli indicati e le righe che vi fanno riferimento.
+
+    Usata sia dall'eliminazione singola sia da quella in blocco. Gli
+    articoli pubblicati vengono accodati per l'indice dei correlati, che
+    ricalcola chi li aveva tra i vicini; i documenti importati restano
+    registrati ma senza articolo.
+    """
+    article_ids = list(article_ids)
+    queue_related_refresh(
+        db.session.scalars(
+            select(Article.id).where(
+                Article.id.in_(article_ids), Article.published.is_(True)
+            )
+        )
+    )
+    for model in (
+        ArticleLike,
+        ArticleFavorite,
+        Comment,
+        Share,
+        ArticleDaily,
+        ArticleRelated,
+        ArticleTerm,
+    ):
+        db.session.execute(
+            delete(model)
+            .where(model.article_id.in_(article_ids))
+            .execution_options(synchronize_session=False)
+        )
+    db.session.execute(
+        update(ImportedDocument)
+        .where(ImportedDocument.article_id.in_(article_ids))
+        .values(article_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.execute(
+        delete(Article)
+        .where(Article.id.in_(article_ids))
+        .execution_options(synchronize_session=False)
+    )
+    for article_id in article_ids:
+        touch_article(article_id)
+
+@articles_bp.route("/bulk", methods=["PATCH"])
+@author_required
+def bulk_update_articles():
+    """
+    Applica un'operazione a molti articoli con una sola istruzione SQL.
+
+    Body: {"ids": [...], "operation": "...", "category_id": ...}; category_id
+    serve solo per set_category. Gli articoli inesistenti o di altri autori
+    (per chi non è admin) vengono ignorati e restituiti in `skipped`. Gli
+    articoli pubblicati toccati vengono accodati per l'indice dei correlati
+    invece di ricalcolarlo nella richiesta.
+    """
+    try:
+        data = request.get_json() or {}
+        operation = data.get("operation")
+        ids = data.get("ids")
+
+        if operation not in BULK_OPERATIONS:
+            return (
+                jsonify(
+                    {
+                        "error": "Operazione non valida",
+                        "allowed": sorted(BULK_OPERATIONS),
+                    }
+                ),
+                400,
+            )
+        if (
+            not isinstance(ids, list)
+            or not ids
+            or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids)
+        ):
+            return jsonify({"error": "ids deve essere una lista di interi"}), 400
+        if len(ids) > BULK_MAX_IDS:
+            return (
+                jsonify({"error": f"Al massimo {BULK_MAX_IDS} articoli per richiesta"}),
+                400,
+            )
+
+        values = dict(BULK_OPERATIONS[operation] or {})
+        if operation == "set_category":
+            category_id = data.get("category_id")
+            if not isinstance(category_id, int) or isinstance(category_id, bool):
+                return jsonify({"error": "category_id deve essere un intero"}), 400
+            if db.session.get(Category, category_id) is None:
+                return jsonify({"error": "Categoria non trovata"}), 404
+            values["category_id"] = category_id
+
+        requested = set(ids)
+        condition = Article.id.in_(requested)
+        user = db.session.get(User, session["user_id"])
+        if not user.is_admin():
+            condition &= Article.author_id == user.id
+
+        if operation == "delete":
+            affected = set(db.session.scalars(select(Article.id).where(condition)))
+            if affected:
+                delete_articles(affected)
+        else:
+            values["updated_at"] = datetime.utcnow()
+            rows = db.session.execute(
+                update(Article)
+                .where(condition)
+                .values(**values)
+                .returning(Article.id, Article.published)
+                .execution_options(synchronize_session=False)
+            ).all()
+            affected = {article_id for article_id, _ in rows}
+            for article_id in affected:
+                touch_article(article_id)
+
+            # Chi viene nascosto va tolto dall'indice; le altre operazioni
+            # contano solo per gli articoli pubblicati
+            if operation == "unpublish":
+                queue_related_refresh(affected)
+            elif operation in RELATED_OPERATIONS:
+                queue_related_refresh(
+                    article_id for article_id, published in rows if published
+                )
+
+        db.session.commit()
+
+        return (
+            jsonify(
+                {
+                    "message": "Operazione completata",
+                    "operation": operation,
+                    "updated": sorted(affected),
+                    "skipped": sorted(requested - affected),
+                }
+            ),
+            200,
+        )
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+
 @articles_bp.route("/<int:article_id>", methods=["DELETE"])
 @author_required
 def delete_article(article_id):
@@ -269,7 +631,7 @@ def delete_article(article_id):
                 403,
             )
 
-        db.session.delete(article)
+        delete_articles([article.id])
         db.session.commit()
 
         return jsonify({"message": "Articolo eliminato con successo"}), 200
@@ -285,36 +647,48 @@ def like_article(article_id):
 
     try:
 
-        new_like = ArticleLike(user_id=user_id, article_id=article_id)
-        db.session.add(new_like)
-        db.session.commit()
-
-        Article.query.filter_by(id=article_id).update(
-            {"likes_count": Article.likes_count + 1}
-        )
-        db.session.commit()
+        inserted = db.session.execute(
+            sqlite_insert(ArticleLike)
+            .values(
+                article_id=article_id, user_id=user_id, created_at=datetime.utcnow()
+            )
+            .on_conflict_do_nothing(index_elements=["article_id", "user_id"])
+        ).rowcount
 
-        article = Article.query.get(article_id)
-        return jsonify({"liked": True, "likes_count": article.likes_count}), 200
+        if inserted:
+            delta = 1
+        else:
+            db.session.execute(
+                delete(ArticleLike).where(
+                    ArticleLike.article_id == article_id,
+                    ArticleLike.user_id == user_id,
+                )
+            )
+            delta = -1
+
+        likes_count = db.session.execute(
+            update(Article)
+            .where(Article.id == article_id)
+            .values(
+                likes_count=func.coalesce(Article.likes_count, 0) + delta,
+                updated_at=Article.updated_at,
+            )
+            .returning(Article.likes_count)
+            .execution_options(synchronize_session=False)
+        ).scalar()
 
-    except IntegrityError:
+        if likes_count is None:
+            db.session.rollback()
+            return jsonify({"error": "Articolo non trovato"}), 404
 
-        db.session.rollback()
-
-        like_to_delete = ArticleLike.query.filter_by(
-            user_id=user_id, article_id=article_id
-        ).first()
-        if like_to_delete:
-            db.session.delete(like_to_delete)
-            Article.query.filter_by(id=article_id).update(
-                {"likes_count": Article.likes_count - 1}
-            )
-            db.session.commit()
+        touch_article(article_id)
+        db.session.commit()
 
-            article = Article.query.get(article_id)
-            return jsonify({"liked": False, "likes_count": article.likes_count}), 200
+        return jsonify({"liked": delta > 0, "likes_count": likes_count}), 200
 
-        return jsonify({"error": "Impossibile trovare il like da rimuovere"}), 500
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
 
 @articles_bp.route("/<int:article_id>/favorite", methods=["POST"])
 @login_required
@@ -348,6 +722,23 @@ def favorite_article(article_id):
         db.session.rollback()
         return jsonify({"error": str(e)}), 500
 
+@articles_bp.route("/<int:article_id>/comments", methods=["GET"])
+def get_comments(article_id):
+    try:
+        if db.session.get(Article, article_id) is None:
+            return jsonify({"error": "Articolo non trovato"}), 404
+
+        per_page = min(request.args.get("per_page", 20, type=int), 100)
+        comments, next_cursor = load_comment_thread(
+            article_id, cursor=request.args.get("cursor") or None, per_page=per_page
+        )
+        return jsonify({"comments": comments, "next_cursor": next_cursor}), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 @articles_bp.route("/<int:article_id>/comments", methods=["POST"])
 @login_required
 def add_comment(article_id):
@@ -358,8 +749,17 @@ def add_comment(article_id):
         if not data.get("content"):
             return jsonify({"error": "Contenuto del commento è obbligatorio"}), 400
 
+        parent_id = data.get("parent_id")
+        if parent_id is not None:
+            parent = db.session.get(Comment, parent_id)
+            if parent is None or parent.article_id != article_id:
+                return jsonify({"error": "Commento padre non valido"}), 400
+
         comment = Comment(
-            content=data["content"], article_id=article_id, user_id=session["user_id"]
+            content=data["content"],
+            article_id=article_id,
+            user_id=session["user_id"],
+            parent_id=parent_id,
         )
 
         db.session.add(comment)
@@ -386,16 +786,35 @@ def get_my_articles():
         page = request.args.get("page", 1, type=int)
         per_page = request.args.get("per_page", 10, type=int)
 
-        articles = (
-            Article.query.filter_by(author_id=session["user_id"])
-            .order_by(Article.created_at.desc())
-            .paginate(page=page, per_page=per_page, error_out=False)
+        fields = resolve_fields(request.args.get("fields"))
+
+        query = Article.query.options(*Article.list_options(fields)).filter_by(
+            author_id=session["user_id"]
+        )
+
+        cursor_mode = cursor_args()
+        if cursor_mode:
+            cursor, include_total = cursor_mode
+            page_data = keyset_paginate(
+                query, Article.created_at, Article.id, cursor, per_page, include_total
+            )
+            response = {
+                "articles": articles_to_dict(page_data["items"], fields),
+                "next_cursor": page_data["next_cursor"],
+                "per_page": per_page,
+            }
+            if include_total:
+                response["total"] = page_data["total"]
+            return jsonify(response), 200
+
+        articles = query.order_by(Article.created_at.desc()).paginate(
+            page=page, per_page=per_page, error_out=False
         )
 
         return (
             jsonify(
                 {
-                    "articles": [article.to_dict() for article in articles.items],
+                    "articles": articles_to_dict(articles.items, fields),
                     "total": articles.total,
                     "pages": articles.pages,
                     "current_page": page,
@@ -405,6 +824,9 @@ def get_my_articles():
             200,
         )
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -415,18 +837,43 @@ def get_favorite_articles():
         page = request.args.get("page", 1, type=int)
         per_page = request.args.get("per_page", 10, type=int)
 
-        favorites = (
+        fields = resolve_fields(request.args.get("fields"))
+
+        query = (
             db.session.query(Article)
+            .options(*Article.list_options(fields))
             .join(ArticleFavorite)
             .filter(ArticleFavorite.user_id == session["user_id"])
-            .order_by(ArticleFavorite.created_at.desc())
-            .paginate(page=page, per_page=per_page, error_out=False)
+        )
+
+        cursor_mode = cursor_args()
+        if cursor_mode:
+            cursor, include_total = cursor_mode
+            page_data = keyset_paginate(
+                query,
+                ArticleFavorite.created_at,
+                ArticleFavorite.id,
+                cursor,
+                per_page,
+                include_total,
+            )
+            response = {
+                "articles": articles_to_dict(page_data["items"], fields),
+                "next_cursor": page_data["next_cursor"],
+                "per_page": per_page,
+            }
+            if include_total:
+                response["total"] = page_data["total"]
+            return jsonify(response), 200
+
+        favorites = query.order_by(ArticleFavorite.created_at.desc()).paginate(
+            page=page, per_page=per_page, error_out=False
         )
 
         return (
             jsonify(
                 {
-                    "articles": [article.to_dict() for article in favorites.items],
+                    "articles": articles_to_dict(favorites.items, fields),
                     "total": favorites.total,
                     "pages": favorites.pages,
                     "current_page": page,
@@ -436,5 +883,8 @@ def get_favorite_articles():
             200,
         )
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
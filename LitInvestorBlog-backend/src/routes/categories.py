@@ -1,39 +1,47 @@
 # LitInvestorBlog-backend/src/routes/categories.py
 
 from flask import Blueprint, request, jsonify, session
-from src.models.category import Category
+from src.models.category import Category, category_stats, category_stats_dict
 from src.extensions import db
 from src.routes.auth import author_required
-import re
+from src.utils.category_catalog import category_catalog
+from src.utils.http_cache import articles_probe, categories_probe, conditional
+from src.utils.slugs import create_slug
 
 categories_bp = Blueprint("categories", __name__)
 
-def create_slug(name):
-    """Crea uno slug dal nome della categoria"""
-    slug = re.sub(r"[^\w\s-]", "", name.lower())
-    slug = re.sub(r"[-\s]+", "-", slug)
-    return slug.strip("-")
+def category_with_stats(category):
+    """Aggiunge a una categoria del catalogo le statistiche dei suoi articoli"""
+    return {**category, **category_stats_dict(category_stats(category["id"]))}
+
+def categories_list_probe(**kwargs):
+    """Le categorie includono conteggi e date degli articoli collegati"""
+    articles_signature, _last_modified = articles_probe()
+    return (categories_probe(), articles_signature), None
 
 @categories_bp.route("/", methods=["GET"])
+@conditional(categories_list_probe)
 def get_categories():
     try:
-        categories = (
-            Category.query.filter_by(is_active=True).order_by(Category.name).all()
-        )
-        return (
-            jsonify({"categories": [category.to_dict() for category in categories]}),
-            200,
-        )
+        stats = category_stats()
+        categories = [
+            {**category, **category_stats_dict(stats.get(category["id"]))}
+            for category in category_catalog.all(active_only=True)
+        ]
+        return jsonify({"categories": categories}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @categories_bp.route(
     "/<int:category_id>", methods=["GET"]
 )
+@conditional(categories_list_probe)
 def get_category(category_id):
     try:
-        category = Category.query.get_or_404(category_id)
-        return jsonify({"category": category.to_dict()}), 200
+        category = category_catalog.get(category_id)
+        if category is None:
+            return jsonify({"error": "Categoria non trovata"}), 404
+        return jsonify({"category": category_with_stats(category)}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -137,9 +145,12 @@ def delete_category(category_id):
 @categories_bp.route(
     "/<string:slug>", methods=["GET"]
 )
+@conditional(categories_list_probe)
 def get_category_by_slug(slug):
     try:
-        category = Category.query.filter_by(slug=slug, is_active=True).first_or_404()
-        return jsonify({"category": category.to_dict()}), 200
+        category = category_catalog.get_by_slug(slug)
+        if category is None or not category["is_active"]:
+            return jsonify({"error": "Categoria non trovata"}), 404
+        return jsonify({"category": category_with_stats(category)}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -3,11 +3,12 @@
 from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
 from sqlalchemy import desc
-from src.models.comment import Comment
+from src.models.comment import REPLIES_PER_ROOT, Comment, load_thread_replies
 from src.models.article import Article
 from src.models.user import User
 from src.extensions import db
 from src.middleware.auth import admin_required
+from src.utils.pagination import cursor_args, keyset_paginate
 import logging
 
 comments_bp = Blueprint("comments", __name__)
@@ -24,6 +25,26 @@ def get_article_comments(article_id):
         if not (current_user.is_authenticated and current_user.role == "admin"):
             query = query.filter_by(status="approved")
 
+        cursor_mode = cursor_args()
+        if cursor_mode:
+            cursor, include_total = cursor_mode
+            page_data = keyset_paginate(
+                query, Comment.created_at, Comment.id, cursor, per_page, include_total
+            )
+            pagination = {
+                "per_page": per_page,
+                "next_cursor": page_data["next_cursor"],
+            }
+            if include_total:
+                pagination["total"] = page_data["total"]
+            return jsonify(
+                {
+                    "success": True,
+                    "comments": [comment.to_dict() for comment in page_data["items"]],
+                    "pagination": pagination,
+                }
+            )
+
         comments = query.order_by(desc(Comment.created_at)).paginate(
             page=page, per_page=per_page, error_out=False
         )
@@ -41,10 +62,40 @@ def get_article_comments(article_id):
             }
         )
 
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
     except Exception as e:
         logging.error(f"Errore nel caricamento commenti: {e}")
         return jsonify({"success": False, "message": "Errore interno del server"}), 500
 
+@comments_bp.route("/api/comments/<int:comment_id>/replies", methods=["GET"])
+def get_comment_replies(comment_id):
+    """
+    Risposte di una discussione oltre quelle incluse nel dettaglio
+    dell'articolo: si parte dal `replies_next_cursor` della radice.
+    """
+    try:
+        per_page = min(request.args.get("per_page", REPLIES_PER_ROOT, type=int), 100)
+        page_data = load_thread_replies(
+            comment_id, request.args.get("cursor") or None, per_page
+        )
+        return jsonify(
+            {
+                "success": True,
+                "replies": [comment.to_dict() for comment in page_data["items"]],
+                "pagination": {
+                    "per_page": per_page,
+                    "next_cursor": page_data["next_cursor"],
+                },
+            }
+        )
+
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    except Exception as e:
+        logging.error(f"Errore nel caricamento risposte: {e}")
+        return jsonify({"success": False, "message": "Errore interno del server"}), 500
+
 @comments_bp.route("/api/comments", methods=["POST"])
 @login_required
 def create_comment():
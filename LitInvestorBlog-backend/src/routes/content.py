@@ -4,10 +4,18 @@ from flask import Blueprint, request, jsonify
 from src.extensions import db
 from src.models.content import Content
 from src.routes.auth import admin_required
+from src.utils.http_cache import conditional
 
 content_bp = Blueprint("content", __name__)
 
+def content_probe(page_key):
+    updated_at = (
+        db.session.query(Content.updated_at).filter_by(page_key=page_key).scalar()
+    )
+    return updated_at, updated_at
+
 @content_bp.route("/<string:page_key>", methods=["GET"])
+@conditional(content_probe)
 def get_content(page_key):
     content_entry = Content.query.filter_by(page_key=page_key).first()
 
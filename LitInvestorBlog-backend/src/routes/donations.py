@@ -1,14 +1,13 @@
 # LitInvestorBlog-backend/src/routes/donations.py
 
-from flask import Blueprint, request, jsonify, make_response
+from flask import Blueprint, request, jsonify
 from sqlalchemy import desc, func
 from src.models.donation import Donation
 from src.extensions import db
 from src.middleware.auth import admin_required
 import logging
-import csv
-import io
 from datetime import datetime, timedelta
+from src.utils.exports import EXPORT_BATCH_SIZE, export_formats, export_response
 
 donations_bp = Blueprint("donations", __name__)
 
@@ -226,63 +225,42 @@ def get_recent_donations():
         logging.error(f"Errore nel caricamento donazioni recenti: {e}")
         return jsonify({"success": False, "message": "Errore interno del server"}), 500
 
+# Colonne dell'export: (nome, etichetta CSV, tipo)
+DONATION_EXPORT_COLUMNS = (
+    ("id", "ID", "int"),
+    ("donor_name", "Nome Donatore", "str"),
+    ("donor_email", "Email", "str"),
+    ("amount", "Importo", "float"),
+    ("currency", "Valuta", "str"),
+    ("message", "Messaggio", "str"),
+    ("anonymous", "Anonimo", "bool"),
+    ("payment_method", "Metodo Pagamento", "str"),
+    ("transaction_id", "ID Transazione", "str"),
+    ("status", "Stato", "str"),
+    ("created_at", "Data Creazione", "datetime"),
+)
+
 @donations_bp.route("/api/donations/export", methods=["GET"])
 @admin_required
 def export_donations():
-    """Esporta donazioni in CSV"""
+    """Esporta donazioni in CSV, NDJSON compresso con gzip o Parquet"""
     try:
         format_type = request.args.get("format", "csv")
 
-        donations = Donation.query.order_by(desc(Donation.created_at)).all()
-
-        if format_type == "csv":
-            output = io.StringIO()
-            writer = csv.writer(output)
-
-            writer.writerow(
-                [
-                    "ID",
-                    "Nome Donatore",
-                    "Email",
-                    "Importo",
-                    "Valuta",
-                    "Messaggio",
-                    "Anonimo",
-                    "Metodo Pagamento",
-                    "ID Transazione",
-                    "Stato",
-                    "Data Creazione",
-                ]
-            )
+        if format_type not in export_formats():
+            return jsonify({"success": False, "message": "Formato non supportato"}), 400
 
-            for donation in donations:
-                writer.writerow(
-                    [
-                        donation.id,
-                        donation.donor_name or "",
-                        donation.donor_email or "",
-                        donation.amount,
-                        donation.currency,
-                        donation.message or "",
-                        "Sì" if donation.anonymous else "No",
-                        donation.payment_method,
-                        donation.transaction_id or "",
-                        donation.status,
-                        donation.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-                    ]
-                )
-
-            output.seek(0)
-
-            response = make_response(output.getvalue())
-            response.headers["Content-Type"] = "text/csv"
-            response.headers["Content-Disposition"] = (
-                f"attachment; filename=donazioni_{datetime.now().strftime('%Y%m%d')}.csv"
+        donations = (
+            db.session.query(
+                *[getattr(Donation, name) for name, _, _ in DONATION_EXPORT_COLUMNS]
             )
-
-            return response
-
-        return jsonify({"success": False, "message": "Formato non supportato"}), 400
+            .order_by(desc(Donation.created_at))
+            .yield_per(EXPORT_BATCH_SIZE)
+        )
+        filename = f"donazioni_{datetime.now().strftime('%Y%m%d')}"
+        return export_response(
+            DONATION_EXPORT_COLUMNS, donations, format_type, filename
+        )
 
     except Exception as e:
         logging.error(f"Errore nell'export donazioni: {e}")
@@ -0,0 +1,127 @@
+# LitInvestorBlog-backend/src/routes/events.py
+
+from datetime import datetime, timedelta
+from flask import Blueprint, jsonify, request, session
+from src.models.page_event import EVENT_TYPES
+from src.routes.auth import admin_required
+from src.utils.event_queue import event_queue
+from src.utils.view_counter import CRAWLER_PATTERN
+
+events_bp = Blueprint("events", __name__)
+
+# navigator.sendBeacon non invia più di 64 KB per chiamata
+MAX_BEACON_BYTES = 64 * 1024
+MAX_EVENTS_PER_REQUEST = 50
+
+# Limiti dei valori: percentuale di scroll e secondi di lettura
+VALUE_LIMITS = {"scroll": 100.0, "read_time": 6 * 3600.0}
+
+# Un orario del client più vecchio di così (o nel futuro) viene ignorato
+MAX_EVENT_AGE = timedelta(days=1)
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def parse_event(raw, now, user_id):
+    """
+    Converte un evento inviato dal browser nelle colonne di PageEvent.
+
+    Campi: type, path, article_id e value facoltativi, ts in millisecondi
+    dall'epoca. Il valore viene limitato a VALUE_LIMITS; se ts manca o non
+    è plausibile vale l'orario di ricezione.
+
+    Returns:
+        Un dict pronto per l'INSERT, o None se l'evento non è valido.
+    """
+    if not isinstance(raw, dict) or raw.get("type") not in EVENT_TYPES:
+        return None
+
+    path = raw.get("path")
+    if not isinstance(path, str) or not path.startswith("/"):
+        return None
+
+    article_id = raw.get("article_id")
+    if article_id is not None and (
+        not isinstance(article_id, int) or isinstance(article_id, bool)
+    ):
+        return None
+
+    value = None
+    if raw["type"] in VALUE_LIMITS:
+        if not _is_number(raw.get("value")):
+            return None
+        value = min(max(float(raw["value"]), 0.0), VALUE_LIMITS[raw["type"]])
+
+    occurred_at = now
+    if _is_number(raw.get("ts")):
+        try:
+            client_time = datetime.utcfromtimestamp(raw["ts"] / 1000)
+        except (OverflowError, OSError, ValueError):
+            client_time = None
+        if client_time is not None and now - MAX_EVENT_AGE <= client_time <= now:
+            occurred_at = client_time
+
+    return {
+        "type": raw["type"],
+        "path": path[:500],
+        "article_id": article_id,
+        "user_id": user_id,
+        "value": value,
+        "occurred_at": occurred_at,
+        "received_at": now,
+    }
+
+@events_bp.route("", methods=["POST"])
+def collect_events():
+    """
+    Beacon per gli eventi di navigazione, pensato per navigator.sendBeacon.
+
+    Il corpo è un evento o {"events": [...]}, come JSON anche se inviato
+    come text/plain. Gli eventi validi vengono solo accodati: la risposta
+    è 204 senza attendere il database, 503 con Retry-After se la coda è
+    piena e nessun evento è stato accettato.
+    """
+    try:
+        if (request.content_length or 0) > MAX_BEACON_BYTES:
+            return jsonify({"error": "Richiesta troppo grande"}), 413
+
+        user_agent = request.headers.get("User-Agent", "")
+        if not user_agent or CRAWLER_PATTERN.search(user_agent):
+            return "", 204
+
+        payload = request.get_json(force=True, silent=True)
+        raw_events = payload
+        if isinstance(payload, dict):
+            raw_events = payload.get("events", [payload])
+        if not isinstance(raw_events, list) or not raw_events:
+            return jsonify({"error": "Nessun evento inviato"}), 400
+        if len(raw_events) > MAX_EVENTS_PER_REQUEST:
+            return (
+                jsonify(
+                    {"error": f"Massimo {MAX_EVENTS_PER_REQUEST} eventi per richiesta"}
+                ),
+                400,
+            )
+
+        now = datetime.utcnow()
+        user_id = session.get("user_id")
+        events = [parse_event(raw, now, user_id) for raw in raw_events]
+        events = [event for event in events if event is not None]
+        if not events:
+            return jsonify({"error": "Nessun evento valido"}), 400
+
+        if not event_queue.put(events):
+            response = jsonify({"error": "Coda degli eventi piena"})
+            response.headers["Retry-After"] = "1"
+            return response, 503
+
+        return "", 204
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@events_bp.route("/stats", methods=["GET"])
+@admin_required
+def get_event_stats():
+    """Contatori della coda degli eventi di questo processo"""
+    return jsonify(event_queue.stats()), 200
@@ -1,45 +1,76 @@
 # LitInvestorBlog-backend/src/routes/filters.py
 
+from collections import Counter
 from flask import Blueprint, jsonify
-from sqlalchemy import extract
-from src.models.article import Article
-from src.models.category import Category
+from src.models.facet import ArticleFacet
 from src.models.user import User
 from src.extensions import db
+from src.utils.category_catalog import category_catalog
+from src.utils.http_cache import articles_probe, conditional
 
 filters_bp = Blueprint("filters", __name__)
 
+def filter_options_probe():
+    """
+    Le opzioni dipendono dalle faccette degli articoli, dal catalogo delle
+    categorie e dai nomi degli autori: la firma degli articoli comprende già
+    le versioni di categorie e utenti (related_versions()).
+    """
+    return articles_probe()
+
 @filters_bp.route("/options", methods=["GET"])
+@conditional(filter_options_probe)
 def get_filter_options():
     try:
 
-        categories = Category.query.order_by(Category.name).all()
-
-        authors = db.session.query(User).join(Article).group_by(User.id).all()
-
-        dates = (
+        rows = (
             db.session.query(
-                extract("year", Article.created_at).label("year"),
-                extract("month", Article.created_at).label("month"),
+                ArticleFacet.category_id,
+                ArticleFacet.author_id,
+                ArticleFacet.year,
+                ArticleFacet.month,
+                ArticleFacet.published_count,
+                User.username,
             )
-            .group_by("year", "month")
-            .order_by(db.desc("year"), db.desc("month"))
+            .outerjoin(User, User.id == ArticleFacet.author_id)
             .all()
         )
 
+        category_counts = Counter()
+        author_counts = Counter()
+        author_names = {}
+        date_counts = {}
+        for category_id, author_id, year, month, count, username in rows:
+            category_counts[category_id] += count
+            author_counts[author_id] += count
+            author_names[author_id] = username
+            months = date_counts.setdefault(year, {})
+            months[month] = months.get(month, 0) + count
+
         category_options = [
-            {"value": cat.slug, "label": cat.name} for cat in categories
-        ]
-        author_options = [
-            {"value": author.id, "label": author.username} for author in authors
+            {
+                "value": cat["slug"],
+                "label": cat["name"],
+                "count": category_counts.get(cat["id"], 0),
+            }
+            for cat in category_catalog.all()
         ]
+        author_options = sorted(
+            (
+                {
+                    "value": author_id,
+                    "label": author_names[author_id],
+                    "count": count,
+                }
+                for author_id, count in author_counts.items()
+            ),
+            key=lambda option: (option["label"] or "").lower(),
+        )
 
-        date_options = {}
-        for row in dates:
-            year, month = row.year, row.month
-            if year not in date_options:
-                date_options[year] = []
-            date_options[year].append(month)
+        date_options = {
+            year: sorted(date_counts[year], reverse=True)
+            for year in sorted(date_counts, reverse=True)
+        }
 
         return (
             jsonify(
@@ -47,6 +78,7 @@ def get_filter_options():
                     "categories": category_options,
                     "authors": author_options,
                     "dates": date_options,
+                    "date_counts": date_counts,
                 }
             ),
             200,
@@ -1,7 +1,8 @@
 # LitInvestorBlog-backend/src/routes/search.py
 
-from flask import Blueprint, jsonify
-from src.models.article import Article
+from flask import Blueprint, jsonify, request, make_response
+from src.utils.http_cache import not_modified, with_validators
+from src.utils.search_data import search_data_store
 
 search_bp = Blueprint("search_bp", __name__)
 
@@ -10,36 +11,35 @@ def get_search_data():
     """
     Questo endpoint restituisce una lista di tutti gli articoli pubblicati
     in un formato ottimizzato per la ricerca fuzzy nel frontend.
+
+    Il payload è versionato: la versione viaggia nell'ETag e
+    nell'header X-Search-Data-Version. Con `since=<versione>` l'endpoint
+    restituisce solo gli articoli aggiunti, modificati o rimossi.
     """
     try:
-
-        articles = Article.query.filter(Article.published.is_(True)).all()
-
-        searchable_items = []
-        for article in articles:
-            article_content = article.content if article.content else ""
-
-            if article.excerpt:
-                snippet = article.excerpt
+        since = request.args.get("since")
+        if since:
+            delta = search_data_store.delta(since)
+            response = jsonify(delta)
+            response.headers["X-Search-Data-Version"] = delta["version"]
+            return response
+
+        snapshot = search_data_store.snapshot()
+        version = snapshot["version"]
+
+        response = not_modified(version)
+        if response is None:
+            if "gzip" in request.accept_encodings:
+                response = make_response(snapshot["gzip"])
+                response.headers["Content-Encoding"] = "gzip"
             else:
-                snippet = (
-                    (article_content[:150] + "...")
-                    if len(article_content) > 150
-                    else article_content
-                )
-
-            item = {
-                "type": "article",
-                "title": article.title,
-                "slug": f"/article/{article.slug}",
-                "category": (
-                    article.category.name if article.category else "Uncategorized"
-                ),
-                "content_snippet": snippet,
-            }
-            searchable_items.append(item)
-
-        return jsonify(searchable_items)
+                response = make_response(snapshot["body"])
+            response.headers["Content-Type"] = "application/json"
+            with_validators(response, version)
+
+        response.headers["X-Search-Data-Version"] = version
+        response.vary.add("Accept-Encoding")
+        return response
 
     except Exception as e:
         print(f"Error in /api/search-data: {e}")
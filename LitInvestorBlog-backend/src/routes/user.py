@@ -4,7 +4,7 @@ from flask import Blueprint, jsonify, request, session
 from src.routes.auth import login_required
 from src.models.user import User
 from src.extensions import db
-from src.models.article import Article
+from src.models.article import Article, articles_to_dict, resolve_fields
 from src.models.like import ArticleLike
 
 user_bp = Blueprint("user", __name__)
@@ -54,9 +54,11 @@ def delete_user(user_id):
 def get_liked_articles():
     try:
         user_id = session["user_id"]
+        fields = resolve_fields(request.args.get("fields"))
 
         liked_articles = (
             db.session.query(Article)
+            .options(*Article.list_options(fields))
             .join(ArticleLike)
             .filter(ArticleLike.user_id == user_id)
             .order_by(ArticleLike.created_at.desc())
@@ -64,9 +66,11 @@ def get_liked_articles():
         )
 
         return (
-            jsonify({"articles": [article.to_dict() for article in liked_articles]}),
+            jsonify({"articles": articles_to_dict(liked_articles, fields)}),
             200,
         )
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
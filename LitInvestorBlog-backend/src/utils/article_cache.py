@@ -0,0 +1,121 @@
+# LitInvestorBlog-backend/src/utils/article_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import event
+from src.extensions import db
+from src.models.article import Article
+from src.models.comment import Comment
+
+class ArticleCache:
+    """
+    Cache in memoria della parte anonima delle pagine di dettaglio articolo.
+
+    Le voci sono indicizzate per id, con una mappa slug -> id per le
+    richieste per slug. Vengono invalidate dopo ogni commit che tocca
+    l'articolo o i suoi commenti (vedi gli hook before_flush/after_commit
+    registrati in init_app). Gli altri worker non vedono i commit di questo
+    processo: ogni voce conserva la firma del database con cui è stata
+    costruita e una lettura con una firma diversa è un miss. Il TTL limita
+    comunque la durata delle voci.
+    """
+
+    def __init__(self, max_entries=512, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._slugs = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.max_entries = app.config.get("ARTICLE_CACHE_MAX_ENTRIES", self.max_entries)
+        self.ttl = app.config.get("ARTICLE_CACHE_TTL", self.ttl)
+        app.extensions["article_cache"] = self
+
+        if not event.contains(db.session, "before_flush", _collect_touched_articles):
+            event.listen(db.session, "before_flush", _collect_touched_articles)
+            event.listen(db.session, "after_commit", _invalidate_touched_articles)
+            event.listen(db.session, "after_soft_rollback", _discard_touched_articles)
+
+    def get(self, article_id=None, slug=None, signature=None):
+        """
+        Restituisce il payload in cache per id o slug, se ancora valido.
+
+        Con `signature` la voce vale solo se è stata salvata con la stessa
+        firma, cioè se il database non è cambiato da allora.
+        """
+        with self._lock:
+            if article_id is None:
+                article_id = self._slugs.get(slug)
+            entry = self._entries.get(article_id)
+            if entry is None:
+                return None
+
+            expires_at, entry_signature, payload = entry
+            if expires_at < time.monotonic() or (
+                signature is not None and entry_signature != signature
+            ):
+                self._remove(article_id)
+                return None
+
+            self._entries.move_to_end(article_id)
+            return payload
+
+    def set(self, article_id, slug, payload, signature=None):
+        with self._lock:
+            self._remove(article_id)
+            self._entries[article_id] = (
+                time.monotonic() + self.ttl,
+                signature,
+                payload,
+            )
+            self._slugs[slug] = article_id
+            while len(self._entries) > self.max_entries:
+                oldest_id = next(iter(self._entries))
+                self._remove(oldest_id)
+
+    def invalidate(self, article_ids):
+        with self._lock:
+            for article_id in article_ids:
+                self._remove(article_id)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._slugs.clear()
+
+    def _remove(self, article_id):
+        entry = self._entries.pop(article_id, None)
+        if entry is not None:
+            slug = entry[2].get("slug")
+            if self._slugs.get(slug) == article_id:
+                del self._slugs[slug]
+
+def touch_article(article_id, session=None):
+    """
+    Segna un articolo come modificato nella transazione corrente.
+
+    Serve per le scritture che non passano dagli oggetti ORM (UPDATE in
+    blocco, contatori): la voce in cache viene invalidata al commit.
+    """
+    session = session or db.session
+    session.info.setdefault("touched_articles", set()).add(article_id)
+
+def _collect_touched_articles(session, flush_context, instances):
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Article) and obj.id is not None:
+            touch_article(obj.id, session)
+        elif isinstance(obj, Comment) and obj.article_id is not None:
+            touch_article(obj.article_id, session)
+
+def _invalidate_touched_articles(session):
+    touched = session.info.pop("touched_articles", None)
+    if touched:
+        article_cache.invalidate(touched)
+
+def _discard_touched_articles(session, previous_transaction):
+    if not session.in_transaction():
+        session.info.pop("touched_articles", None)
+
+article_cache = ArticleCache()
@@ -0,0 +1,152 @@
+# LitInvestorBlog-backend/src/utils/category_catalog.py
+
+import threading
+import time
+from sqlalchemy import event, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload
+from src.extensions import db
+from src.models.catalog_version import CatalogVersion
+from src.models.category import Category
+from src.utils.user_version import CATALOG_NAME as USER_CATALOG_NAME
+
+CATALOG_NAME = "category"
+
+class CategoryCatalog:
+    """
+    Catalogo delle categorie tenuto in memoria da ogni processo.
+
+    Contiene i campi propri delle categorie (senza statistiche) e le mappe
+    slug -> id e id -> categoria. Un commit che tocca una Category
+    incrementa la riga "category" di catalog_version nella stessa
+    transazione e invalida subito il catalogo di questo processo; gli altri
+    worker confrontano la versione al massimo ogni `check_interval` secondi
+    con una lettura per chiave primaria. La versione comprende anche la riga
+    "user", perché creator_name arriva dagli utenti.
+
+    version(), usata negli ETag, legge sempre il database: la firma non
+    resta indietro di `check_interval` secondi e, se è cambiata, il
+    catalogo viene ricaricato prima di costruire la risposta.
+
+    Il caricamento avviene al primo utilizzo in ogni worker, così nessuna
+    connessione SQLite viene aperta prima del fork di gunicorn.
+    """
+
+    def __init__(self, check_interval=5):
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = 0.0
+        self._stale = True
+        self._categories = []
+        self._by_id = {}
+        self._by_slug = {}
+
+    def init_app(self, app):
+        self.check_interval = app.config.get(
+            "CATEGORY_CATALOG_CHECK_INTERVAL", self.check_interval
+        )
+        app.extensions["category_catalog"] = self
+
+        if not event.contains(db.session, "before_flush", _bump_catalog_version):
+            event.listen(db.session, "before_flush", _bump_catalog_version)
+            event.listen(db.session, "after_commit", _invalidate_catalog)
+            event.listen(db.session, "after_soft_rollback", _discard_catalog_change)
+
+    def invalidate(self):
+        self._stale = True
+
+    def version(self):
+        """Versione corrente del catalogo, letta dal database, per gli ETag"""
+        self._ensure_fresh(force=True)
+        return self._version
+
+    def all(self, active_only=False):
+        """Le categorie in ordine di nome, come dict"""
+        self._ensure_fresh()
+        if active_only:
+            return [c for c in self._categories if c["is_active"]]
+        return list(self._categories)
+
+    def get(self, category_id):
+        self._ensure_fresh()
+        return self._by_id.get(category_id)
+
+    def get_by_slug(self, slug):
+        self._ensure_fresh()
+        category_id = self._by_slug.get(slug)
+        return self._by_id.get(category_id) if category_id is not None else None
+
+    def slug_to_id(self, slug):
+        self._ensure_fresh()
+        return self._by_slug.get(slug)
+
+    def _ensure_fresh(self, force=False):
+        now = time.monotonic()
+        if self._is_fresh(now, force):
+            return
+
+        with self._lock:
+            if self._is_fresh(now, force):
+                return
+            version = _read_version()
+            if self._stale or version != self._version:
+                self._load(version)
+            self._checked_at = now
+            self._stale = False
+
+    def _is_fresh(self, now, force):
+        return (
+            not force
+            and not self._stale
+            and now - self._checked_at < self.check_interval
+        )
+
+    def _load(self, version):
+        categories = (
+            Category.query.options(joinedload(Category.creator))
+            .order_by(Category.name)
+            .all()
+        )
+        entries = [category.base_dict() for category in categories]
+        self._categories = entries
+        self._by_id = {entry["id"]: entry for entry in entries}
+        self._by_slug = {entry["slug"]: entry["id"] for entry in entries}
+        self._version = version
+
+def _read_version():
+    """Versioni di categorie e utenti, con una lettura per chiave primaria"""
+    versions = dict(
+        db.session.execute(
+            select(CatalogVersion.name, CatalogVersion.version).where(
+                CatalogVersion.name.in_((CATALOG_NAME, USER_CATALOG_NAME))
+            )
+        ).all()
+    )
+    return versions.get(CATALOG_NAME), versions.get(USER_CATALOG_NAME)
+
+def _bump_catalog_version(session, flush_context, instances):
+    objects = list(session.new) + list(session.dirty) + list(session.deleted)
+    if not any(isinstance(obj, Category) for obj in objects):
+        return
+
+    # Sulla connessione e non sulla sessione, che farebbe un autoflush
+    session.connection().execute(
+        sqlite_insert(CatalogVersion)
+        .values(name=CATALOG_NAME, version=1)
+        .on_conflict_do_update(
+            index_elements=[CatalogVersion.name],
+            set_={"version": CatalogVersion.version + 1},
+        )
+    )
+    session.info["category_catalog_changed"] = True
+
+def _invalidate_catalog(session):
+    if session.info.pop("category_catalog_changed", False):
+        category_catalog.invalidate()
+
+def _discard_catalog_change(session, previous_transaction):
+    if not session.in_transaction():
+        session.info.pop("category_catalog_changed", None)
+
+category_catalog = CategoryCatalog()
@@ -1,11 +1,14 @@
 # LitInvestorBlog-backend/src/utils/convert_img.py
 
 import os
+from typing import Optional
 from PIL import Image
 from werkzeug.datastructures import FileStorage
 from datetime import datetime
 
-def convert_and_save_webp(file: FileStorage, upload_folder: str) -> str:
+def convert_and_save_webp(
+    file: FileStorage, upload_folder: str, filename: Optional[str] = None
+) -> str:
     """
     Prende un file immagine, lo converte in WebP, lo rinomina con un timestamp
     e lo salva nella cartella specificata.
@@ -13,6 +16,8 @@ def convert_and_save_webp(file: FileStorage, upload_folder: str) -> str:
     Args:
         file: L'oggetto file proveniente da request.files.
         upload_folder: Il percorso assoluto della cartella di destinazione.
+        filename: Nome del file WebP da usare al posto di quello col timestamp,
+            che non distingue due immagini salvate nello stesso secondo.
 
     Returns:
         La URL pubblica del file salvato (es. /static/uploads/img_20251026123000.webp).
@@ -22,8 +27,11 @@ def convert_and_save_webp(file: FileStorage, upload_folder: str) -> str:
     """
     try:
 
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        new_filename = f"img_{timestamp}.webp"
+        if filename:
+            new_filename = filename
+        else:
+            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+            new_filename = f"img_{timestamp}.webp"
 
         save_path = os.path.join(upload_folder, new_filename)
 
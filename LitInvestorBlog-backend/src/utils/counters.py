@@ -0,0 +1,105 @@
+# LitInvestorBlog-backend/src/utils/counters.py
+
+from sqlalchemy import Integer, cast, delete, func, insert, or_, select, update
+from src.extensions import db
+from src.models.article import Article
+from src.models.comment import Comment
+from src.models.engagement import ArticleEngagement
+from src.models.facet import ArticleFacet
+from src.models.like import ArticleLike
+from src.models.share import Share
+
+def reconcile_counters():
+    """
+    Riallinea i contatori denormalizzati di tutti gli articoli con un solo UPDATE.
+
+    likes_count viene ricalcolato dalla tabella article_like. Per
+    views_count non esiste un registro delle singole letture: i valori
+    nulli o negativi vengono riportati a zero e gli incrementi ancora nel
+    buffer vanno scritti prima con view_counter.flush().
+
+    Returns:
+        Il numero di articoli i cui contatori erano disallineati.
+    """
+    actual_likes = (
+        select(func.count(ArticleLike.id))
+        .where(ArticleLike.article_id == Article.id)
+        .scalar_subquery()
+    )
+    drifted = or_(
+        func.coalesce(Article.likes_count, -1) != actual_likes,
+        func.coalesce(Article.views_count, -1) < 0,
+    )
+
+    result = db.session.execute(
+        update(Article)
+        .where(drifted)
+        .values(
+            likes_count=actual_likes,
+            views_count=func.max(func.coalesce(Article.views_count, 0), 0),
+            updated_at=Article.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return result.rowcount
+
+def reconcile_facets():
+    """
+    Ricostruisce article_facet dagli articoli pubblicati.
+
+    I trigger la mantengono allineata a ogni scrittura; questa funzione
+    serve dopo modifiche fatte con i trigger disattivati o per verificarla.
+
+    Returns:
+        Il numero di righe della tabella ricostruita.
+    """
+    year = cast(func.strftime("%Y", Article.created_at), Integer)
+    month = cast(func.strftime("%m", Article.created_at), Integer)
+    facets = (
+        select(Article.category_id, Article.author_id, year, month, func.count())
+        .where(Article.published.is_(True))
+        .group_by(Article.category_id, Article.author_id, year, month)
+    )
+
+    db.session.execute(delete(ArticleFacet))
+    result = db.session.execute(
+        insert(ArticleFacet).from_select(
+            ["category_id", "author_id", "year", "month", "published_count"], facets
+        )
+    )
+    db.session.commit()
+    return result.rowcount
+
+def reconcile_engagement():
+    """
+    Ricostruisce article_engagement da like, commenti, condivisioni e letture.
+
+    Ogni tabella viene contata con un proprio GROUP BY prima del join, così
+    un articolo con molte righe in più tabelle non moltiplica i conteggi.
+
+    Returns:
+        Il numero di righe della tabella ricostruita.
+    """
+    totals = [
+        select(model.article_id, func.count().label("total"))
+        .group_by(model.article_id)
+        .subquery()
+        for model in (ArticleLike, Comment, Share)
+    ]
+    query = select(
+        Article.id,
+        *[func.coalesce(total.c.total, 0) for total in totals],
+        func.coalesce(Article.views_count, 0),
+    )
+    for total in totals:
+        query = query.outerjoin(total, total.c.article_id == Article.id)
+
+    db.session.execute(delete(ArticleEngagement))
+    result = db.session.execute(
+        insert(ArticleEngagement).from_select(
+            ["article_id", "likes", "comments", "shares", "views"], query
+        )
+    )
+    db.session.commit()
+    return result.rowcount
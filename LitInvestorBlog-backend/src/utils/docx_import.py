@@ -0,0 +1,549 @@
+# LitInvestorBlog-backend/src/utils/docx_import.py
+
+import hashlib
+import html
+import io
+import os
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from sqlalchemy import insert, select, update
+from werkzeug.datastructures import FileStorage
+from src.extensions import db
+from src.models.article import Article
+from src.models.imported_document import ImportedDocument
+from src.utils.article_cache import touch_article
+from src.utils.convert_img import convert_and_save_webp
+from src.utils.slugs import create_slug
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+V = "{urn:schemas-microsoft-com:vml}"
+REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+HEADING_STYLE = re.compile(r"^(?:heading|titolo)\s*([1-6])$", re.IGNORECASE)
+TITLE_STYLE = re.compile(r"^(?:title|titolo)$", re.IGNORECASE)
+FILE_NUMBER = re.compile(r"^\d+\.\s*")
+
+# Un paragrafo tutto in grassetto più corto di così diventa un sottotitolo
+BOLD_HEADING_LENGTH = 120
+
+# Segnaposto al posto del link per i segmenti che sono immagini
+IMAGE = object()
+
+# Elementi che contengono run senza cambiarne il significato
+RUN_CONTAINERS = {
+    W + "ins",
+    W + "smartTag",
+    W + "sdt",
+    W + "sdtContent",
+    W + "fldSimple",
+    W + "customXml",
+}
+
+def file_hash(path):
+    """sha256 del file letto a blocchi"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _is_on(element):
+    """Le proprietà booleane di Word (w:b, w:i) sono attive se non valgono 0"""
+    return element is not None and element.get(W + "val") not in ("0", "false")
+
+def _relationships(archive):
+    """rId -> (destinazione, esterna) dalle relazioni di document.xml"""
+    try:
+        with archive.open("word/_rels/document.xml.rels") as stream:
+            root = ET.parse(stream).getroot()
+    except KeyError:
+        return {}
+
+    relationships = {}
+    for rel in root.iter(REL + "Relationship"):
+        external = rel.get("TargetMode") == "External"
+        target = rel.get("Target", "")
+        if not external:
+            target = posixpath.normpath(posixpath.join("word", target))
+        relationships[rel.get("Id")] = (target, external)
+    return relationships
+
+def _list_formats(archive):
+    """(numId, livello) -> "ol" o "ul" secondo il formato di numerazione"""
+    try:
+        with archive.open("word/numbering.xml") as stream:
+            root = ET.parse(stream).getroot()
+    except KeyError:
+        return {}
+
+    abstract = {}
+    for definition in root.iter(W + "abstractNum"):
+        levels = {}
+        for level in definition.iter(W + "lvl"):
+            number_format = level.find(W + "numFmt")
+            bullet = number_format is None or number_format.get(W + "val") in (
+                "bullet",
+                "none",
+            )
+            levels[level.get(W + "ilvl")] = "ul" if bullet else "ol"
+        abstract[definition.get(W + "abstractNumId")] = levels
+
+    formats = {}
+    for num in root.iter(W + "num"):
+        abstract_id = num.find(W + "abstractNumId")
+        if abstract_id is None:
+            continue
+        levels = abstract.get(abstract_id.get(W + "val"), {})
+        for level, tag in levels.items():
+            formats[(num.get(W + "numId"), level)] = tag
+    return formats
+
+class _HtmlBuilder:
+    """
+    Converte gli eventi di iterparse di document.xml nell'HTML dell'articolo.
+
+    Ogni paragrafo viene convertito appena chiuso e poi svuotato, quindi la
+    memoria resta proporzionale al paragrafo più lungo e non al documento.
+    """
+
+    def __init__(self, key, relationships, list_formats):
+        self.key = key
+        self.relationships = relationships
+        self.list_formats = list_formats
+        self.title = None
+        self.excerpt = None
+        self.blocks = []
+        self.images = []
+        self._open_lists = []
+        self._tables = []
+        self._paragraph_depth = 0
+
+    def feed(self, event, element):
+        tag = element.tag
+        if event == "start":
+            if tag == W + "p":
+                self._paragraph_depth += 1
+            elif tag == W + "tbl":
+                self._close_lists()
+                self._tables.append([])
+            elif tag == W + "tr" and self._tables:
+                self._tables[-1].append([])
+            elif tag == W + "tc" and self._tables:
+                self._tables[-1][-1].append([])
+            return
+
+        if tag == W + "p":
+            self._paragraph_depth -= 1
+            # I paragrafi annidati (caselle di testo) restano nel paragrafo esterno
+            if self._paragraph_depth == 0:
+                self._paragraph(element)
+                element.clear()
+        elif tag == W + "tbl" and self._tables:
+            self._table(self._tables.pop())
+            element.clear()
+
+    def result(self):
+        self._close_lists()
+        return {
+            "title": self.title,
+            "excerpt": self.excerpt,
+            "content": "\n".join(self.blocks),
+            "images": self.images,
+        }
+
+    def _emit(self, block):
+        if self._tables:
+            row = self._tables[-1][-1] if self._tables[-1] else None
+            if row:
+                row[-1].append(block)
+        else:
+            self.blocks.append(block)
+
+    def _paragraph(self, paragraph):
+        segments = []
+        self._inline(paragraph, segments, bold=False, italic=False)
+        content = self._merge(segments)
+        text = "".join(
+            chunk for _, _, chunk, link in segments if link is not IMAGE
+        ).strip()
+        has_image = any(link is IMAGE for _, _, _, link in segments)
+        if not text and not has_image:
+            return
+
+        properties = paragraph.find(W + "pPr")
+        style = ""
+        list_key = None
+        if properties is not None:
+            style_element = properties.find(W + "pStyle")
+            if style_element is not None:
+                style = style_element.get(W + "val", "")
+            numbering = properties.find(W + "numPr")
+            if numbering is not None:
+                num_id = numbering.find(W + "numId")
+                level = numbering.find(W + "ilvl")
+                if num_id is not None and num_id.get(W + "val") != "0":
+                    list_key = (
+                        num_id.get(W + "val"),
+                        level.get(W + "val") if level is not None else "0",
+                    )
+
+        if self._tables:
+            self._emit(content)
+            return
+
+        if self.title is None and text and (TITLE_STYLE.match(style) or not style):
+            self.title = text
+            return
+
+        heading = HEADING_STYLE.match(style)
+        if list_key is not None:
+            self._list_item(list_key, content)
+            return
+
+        self._close_lists()
+        all_bold = all(
+            bold
+            for bold, _, chunk, link in segments
+            if link is not IMAGE and chunk.strip()
+        )
+        if heading:
+            level = min(int(heading.group(1)) + 1, 6)
+            self._emit(f"<h{level}>{html.escape(text)}</h{level}>")
+        elif all_bold and not has_image and len(text) <= BOLD_HEADING_LENGTH:
+            self._emit(f"<h3>{html.escape(text)}</h3>")
+        else:
+            if self.excerpt is None and text:
+                self.excerpt = text
+            self._emit(f"<p>{content}</p>")
+
+    def _inline(self, element, segments, bold, italic, link=None):
+        for child in element:
+            tag = child.tag
+            if tag == W + "r":
+                self._run(child, segments, bold, italic, link)
+            elif tag == W + "hyperlink":
+                target = self.relationships.get(child.get(R + "id"))
+                href = target[0] if target and target[1] else None
+                self._inline(child, segments, bold, italic, href)
+            elif tag in RUN_CONTAINERS:
+                self._inline(child, segments, bold, italic, link)
+
+    def _run(self, run, segments, bold, italic, link):
+        properties = run.find(W + "rPr")
+        if properties is not None:
+            bold = bold or _is_on(properties.find(W + "b"))
+            italic = italic or _is_on(properties.find(W + "i"))
+
+        for child in run:
+            tag = child.tag
+            if tag == W + "t":
+                segments.append((bold, italic, child.text or "", link))
+            elif tag == W + "tab":
+                segments.append((bold, italic, " ", link))
+            elif tag in (W + "br", W + "cr"):
+                segments.append((bold, italic, "\n", link))
+            elif tag in (W + "drawing", W + "pict"):
+                for image in self._images(child):
+                    segments.append((False, False, image, IMAGE))
+
+    def _images(self, drawing):
+        references = [blip.get(R + "embed") for blip in drawing.iter(A + "blip")]
+        references += [data.get(R + "id") for data in drawing.iter(V + "imagedata")]
+        for reference in filter(None, references):
+            target = self.relationships.get(reference)
+            if target is None:
+                continue
+            member, external = target
+            if external:
+                yield f'<img src="{html.escape(member)}" alt="">'
+                continue
+            digest = hashlib.sha1(f"{self.key}:{member}".encode()).hexdigest()[:16]
+            filename = f"doc_{digest}.webp"
+            self.images.append((member, filename))
+            yield f'<img src="/static/uploads/{filename}" alt="">'
+
+    @staticmethod
+    def _merge(segments):
+        """HTML del paragrafo, unendo i run consecutivi con la stessa formattazione"""
+        parts = []
+        current = None
+        buffer = []
+
+        def flush():
+            if not buffer:
+                return
+            bold, italic, link = current
+            chunk = "".join(buffer)
+            if link:
+                chunk = f'<a href="{html.escape(link)}">{chunk}</a>'
+            if italic:
+                chunk = f"<em>{chunk}</em>"
+            if bold:
+                chunk = f"<strong>{chunk}</strong>"
+            parts.append(chunk)
+
+        for bold, italic, text, link in segments:
+            if link is IMAGE:
+                flush()
+                buffer, current = [], None
+                parts.append(text)
+                continue
+            key = (bold, italic, link)
+            if key != current:
+                flush()
+                buffer, current = [], key
+            buffer.append(html.escape(text).replace("\n", "<br>"))
+        flush()
+        return "".join(parts)
+
+    def _list_item(self, key, content):
+        tag = self.list_formats.get(key, "ul")
+        depth = int(key[1]) + 1
+        while len(self._open_lists) > depth:
+            self.blocks.append(f"</li></{self._open_lists.pop()}>")
+        if len(self._open_lists) == depth:
+            if self._open_lists[-1] == tag:
+                self.blocks.append("</li>")
+            else:
+                self.blocks.append(f"</li></{self._open_lists.pop()}>")
+        while len(self._open_lists) < depth:
+            self.blocks.append(f"<{tag}>")
+            self._open_lists.append(tag)
+        self.blocks.append(f"<li>{content}")
+
+    def _close_lists(self):
+        while self._open_lists:
+            self.blocks.append(f"</li></{self._open_lists.pop()}>")
+
+    def _table(self, rows):
+        html_rows = "".join(
+            "<tr>"
+            + "".join(f"<td>{'<br>'.join(cell)}</td>" for cell in row)
+            + "</tr>"
+            for row in rows
+        )
+        self._emit(f"<table><tbody>{html_rows}</tbody></table>")
+
+def parse_document(path, key):
+    """
+    Converte un .docx in HTML leggendo document.xml in streaming.
+
+    `key` (di solito l'hash del file) rende stabili i nomi delle immagini
+    estratte, così un nuovo import dello stesso file non le duplica.
+
+    Returns:
+        Un dict con `title`, `excerpt`, `content` (HTML) e `images`, la lista
+        delle coppie (file nell'archivio, nome del WebP da generare).
+    """
+    with zipfile.ZipFile(path) as archive:
+        builder = _HtmlBuilder(key, _relationships(archive), _list_formats(archive))
+        with archive.open("word/document.xml") as stream:
+            for event, element in ET.iterparse(stream, events=("start", "end")):
+                builder.feed(event, element)
+
+    document = builder.result()
+    if not document["title"]:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        document["title"] = FILE_NUMBER.sub("", stem)
+    return document
+
+def convert_image(path, member, upload_folder, filename):
+    """Estrae un'immagine dall'archivio e la salva in WebP (eseguita nel pool)"""
+    with zipfile.ZipFile(path) as archive:
+        data = archive.read(member)
+    return convert_and_save_webp(
+        FileStorage(stream=io.BytesIO(data), filename=posixpath.basename(member)),
+        upload_folder,
+        filename=filename,
+    )
+
+def _remove_images(upload_folder, filenames):
+    """Cancella i WebP già generati per i documenti non importati"""
+    for filename in filenames:
+        try:
+            os.remove(os.path.join(upload_folder, filename))
+        except FileNotFoundError:
+            pass
+
+def find_documents(directory):
+    """I .docx della cartella in ordine di nome, esclusi i file di lock di Word"""
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith(".docx") and not name.startswith("~$")
+    )
+
+def import_documents(directory, author_id, category_id, upload_folder, workers=None):
+    """
+    Importa come bozze i manoscritti Word di una cartella.
+
+    I file già importati con lo stesso hash vengono saltati. Conversione dei
+    documenti e delle immagini avviene su un pool di processi; un file che
+    non si converte, o con un'immagine non convertita, finisce in `failed`
+    una sola volta senza bozza né hash registrato e senza i WebP già
+    generati, così viene ripreso all'import successivo. Le bozze vengono poi
+    scritte con un solo INSERT multiplo. Un documento modificato aggiorna la
+    sua bozza se non è ancora stata pubblicata, altrimenti ne crea una nuova.
+
+    Returns:
+        Un dict con i nomi dei file `created`, `updated`, `skipped` e la
+        lista `failed` di coppie (file, errore).
+    """
+    paths = {
+        os.path.relpath(path, directory): path for path in find_documents(directory)
+    }
+    hashes = {name: file_hash(path) for name, path in paths.items()}
+    summary = {"created": [], "updated": [], "skipped": [], "failed": []}
+
+    known_hashes = set(
+        db.session.scalars(
+            select(ImportedDocument.content_hash).where(
+                ImportedDocument.content_hash.in_(set(hashes.values()))
+            )
+        )
+    )
+    records = {
+        record.path: record
+        for record in ImportedDocument.query.filter(
+            ImportedDocument.path.in_(list(paths))
+        )
+    }
+    drafts = {
+        article.id
+        for article in Article.query.filter(
+            Article.id.in_([r.article_id for r in records.values() if r.article_id]),
+            Article.published.is_(False),
+        )
+    }
+
+    pending = {}
+    for name in paths:
+        if hashes[name] in known_hashes:
+            summary["skipped"].append(name)
+        else:
+            pending[name] = None
+
+    # Un errore per documento, anche se più immagini non si convertono
+    errors = {}
+    images = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parsing = {
+            pool.submit(parse_document, paths[name], hashes[name]): name
+            for name in pending
+        }
+        converting = {}
+        for future in as_completed(parsing):
+            name = parsing[future]
+            try:
+                document = future.result()
+                images[name] = [filename for _, filename in document["images"]]
+                for member, filename in document["images"]:
+                    converting[
+                        pool.submit(
+                            convert_image, paths[name], member, upload_folder, filename
+                        )
+                    ] = name
+            except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+                errors[name] = f"documento non valido: {e}"
+                continue
+            except Exception as e:
+                # Per esempio UnicodeDecodeError o BrokenProcessPool se un
+                # processo del pool muore: gli altri documenti proseguono
+                errors[name] = f"errore nella conversione: {e}"
+                continue
+            pending[name] = document
+
+        for future in as_completed(converting):
+            name = converting[future]
+            try:
+                future.result()
+            except Exception as e:
+                errors.setdefault(name, f"immagine: {e}")
+
+    # Niente bozza né hash registrato: il file si riprova al prossimo import
+    # invece di restare con un'immagine mancante
+    for name, error in errors.items():
+        summary["failed"].append((name, error))
+        del pending[name]
+    _remove_images(
+        upload_folder,
+        {filename for name in errors for filename in images.get(name, ())}
+        - {filename for name in pending for filename in images.get(name, ())},
+    )
+
+    slugs = set(db.session.scalars(select(Article.slug)))
+    new_articles, new_names, draft_updates = [], [], []
+    for name, document in pending.items():
+        values = {
+            "title": document["title"][:200],
+            "content": document["content"],
+            "excerpt": (document["excerpt"] or "")[:500],
+        }
+        record = records.get(name)
+        if record is not None and record.article_id in drafts:
+            draft_updates.append({"id": record.article_id, **values})
+            summary["updated"].append(name)
+            continue
+
+        slug = base = create_slug(values["title"]) or "articolo"
+        suffix = 2
+        while slug in slugs:
+            slug, suffix = f"{base}-{suffix}", suffix + 1
+        slugs.add(slug)
+
+        new_articles.append(
+            {
+                **values,
+                "slug": slug,
+                "author_id": author_id,
+                "category_id": category_id,
+                "published": False,
+                "featured": False,
+                "show_author_contacts": False,
+            }
+        )
+        new_names.append(name)
+        summary["created"].append(name)
+
+    article_ids = {}
+    if new_articles:
+        inserted = db.session.execute(
+            insert(Article).returning(Article.id, sort_by_parameter_order=True),
+            new_articles,
+        )
+        article_ids = dict(zip(new_names, inserted.scalars()))
+    if draft_updates:
+        db.session.execute(update(Article), draft_updates)
+        for values in draft_updates:
+            touch_article(values["id"])
+
+    new_records, record_updates = [], []
+    for name in pending:
+        record = records.get(name)
+        article_id = article_ids.get(name, record.article_id if record else None)
+        if record is None:
+            new_records.append(
+                {"path": name, "content_hash": hashes[name], "article_id": article_id}
+            )
+        else:
+            record_updates.append(
+                {
+                    "id": record.id,
+                    "content_hash": hashes[name],
+                    "article_id": article_id,
+                    "imported_at": datetime.utcnow(),
+                }
+            )
+    if new_records:
+        db.session.execute(insert(ImportedDocument), new_records)
+    if record_updates:
+        db.session.execute(update(ImportedDocument), record_updates)
+
+    db.session.commit()
+    return summary
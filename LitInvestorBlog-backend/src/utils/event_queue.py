@@ -0,0 +1,150 @@
+# LitInvestorBlog-backend/src/utils/event_queue.py
+
+import atexit
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from sqlalchemy import insert
+from src.extensions import db
+from src.models.page_event import PageEvent
+
+class EventQueue:
+    """
+    Coda in memoria, limitata, degli eventi di navigazione.
+
+    POST /api/events aggiunge gli eventi e risponde subito; un thread in
+    background li scrive in page_event ogni `flush_interval` secondi, o
+    prima se in coda ce ne sono almeno `batch_size`, con un INSERT
+    eseguito come executemany per ogni blocco. Oltre `max_size` eventi in
+    attesa i nuovi vengono scartati e contati: la richiesta non aspetta mai
+    una scrittura su SQLite. La coda viene svuotata anche alla chiusura del
+    processo.
+    """
+
+    def __init__(self, max_size=10000, batch_size=500, flush_interval=2):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.app = None
+        self._events = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._stats = {
+            "accepted": 0,
+            "dropped": 0,
+            "written": 0,
+            "failed_batches": 0,
+            "batches": 0,
+            "max_depth": 0,
+        }
+        self._last_flush_at = None
+
+    def init_app(self, app):
+        self.app = app
+        self.max_size = app.config.get("EVENT_QUEUE_MAX_SIZE", self.max_size)
+        self.batch_size = app.config.get("EVENT_QUEUE_BATCH_SIZE", self.batch_size)
+        self.flush_interval = app.config.get(
+            "EVENT_QUEUE_FLUSH_INTERVAL", self.flush_interval
+        )
+        app.extensions["event_queue"] = self
+        atexit.register(self.flush)
+
+    def put(self, events):
+        """
+        Accoda gli eventi (dict con le colonne di PageEvent).
+
+        Returns:
+            Quanti eventi sono stati accodati; gli altri sono stati scartati
+            perché la coda era piena.
+        """
+        with self._lock:
+            room = max(self.max_size - len(self._events), 0)
+            accepted = events[:room]
+            self._events.extend(accepted)
+            depth = len(self._events)
+            self._stats["accepted"] += len(accepted)
+            self._stats["dropped"] += len(events) - len(accepted)
+            self._stats["max_depth"] = max(self._stats["max_depth"], depth)
+
+        self._ensure_thread()
+        if depth >= self.batch_size:
+            self._wake.set()
+        return len(accepted)
+
+    def stats(self):
+        """Contatori della coda dall'avvio del processo"""
+        with self._lock:
+            depth = len(self._events)
+            stats = dict(self._stats)
+        return {
+            **stats,
+            "depth": depth,
+            "max_size": self.max_size,
+            "batch_size": self.batch_size,
+            "pressure": round(depth / self.max_size, 3) if self.max_size else 1.0,
+            "last_flush_at": self._last_flush_at,
+        }
+
+    def flush(self):
+        """Scrive tutti gli eventi in coda, un blocco di batch_size alla volta"""
+        if self.app is None:
+            return 0
+
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = [
+                        self._events.popleft()
+                        for _ in range(min(self.batch_size, len(self._events)))
+                    ]
+                if not batch:
+                    break
+
+                try:
+                    with self.app.app_context():
+                        db.session.execute(insert(PageEvent), batch)
+                        db.session.commit()
+                except Exception as e:
+                    logging.error(f"Errore nel salvataggio degli eventi: {e}")
+                    self._requeue(batch)
+                    break
+
+                written += len(batch)
+                with self._lock:
+                    self._stats["written"] += len(batch)
+                    self._stats["batches"] += 1
+
+        if written:
+            self._last_flush_at = datetime.utcnow().isoformat()
+        return written
+
+    def _requeue(self, batch):
+        """Rimette in testa un blocco non scritto, nei limiti di max_size"""
+        with self._lock:
+            self._stats["failed_batches"] += 1
+            room = max(self.max_size - len(self._events), 0)
+            kept = batch[:room]
+            self._events.extendleft(reversed(kept))
+            self._stats["dropped"] += len(batch) - len(kept)
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="event-queue-flush", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+event_queue = EventQueue()
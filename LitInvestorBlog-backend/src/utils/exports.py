@@ -0,0 +1,192 @@
+# LitInvestorBlog-backend/src/utils/exports.py
+
+import csv
+import io
+import json
+import logging
+import zlib
+from datetime import date, datetime
+from itertools import islice
+from flask import Response, stream_with_context
+
+# pyarrow è una dipendenza opzionale (requirements-dev.txt): senza, il
+# formato parquet non è disponibile
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Righe lette per volta dalle query di export (yield_per)
+EXPORT_BATCH_SIZE = 1000
+
+# Byte di testo accumulati prima di inviare un blocco al client
+CHUNK_SIZE = 64 * 1024
+
+# Righe per row group nei file Parquet
+ROW_GROUP_SIZE = 10000
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "Sì" if value else "No"
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return value
+
+def _json_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+def stream_csv(columns, rows):
+    """
+    Genera un file CSV a blocchi, senza tenerlo tutto in memoria.
+
+    `columns` è una sequenza di (nome, etichetta, tipo): l'intestazione usa
+    le etichette. `rows` viene consumato una riga alla volta (tipicamente
+    una query letta con yield_per) e il buffer viene svuotato a ogni blocco
+    inviato.
+
+    Un errore a metà export non può più diventare una risposta 500, perché
+    lo stato è già stato inviato: viene registrato e rilanciato, così il
+    server chiude la connessione senza il blocco finale e il client vede un
+    download interrotto invece di un file troncato ma apparentemente
+    completo.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([label for _, label, _ in columns])
+
+    try:
+        for row in rows:
+            writer.writerow([_csv_value(value) for value in row])
+            if buffer.tell() >= CHUNK_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    except Exception as e:
+        logging.error(f"Errore durante l'export CSV: {e}")
+        raise
+
+    yield buffer.getvalue()
+
+def stream_ndjson_gz(columns, rows):
+    """
+    Come stream_csv(), ma un oggetto JSON per riga compresso con gzip.
+
+    Le chiavi sono i nomi delle colonne e i valori mantengono il loro tipo
+    (le date diventano stringhe ISO 8601). Dopo un errore il file resta
+    senza il trailer gzip, quindi anche la decompressione lo segnala.
+    """
+    names = [name for name, _, _ in columns]
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    try:
+        for row in rows:
+            record = dict(zip(names, map(_json_value, row)))
+            line = json.dumps(record, ensure_ascii=False) + "\n"
+            chunk = compressor.compress(line.encode("utf-8"))
+            if chunk:
+                yield chunk
+    except Exception as e:
+        logging.error(f"Errore durante l'export NDJSON: {e}")
+        raise
+
+    yield compressor.flush()
+
+class _ChunkSink(io.RawIOBase):
+    """
+    File di sola scrittura che conserva solo i byte non ancora inviati.
+
+    Il writer Parquet usa tell() per gli offset del footer, quindi la
+    posizione continua a crescere anche quando i byte vengono consegnati.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+def stream_parquet(columns, rows):
+    """
+    Genera un file Parquet un row group alla volta.
+
+    Ogni gruppo di ROW_GROUP_SIZE righe viene convertito in colonne con lo
+    schema dato dai tipi di `columns` e inviato appena scritto. Il writer
+    viene chiuso, e il footer scritto, solo se tutte le righe sono state
+    lette: un errore a metà export viene registrato e rilanciato come in
+    stream_csv(), e il file resta senza footer, quindi illeggibile.
+    """
+    types = {
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "str": pa.string(),
+        "bool": pa.bool_(),
+        "datetime": pa.timestamp("us"),
+    }
+    schema = pa.schema([(name, types[kind]) for name, _, kind in columns])
+    sink = _ChunkSink()
+    rows = iter(rows)
+
+    # Niente with: __exit__ scriverebbe il footer anche dopo un errore
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        while batch := list(islice(rows, ROW_GROUP_SIZE)):
+            arrays = [
+                pa.array(values, type=field.type)
+                for values, field in zip(zip(*batch), schema)
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            yield sink.drain()
+    except Exception as e:
+        logging.error(f"Errore durante l'export Parquet: {e}")
+        raise
+
+    writer.close()
+    yield sink.drain()
+
+# Formato -> (estensione, mimetype, generatore)
+EXPORT_FORMATS = {
+    "csv": ("csv", "text/csv", stream_csv),
+    "ndjson.gz": ("ndjson.gz", "application/gzip", stream_ndjson_gz),
+    "parquet": ("parquet", "application/vnd.apache.parquet", stream_parquet),
+}
+
+def export_formats():
+    """I formati utilizzabili con le dipendenze installate"""
+    return [name for name in EXPORT_FORMATS if name != "parquet" or pq is not None]
+
+def export_response(columns, rows, format_type, filename):
+    """
+    Risposta in streaming per un export nel formato richiesto.
+
+    `filename` è senza estensione; il formato deve essere uno di quelli
+    restituiti da export_formats().
+    """
+    extension, mimetype, generate = EXPORT_FORMATS[format_type]
+    return Response(
+        stream_with_context(generate(columns, rows)),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}.{extension}"
+        },
+    )
@@ -0,0 +1,102 @@
+# LitInvestorBlog-backend/src/utils/http_cache.py
+
+import hashlib
+from datetime import timezone
+from functools import wraps
+from flask import make_response, request, session
+from sqlalchemy import select
+from src.extensions import db
+from src.models.catalog_version import CatalogVersion
+from src.utils.category_catalog import category_catalog
+from src.utils.user_version import user_version
+
+# Riga di catalog_version mantenuta dai trigger sulla tabella article
+ARTICLE_CATALOG_NAME = "article"
+
+def make_etag(*parts):
+    """ETag forte calcolato da una firma qualsiasi (tuple, numeri, date)"""
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:24]
+
+def _http_date(value):
+    """Le date HTTP hanno la precisione del secondo e sono in UTC"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.replace(microsecond=0)
+
+def not_modified(etag, last_modified=None):
+    """
+    Confronta i validatori con gli header condizionali della richiesta.
+
+    Restituisce una risposta 304 se il client ha già la versione corrente,
+    altrimenti None. If-None-Match, quando presente, ha la precedenza su
+    If-Modified-Since.
+    """
+    if request.if_none_match:
+        if not request.if_none_match.contains_weak(etag):
+            return None
+    elif last_modified is None or request.if_modified_since is None:
+        return None
+    elif _http_date(last_modified) > request.if_modified_since:
+        return None
+
+    return with_validators(make_response("", 304), etag, last_modified)
+
+def with_validators(response, etag, last_modified=None):
+    """Aggiunge ETag, Last-Modified e le direttive di rivalidazione"""
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = _http_date(last_modified)
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Cookie")
+    return response
+
+def conditional(probe):
+    """
+    Decorator per le GET che supportano richieste condizionali.
+
+    `probe` riceve gli stessi argomenti della view e restituisce la coppia
+    (firma, last_modified) calcolata con query economiche: se il client ha
+    già quella versione la view non viene eseguita e si risponde 304.
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            signature, last_modified = probe(*args, **kwargs)
+            etag = make_etag(signature, request.full_path, session.get("user_id"))
+
+            cached = not_modified(etag, last_modified)
+            if cached is not None:
+                return cached
+
+            response = make_response(f(*args, **kwargs))
+            if response.status_code == 200:
+                with_validators(response, etag, last_modified)
+            return response
+
+        return decorated_function
+
+    return decorator
+
+def articles_probe():
+    """
+    Firma della tabella article: la versione che i trigger incrementano a ogni
+    INSERT, UPDATE e DELETE (contatori compresi), più le versioni di
+    categorie e utenti da cui arrivano category_name, category_color e
+    author_name. Sono tutte letture per chiave primaria; senza Last-Modified,
+    che richiederebbe di leggere tutta la tabella.
+    """
+    version = db.session.scalar(
+        select(CatalogVersion.version).where(
+            CatalogVersion.name == ARTICLE_CATALOG_NAME
+        )
+    )
+    return (version or 0, related_versions()), None
+
+def related_versions():
+    """Versioni dei dati di altre tabelle riportati nelle risposte degli articoli"""
+    return category_catalog.version(), user_version.version()
+
+def categories_probe():
+    """Firma delle categorie: la versione del catalogo letta dal database"""
+    return category_catalog.version()
@@ -0,0 +1,93 @@
+# LitInvestorBlog-backend/src/utils/pagination.py
+
+import base64
+from flask import request
+from sqlalchemy import String, and_, literal, or_, type_coerce
+
+def encode_cursor(created_at, item_id):
+    """Codifica la chiave (created_at, id) dell'ultimo elemento in un cursore opaco"""
+    raw = f"{created_at}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor):
+    """Decodifica un cursore; solleva ValueError se non è valido"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at, item_id = raw.rsplit("|", 1)
+        return created_at, int(item_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Cursore non valido") from e
+
+def cursor_args():
+    """
+    Legge i parametri della paginazione a cursore dalla richiesta.
+
+    Restituisce None se il client non ha chiesto la modalità cursore
+    (parametro `cursor` assente), altrimenti la coppia (cursor, include_total).
+    Un `cursor` vuoto indica la prima pagina.
+    """
+    if "cursor" not in request.args:
+        return None
+
+    include_total = request.args.get("include_total", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    return request.args.get("cursor") or None, include_total
+
+def keyset_paginate(
+    query, created_col, id_col, cursor, per_page, include_total=False, descending=True
+):
+    """
+    Paginazione keyset ordinata per (created_at, id), decrescenti salvo
+    `descending=False`.
+
+    A differenza di .paginate() non usa OFFSET e non esegue COUNT(*) se non
+    richiesto esplicitamente, quindi ogni pagina costa come la prima.
+
+    Il cursore conserva created_at così come è salvato in SQLite e il
+    confronto avviene sul testo grezzo: nel database convivono formati con e
+    senza microsecondi, e convertirli in datetime renderebbe i confronti
+    incoerenti con l'ordinamento.
+
+    Returns:
+        Un dict con `items`, `next_cursor` (None sull'ultima pagina) e,
+        solo se include_total è vero, `total`.
+    """
+    total = query.order_by(None).count() if include_total else None
+
+    if cursor:
+        last_created_at, last_id = decode_cursor(cursor)
+        last_created_at = literal(last_created_at, String)
+        if descending:
+            after_last = or_(
+                created_col < last_created_at,
+                and_(created_col == last_created_at, id_col < last_id),
+            )
+        else:
+            after_last = or_(
+                created_col > last_created_at,
+                and_(created_col == last_created_at, id_col > last_id),
+            )
+        query = query.filter(after_last)
+
+    order = (created_col.desc(), id_col.desc()) if descending else (created_col, id_col)
+    rows = (
+        query.add_columns(type_coerce(created_col, String), id_col)
+        .order_by(None)
+        .order_by(*order)
+        .limit(per_page + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_cursor = encode_cursor(rows[-1][-2], rows[-1][-1])
+
+    result = {"items": [row[0] for row in rows], "next_cursor": next_cursor}
+    if include_total:
+        result["total"] = total
+    return result
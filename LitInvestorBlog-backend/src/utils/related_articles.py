@@ -0,0 +1,669 @@
+# LitInvestorBlog-backend/src/utils/related_articles.py
+
+import logging
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime
+import numpy as np
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import aliased
+from src.extensions import db
+from src.models.article import Article
+from src.models.like import ArticleLike
+from src.models.related import ArticleRelated, ArticleTerm, RelatedRefresh, RelatedTerm
+
+# Quanti vicini conservare per articolo
+TOP_K = 8
+
+# Peso dei tre segnali nel punteggio finale (la somma è 1)
+TEXT_WEIGHT = 0.7
+CATEGORY_WEIGHT = 0.15
+COLIKE_WEIGHT = 0.15
+
+# Il titolo e il riassunto contano più del corpo dell'articolo
+FIELD_WEIGHTS = (("title", 3), ("excerpt", 2), ("content", 1))
+
+# Termini con un IDF salvato in related_term, scelti tra i più diffusi
+MAX_TERMS = 20000
+
+# Termini conservati nel vettore di ogni articolo, i più pesanti
+VECTOR_TERMS = 64
+
+MAX_TERM_LENGTH = 64
+
+# Articoli letti per volta nella ricostruzione e righe per ogni INSERT
+CHUNK_SIZE = 256
+INSERT_BATCH_SIZE = 5000
+
+# Celle della matrice dei punteggi calcolate per volta nella ricostruzione
+BLOCK_CELLS = 4_000_000
+
+TAG_PATTERN = re.compile(r"<[^>]+>")
+WORD_PATTERN = re.compile(r"[^\W\d_]{3,}")
+
+STOPWORDS = frozenset(
+    """
+    alla alle allo anche ancora che chi come con cosa dal dalla dalle degli dei
+    del dell della delle dello dopo due gli hanno per perché più poi quale
+    quando quella quelle quello questa queste questo sono sua sue sui sul
+    sulla sulle suo tra una uno non nel nella nelle negli essere stato stata
+    ogni fra era può the and for with that this from are was were have has
+    not but you your our their its into over more than can will about
+    """.split()
+)
+
+def tokenize(*fields):
+    """Conteggio dei termini di un articolo, con i pesi di FIELD_WEIGHTS"""
+    terms = Counter()
+    for (_, weight), text in zip(FIELD_WEIGHTS, fields):
+        words = WORD_PATTERN.findall(TAG_PATTERN.sub(" ", text or "").lower())
+        for word in words:
+            if word not in STOPWORDS and len(word) <= MAX_TERM_LENGTH:
+                terms[word] += weight
+    return terms
+
+def term_vector(counts, idf, default_idf):
+    """
+    Vettore TF-IDF sparso con tf sublineare, troncato ai VECTOR_TERMS termini
+    più pesanti e normalizzato L2. I termini senza IDF nel vocabolario
+    ricevono `default_idf`, quello del termine più raro.
+
+    Returns:
+        La coppia (termini, pesi), con i pesi in un array NumPy.
+    """
+    terms = list(counts)
+    if not terms:
+        return [], np.zeros(0)
+
+    tf = np.fromiter(counts.values(), dtype=np.float64, count=len(terms))
+    weights = (1.0 + np.log(tf)) * np.fromiter(
+        (idf.get(term, default_idf) for term in terms),
+        dtype=np.float64,
+        count=len(terms),
+    )
+    if len(terms) > VECTOR_TERMS:
+        keep = np.argpartition(weights, -VECTOR_TERMS)[-VECTOR_TERMS:]
+        terms = [terms[index] for index in keep]
+        weights = weights[keep]
+
+    norm = np.linalg.norm(weights)
+    if not norm:
+        return [], np.zeros(0)
+    return terms, weights / norm
+
+def combine_scores(text, same_category, colikes):
+    """Punteggio finale a partire dai tre segnali, array allineati ai candidati"""
+    return (
+        TEXT_WEIGHT * text + CATEGORY_WEIGHT * same_category + COLIKE_WEIGHT * colikes
+    )
+
+def top_neighbours(ids, scores):
+    """
+    I TOP_K candidati con punteggio positivo, a parità di punteggio il più
+    recente, come lista (related_id, score) ordinata.
+    """
+    candidates = np.flatnonzero(scores > 0)
+    if len(candidates) > TOP_K:
+        threshold = np.partition(scores[candidates], -TOP_K)[-TOP_K]
+        candidates = candidates[scores[candidates] >= threshold]
+    order = np.lexsort((ids[candidates], scores[candidates]))[::-1][:TOP_K]
+    return [(int(ids[index]), float(scores[index])) for index in candidates[order]]
+
+def _gather(pointers, rows):
+    """Posizioni, in un array CSR, di tutti gli elementi delle righe indicate"""
+    starts = pointers[rows]
+    lengths = pointers[rows + 1] - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(lengths.sum()), lengths
+
+def score_arrays(scores):
+    """Un dict {article_id: punteggio} come coppia di array (ids, punteggi)"""
+    ids = np.fromiter(scores.keys(), dtype=np.int64, count=len(scores))
+    values = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+    return ids, values
+
+def term_matrix(vectors):
+    """
+    Matrice sparsa articoli x termini da una lista di vettori (termini, pesi).
+
+    Returns:
+        La matrice in formato CSR (puntatori, colonne, pesi) e la stessa
+        trasposta, con le righe di ogni termine, in formato CSC.
+    """
+    vocabulary = {}
+    columns = [
+        np.fromiter(
+            (vocabulary.setdefault(term, len(vocabulary)) for term in terms),
+            dtype=np.int64,
+            count=len(terms),
+        )
+        for terms, _ in vectors
+    ]
+    lengths = np.fromiter(
+        (len(terms) for terms, _ in vectors), dtype=np.int64, count=len(vectors)
+    )
+    pointers = np.concatenate(([0], np.cumsum(lengths)))
+    columns = np.concatenate(columns) if columns else np.zeros(0, dtype=np.int64)
+    weights = (
+        np.concatenate([weights for _, weights in vectors]) if vectors else np.zeros(0)
+    )
+
+    order = np.argsort(columns, kind="stable")
+    rows = np.repeat(np.arange(len(vectors)), lengths)[order]
+    term_pointers = np.searchsorted(columns[order], np.arange(len(vocabulary) + 1))
+    return (pointers, columns, weights), (term_pointers, rows, weights[order])
+
+def neighbour_records(article_id, neighbours):
+    """Righe di article_related per una lista (related_id, score) ordinata"""
+    return [
+        {
+            "article_id": article_id,
+            "rank": rank,
+            "related_id": related_id,
+            "score": score,
+        }
+        for rank, (related_id, score) in enumerate(neighbours, start=1)
+    ]
+
+def _insert_all(model, records):
+    for start in range(0, len(records), INSERT_BATCH_SIZE):
+        db.session.execute(insert(model), records[start : start + INSERT_BATCH_SIZE])
+
+class RelatedIndex:
+    """
+    Indice degli articoli correlati, salvato nella tabella article_related.
+
+    Il punteggio tra due articoli pubblicati è una media pesata di:
+    similarità coseno dei vettori TF-IDF di titolo, riassunto e contenuto;
+    appartenenza alla stessa categoria; similarità coseno dei like ricevuti
+    dagli stessi utenti. Per ogni articolo si salvano i TOP_K migliori con
+    punteggio positivo.
+
+    I vettori e i punteggi sono calcolati con NumPy; article_term e
+    related_term fanno da cache dei vettori e degli IDF, quindi un
+    aggiornamento incrementale calcola solo il vettore dell'articolo
+    modificato e lo confronta con gli articoli che condividono almeno un
+    termine, la categoria o un like. Gli aggiornamenti non avvengono nella
+    richiesta: gli articoli vengono accodati in related_refresh nella stessa
+    transazione della modifica e un thread in background (o
+    `flask refresh-related`) svuota la coda.
+    """
+
+    def __init__(self, refresh_interval=10):
+        self.refresh_interval = refresh_interval
+        self.app = None
+        self._lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def init_app(self, app):
+        self.app = app
+        self.refresh_interval = app.config.get(
+            "RELATED_REFRESH_INTERVAL", self.refresh_interval
+        )
+        app.extensions["related_index"] = self
+
+        if not event.contains(db.session, "after_commit", _wake_related_index):
+            event.listen(db.session, "after_commit", _wake_related_index)
+            event.listen(db.session, "after_soft_rollback", _discard_related_queue)
+
+    def enqueue(self, article_ids):
+        """
+        Accoda gli articoli nella transazione corrente; il thread viene
+        svegliato solo dopo il commit.
+        """
+        queued_at = datetime.utcnow()
+        records = [
+            {"article_id": article_id, "queued_at": queued_at}
+            for article_id in set(article_ids)
+        ]
+        if not records:
+            return
+        db.session.execute(
+            sqlite_insert(RelatedRefresh).on_conflict_do_nothing(
+                index_elements=[RelatedRefresh.article_id]
+            ),
+            records,
+        )
+        db.session.info["related_refresh_queued"] = True
+
+    def wake(self):
+        self._ensure_thread()
+        self._wake.set()
+
+    def drain(self):
+        """
+        Aggiorna gli articoli in coda e restituisce quanti ne ha elaborati.
+
+        La coda viene presa con un solo DELETE ... RETURNING, così due worker
+        non elaborano lo stesso articolo. Un errore su un articolo viene
+        registrato e non ferma gli altri; l'indice si riallinea con
+        `flask rebuild-related`.
+        """
+        with self._drain_lock:
+            article_ids = sorted(
+                db.session.scalars(
+                    delete(RelatedRefresh).returning(RelatedRefresh.article_id)
+                )
+            )
+            db.session.commit()
+
+            for article_id in article_ids:
+                try:
+                    self.refresh(article_id)
+                except Exception as e:
+                    db.session.rollback()
+                    logging.error(
+                        f"Errore nell'aggiornamento dei correlati di {article_id}: {e}"
+                    )
+        return len(article_ids)
+
+    def rebuild(self):
+        """
+        Ricalcola da zero vocabolario, vettori e vicini degli articoli
+        pubblicati. I punteggi si calcolano a blocchi di righe, moltiplicando
+        i vettori del blocco per la matrice sparsa di tutti gli altri.
+        """
+        categories = dict(
+            db.session.query(Article.id, Article.category_id).filter(
+                Article.published.is_(True)
+            )
+        )
+        article_ids = sorted(categories)
+        ids = np.array(article_ids, dtype=np.int64)
+        category_codes = np.array(
+            [categories[article_id] or -1 for article_id in article_ids],
+            dtype=np.int64,
+        )
+
+        counts = {}
+        for start in range(0, len(article_ids), CHUNK_SIZE):
+            texts = db.session.query(
+                Article.id, Article.title, Article.excerpt, Article.content
+            ).filter(Article.id.in_(article_ids[start : start + CHUNK_SIZE]))
+            for article_id, *fields in texts:
+                counts[article_id] = tokenize(*fields)
+
+        document_frequency = Counter()
+        for terms in counts.values():
+            document_frequency.update(terms.keys())
+        idf = {
+            term: math.log((1.0 + len(counts)) / (1.0 + frequency)) + 1.0
+            for term, frequency in document_frequency.most_common(MAX_TERMS)
+        }
+        default_idf = max(idf.values(), default=1.0)
+        vectors = [
+            term_vector(counts[article_id], idf, default_idf)
+            for article_id in article_ids
+        ]
+        del counts, document_frequency
+
+        db.session.execute(delete(RelatedTerm))
+        _insert_all(
+            RelatedTerm, [{"term": term, "idf": value} for term, value in idf.items()]
+        )
+        db.session.execute(delete(ArticleTerm))
+        _insert_all(
+            ArticleTerm,
+            [
+                {"article_id": article_id, "term": term, "weight": weight}
+                for article_id, (terms, weights) in zip(article_ids, vectors)
+                for term, weight in zip(terms, weights.tolist())
+            ],
+        )
+
+        (pointers, columns, weights), (term_pointers, term_rows, term_weights) = (
+            term_matrix(vectors)
+        )
+        del vectors
+        left, right, colike_values = self._all_colikes(article_ids)
+
+        db.session.execute(delete(ArticleRelated))
+        total = len(article_ids)
+        block_size = max(1, BLOCK_CELLS // max(total, 1))
+        records = []
+        for start in range(0, total, block_size):
+            stop = min(start + block_size, total)
+            height = stop - start
+
+            # Similarità coseno: ogni termine del blocco somma i suoi pesi
+            # sugli articoli che lo contengono
+            entries = np.arange(pointers[start], pointers[stop])
+            entry_rows = np.repeat(
+                np.arange(height), np.diff(pointers[start : stop + 1])
+            )
+            postings, lengths = _gather(term_pointers, columns[entries])
+            text = np.bincount(
+                np.repeat(entry_rows, lengths) * total + term_rows[postings],
+                weights=np.repeat(weights[entries], lengths) * term_weights[postings],
+                minlength=height * total,
+            ).reshape(height, total)
+
+            block_codes = category_codes[start:stop, None]
+            same_category = (block_codes == category_codes) & (block_codes >= 0)
+
+            colikes = np.zeros((height, total))
+            first, last = np.searchsorted(left, (start, stop))
+            colikes[left[first:last] - start, right[first:last]] = colike_values[
+                first:last
+            ]
+
+            scores = combine_scores(text, same_category, colikes)
+            scores[np.arange(height), np.arange(start, stop)] = 0.0
+            for offset, article_id in enumerate(article_ids[start:stop]):
+                records.extend(
+                    neighbour_records(article_id, top_neighbours(ids, scores[offset]))
+                )
+            if len(records) >= INSERT_BATCH_SIZE:
+                _insert_all(ArticleRelated, records)
+                records = []
+        _insert_all(ArticleRelated, records)
+
+        db.session.commit()
+        return total
+
+    def refresh(self, article_id):
+        """
+        Aggiornamento incrementale di un articolo modificato, pubblicato o
+        eliminato.
+
+        Ricalcola il vettore e i vicini dell'articolo; gli articoli che lo
+        avevano tra i vicini vengono ricalcolati, quelli in cui ora
+        entrerebbe (perché supera il loro ultimo vicino) lo ricevono al
+        posto dell'ultimo. Un articolo non più pubblicato viene tolto
+        dall'indice.
+
+        Gli IDF restano quelli dell'ultima ricostruzione completa, quindi i
+        punteggi possono discostarsi di poco da un `flask rebuild-related`.
+        """
+        article = (
+            db.session.query(
+                Article.category_id,
+                Article.published,
+                Article.title,
+                Article.excerpt,
+                Article.content,
+            )
+            .filter(Article.id == article_id)
+            .first()
+        )
+        holders = set(
+            db.session.scalars(
+                select(ArticleRelated.article_id).where(
+                    ArticleRelated.related_id == article_id
+                )
+            )
+        )
+        holders.discard(article_id)
+
+        db.session.execute(
+            delete(ArticleTerm).where(ArticleTerm.article_id == article_id)
+        )
+        db.session.execute(
+            delete(ArticleRelated).where(ArticleRelated.article_id == article_id)
+        )
+
+        accepted = set()
+        if article is not None and article.published:
+            counts = tokenize(article.title, article.excerpt, article.content)
+            terms, weights = term_vector(counts, *self._idf(counts))
+            _insert_all(
+                ArticleTerm,
+                [
+                    {"article_id": article_id, "term": term, "weight": weight}
+                    for term, weight in zip(terms, weights.tolist())
+                ],
+            )
+            ids, scores = self._scores(article_id, article.category_id, terms, weights)
+            _insert_all(
+                ArticleRelated,
+                neighbour_records(article_id, top_neighbours(ids, scores)),
+            )
+            offered = (scores > 0) & ~np.isin(
+                ids, np.fromiter(holders, dtype=np.int64, count=len(holders))
+            )
+            accepted = self._offer(
+                article_id, dict(zip(ids[offered].tolist(), scores[offered].tolist()))
+            )
+
+        for holder_id in holders:
+            self._rescore(holder_id)
+
+        db.session.commit()
+        return len(holders | accepted) + 1
+
+    def _idf(self, counts):
+        """IDF salvati per i termini indicati e quello di default"""
+        idf = dict(
+            db.session.query(RelatedTerm.term, RelatedTerm.idf).filter(
+                RelatedTerm.term.in_(list(counts))
+            )
+        )
+        default_idf = db.session.scalar(select(func.max(RelatedTerm.idf)))
+        return idf, default_idf or 1.0
+
+    def _scores(self, article_id, category_id, terms, weights):
+        """
+        Punteggi di un articolo verso i candidati, letti dal database.
+
+        Returns:
+            La coppia (ids, punteggi) di array allineati.
+        """
+        postings = []
+        if terms:
+            term_weights = dict(zip(terms, weights.tolist()))
+            postings = [
+                (other_id, weight * term_weights[term])
+                for other_id, term, weight in db.session.query(
+                    ArticleTerm.article_id, ArticleTerm.term, ArticleTerm.weight
+                ).filter(
+                    ArticleTerm.term.in_(terms), ArticleTerm.article_id != article_id
+                )
+            ]
+
+        same_category = []
+        if category_id is not None:
+            same_category = db.session.scalars(
+                select(Article.id).where(
+                    Article.published.is_(True),
+                    Article.category_id == category_id,
+                    Article.id != article_id,
+                )
+            ).all()
+
+        colike_ids, colike_values = score_arrays(self._colikes(article_id))
+        posting_ids = np.array([other_id for other_id, _ in postings], dtype=np.int64)
+        products = np.array([product for _, product in postings], dtype=np.float64)
+        category_ids = np.array(same_category, dtype=np.int64)
+
+        ids, inverse = np.unique(
+            np.concatenate((posting_ids, category_ids, colike_ids)),
+            return_inverse=True,
+        )
+        posting_rows, category_rows, colike_rows = np.split(
+            inverse, (len(posting_ids), len(posting_ids) + len(category_ids))
+        )
+        text = np.bincount(posting_rows, weights=products, minlength=len(ids))
+        same = np.zeros(len(ids))
+        same[category_rows] = 1.0
+        colikes = np.zeros(len(ids))
+        colikes[colike_rows] = colike_values
+        return ids, combine_scores(text, same, colikes)
+
+    def _colikes(self, article_id):
+        """Similarità dei like di un articolo verso gli articoli pubblicati"""
+        first, second = aliased(ArticleLike), aliased(ArticleLike)
+        shared = dict(
+            db.session.query(second.article_id, func.count())
+            .select_from(first)
+            .join(second, first.user_id == second.user_id)
+            .join(Article, Article.id == second.article_id)
+            .filter(
+                first.article_id == article_id,
+                second.article_id != article_id,
+                Article.published.is_(True),
+            )
+            .group_by(second.article_id)
+        )
+        if not shared:
+            return {}
+
+        totals = dict(
+            db.session.query(ArticleLike.article_id, func.count())
+            .filter(ArticleLike.article_id.in_([article_id, *shared]))
+            .group_by(ArticleLike.article_id)
+        )
+        return {
+            other_id: count / math.sqrt(totals[article_id] * totals[other_id])
+            for other_id, count in shared.items()
+        }
+
+    def _all_colikes(self, article_ids):
+        """
+        Come _colikes(), per tutte le coppie di articoli pubblicati.
+
+        Returns:
+            Tre array (riga, colonna, similarità) con le posizioni degli
+            articoli in `article_ids`, ordinati per riga.
+        """
+        positions = {article_id: index for index, article_id in enumerate(article_ids)}
+        first, second = aliased(ArticleLike), aliased(ArticleLike)
+        pairs = (
+            db.session.query(first.article_id, second.article_id, func.count())
+            .join(second, first.user_id == second.user_id)
+            .filter(first.article_id != second.article_id)
+            .group_by(first.article_id, second.article_id)
+        )
+        totals = dict(
+            db.session.query(ArticleLike.article_id, func.count()).group_by(
+                ArticleLike.article_id
+            )
+        )
+
+        left, right, similarity = [], [], []
+        for first_id, second_id, shared in pairs:
+            if first_id in positions and second_id in positions:
+                left.append(positions[first_id])
+                right.append(positions[second_id])
+                similarity.append(
+                    shared / math.sqrt(totals[first_id] * totals[second_id])
+                )
+        order = np.argsort(np.array(left, dtype=np.int64), kind="stable")
+        return (
+            np.array(left, dtype=np.int64)[order],
+            np.array(right, dtype=np.int64)[order],
+            np.array(similarity, dtype=np.float64)[order],
+        )
+
+    def _rescore(self, article_id):
+        """Ricalcola i vicini di un articolo dal suo vettore salvato"""
+        db.session.execute(
+            delete(ArticleRelated).where(ArticleRelated.article_id == article_id)
+        )
+        category = db.session.execute(
+            select(Article.category_id).where(
+                Article.id == article_id, Article.published.is_(True)
+            )
+        ).first()
+        if category is None:
+            return
+
+        vector = db.session.query(ArticleTerm.term, ArticleTerm.weight).filter(
+            ArticleTerm.article_id == article_id
+        )
+        terms = []
+        weights = []
+        for term, weight in vector:
+            terms.append(term)
+            weights.append(weight)
+        ids, scores = self._scores(
+            article_id, category.category_id, terms, np.array(weights)
+        )
+        _insert_all(
+            ArticleRelated, neighbour_records(article_id, top_neighbours(ids, scores))
+        )
+
+    def _offer(self, article_id, scores):
+        """
+        Inserisce l'articolo tra i vicini dei candidati in cui entra.
+
+        Il punteggio è simmetrico: `scores` dà anche la posizione
+        dell'articolo nella classifica di ciascun candidato, che lo accoglie
+        se ha meno di TOP_K vicini o se supera l'ultimo.
+        """
+        if not scores:
+            return set()
+
+        current = defaultdict(list)
+        rows = db.session.query(
+            ArticleRelated.article_id, ArticleRelated.related_id, ArticleRelated.score
+        ).filter(ArticleRelated.article_id.in_(list(scores)))
+        for other_id, related_id, score in rows:
+            current[other_id].append((related_id, score))
+
+        accepted = {
+            other_id
+            for other_id, score in scores.items()
+            if len(current[other_id]) < TOP_K
+            or score > min(value for _, value in current[other_id])
+        }
+        if not accepted:
+            return accepted
+
+        db.session.execute(
+            delete(ArticleRelated).where(ArticleRelated.article_id.in_(accepted))
+        )
+        records = []
+        for other_id in accepted:
+            candidates = dict(current[other_id])
+            candidates[article_id] = scores[other_id]
+            records.extend(
+                neighbour_records(other_id, top_neighbours(*score_arrays(candidates)))
+            )
+        _insert_all(ArticleRelated, records)
+        return accepted
+
+    def _ensure_thread(self):
+        if self.app is None:
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="related-refresh", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.refresh_interval)
+            self._wake.clear()
+            try:
+                with self.app.app_context():
+                    self.drain()
+            except Exception as e:
+                logging.error(f"Errore nella coda degli articoli correlati: {e}")
+
+def _wake_related_index(session):
+    if session.info.pop("related_refresh_queued", False):
+        related_index.wake()
+
+def _discard_related_queue(session, previous_transaction):
+    if not session.in_transaction():
+        session.info.pop("related_refresh_queued", None)
+
+related_index = RelatedIndex()
+
+def queue_related_refresh(article_ids):
+    """
+    Accoda l'aggiornamento dell'indice per gli articoli indicati.
+
+    Va chiamata prima del commit della modifica, nella stessa transazione:
+    la richiesta non aspetta il ricalcolo, che avviene in background.
+    """
+    related_index.enqueue(article_ids)
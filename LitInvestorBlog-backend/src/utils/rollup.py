@@ -0,0 +1,196 @@
+# LitInvestorBlog-backend/src/utils/rollup.py
+
+from datetime import datetime, time, timedelta
+from sqlalchemy import delete, func, insert, literal, select, union_all
+from src.extensions import db
+from src.models.article import Article
+from src.models.comment import Comment
+from src.models.donation import Donation
+from src.models.like import ArticleLike
+from src.models.rollup import AnalyticsDaily, ArticleDaily, RollupState
+from src.models.share import Share
+from src.models.user import User
+from src.utils.time_series import daily_series
+
+ROLLUP_NAME = "analytics"
+
+# Giorni prima dell'ultima esecuzione che ogni rollup ricalcola comunque:
+# coprono le righe scritte in ritardo e le cancellazioni recenti
+TRAILING_DAYS = 2
+
+SITE_METRICS = (
+    "articles",
+    "users",
+    "comments",
+    "likes",
+    "shares",
+    "donations",
+    "revenue",
+)
+ARTICLE_METRICS = ("likes", "comments", "shares")
+
+def _site_sources():
+    """Tabelle sorgente di analytics_daily: (colonna data, aggregati, filtri)"""
+    completed = (Donation.status == "completed",)
+    return (
+        (Article.created_at, {"articles": func.count(Article.id)}, ()),
+        (User.created_at, {"users": func.count(User.id)}, ()),
+        (Comment.created_at, {"comments": func.count(Comment.id)}, ()),
+        (ArticleLike.created_at, {"likes": func.count(ArticleLike.id)}, ()),
+        (Share.created_at, {"shares": func.count(Share.id)}, ()),
+        (
+            Donation.created_at,
+            {
+                "donations": func.count(Donation.id),
+                "revenue": func.sum(Donation.amount),
+            },
+            completed,
+        ),
+    )
+
+def _article_sources(article_id=None):
+    """Come _site_sources() per article_daily, su uno o tutti gli articoli"""
+    sources = []
+    for model, metric in zip((ArticleLike, Comment, Share), ARTICLE_METRICS):
+        filters = () if article_id is None else (model.article_id == article_id,)
+        sources.append((model.created_at, {metric: func.count(model.id)}, filters))
+    return sources
+
+def _rollup_query(sources, metrics, since, by_article=False):
+    """
+    SELECT dei totali per giorno (e per articolo) di più tabelle sorgente.
+
+    Ogni sorgente viene raggruppata per conto suo; le parziali sono unite
+    con UNION ALL, con zero nelle metriche che la sorgente non fornisce, e
+    sommate per chiave.
+    """
+    parts = []
+    for column, aggregates, filters in sources:
+        keys = [func.date(column).label("day")]
+        if by_article:
+            keys.insert(0, column.class_.article_id.label("article_id"))
+        values = [aggregates.get(name, literal(0)).label(name) for name in metrics]
+        query = select(*keys, *values).where(column.isnot(None), *filters)
+        if since is not None:
+            query = query.where(column >= since)
+        parts.append(query.group_by(*keys))
+
+    combined = union_all(*parts).subquery()
+    keys = [combined.c.day]
+    if by_article:
+        keys.insert(0, combined.c.article_id)
+    return select(*keys, *[func.sum(combined.c[name]) for name in metrics]).group_by(
+        *keys
+    )
+
+def rollup_watermark():
+    """Istante dell'ultimo rollup, None se non è mai stato eseguito"""
+    return db.session.scalar(
+        select(RollupState.watermark).where(RollupState.name == ROLLUP_NAME)
+    )
+
+def run_rollup(full=False, now=None):
+    """
+    Aggiorna analytics_daily e article_daily.
+
+    Vengono ricalcolati solo i giorni dal giorno dell'ultima esecuzione,
+    meno TRAILING_DAYS, in poi: ogni esecuzione legge le righe sorgente di
+    quei pochi giorni grazie agli indici su created_at. Con `full` (o alla
+    prima esecuzione) le tabelle vengono ricostruite da zero, cosa che
+    serve dopo cancellazioni di dati più vecchi della finestra.
+
+    Returns:
+        Il primo giorno ricalcolato, None per una ricostruzione completa.
+    """
+    now = now or datetime.utcnow()
+    watermark = None if full else rollup_watermark()
+    since_day = None
+    since = None
+    if watermark is not None:
+        since_day = watermark.date() - timedelta(days=TRAILING_DAYS)
+        since = datetime.combine(since_day, time.min)
+
+    _replace_days(
+        AnalyticsDaily,
+        ["day", *SITE_METRICS],
+        _rollup_query(_site_sources(), SITE_METRICS, since),
+        since_day,
+    )
+    _replace_days(
+        ArticleDaily,
+        ["article_id", "day", *ARTICLE_METRICS],
+        _rollup_query(_article_sources(), ARTICLE_METRICS, since, by_article=True),
+        since_day,
+    )
+
+    db.session.merge(RollupState(name=ROLLUP_NAME, watermark=now))
+    db.session.commit()
+    return since_day
+
+def _replace_days(model, columns, query, since_day):
+    """Sostituisce le righe di `model` dal giorno `since_day` in poi"""
+    stale = delete(model)
+    if since_day is not None:
+        stale = stale.where(model.day >= since_day)
+    db.session.execute(stale)
+    db.session.execute(insert(model).from_select(columns, query))
+
+def _read_series(model, metrics, sources, start_day, *filters):
+    """
+    Serie giornaliera che unisce il rollup e le righe più recenti.
+
+    I giorni precedenti a quello dell'ultimo rollup vengono da `model`; dal
+    giorno del rollup in poi si raggruppano le tabelle sorgente, una query
+    per sorgente limitata a quei giorni. Senza rollup tutto viene dalle
+    sorgenti.
+    """
+    watermark = rollup_watermark()
+    live_day = start_day
+    series = {}
+
+    if watermark is not None:
+        live_day = watermark.date()
+        if start_day is not None:
+            live_day = max(live_day, start_day)
+        query = (
+            db.session.query(model.day, *[getattr(model, name) for name in metrics])
+            .filter(*filters)
+            .filter(model.day < live_day)
+        )
+        if start_day is not None:
+            query = query.filter(model.day >= start_day)
+        for day, *values in query:
+            series[day.isoformat()] = values
+
+    live_start = None if live_day is None else datetime.combine(live_day, time.min)
+    for column, aggregates, source_filters in sources:
+        positions = [metrics.index(name) for name in aggregates]
+        rows = daily_series(
+            column, *aggregates.values(), filters=source_filters, start=live_start
+        )
+        for day, values in rows.items():
+            point = series.setdefault(day, [0] * len(metrics))
+            for position, value in zip(positions, values):
+                point[position] = value or 0
+
+    return {day: tuple(values) for day, values in series.items()}
+
+def site_daily(start_day=None):
+    """
+    Totali del sito per giorno, da `start_day` (None per tutto lo storico).
+
+    Returns:
+        Un dict "YYYY-MM-DD" -> tupla nell'ordine di SITE_METRICS, solo per
+        i giorni che hanno dati.
+    """
+    return _read_series(AnalyticsDaily, SITE_METRICS, _site_sources(), start_day)
+
+def article_daily(article_id, start_day=None):
+    """Come site_daily() per un articolo, nell'ordine di ARTICLE_METRICS"""
+    return _read_series(
+        ArticleDaily,
+        ARTICLE_METRICS,
+        _article_sources(article_id),
+        start_day,
+        ArticleDaily.article_id == article_id,
+    )
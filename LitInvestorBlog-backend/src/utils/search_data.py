@@ -0,0 +1,212 @@
+# LitInvestorBlog-backend/src/utils/search_data.py
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime
+from collections import OrderedDict
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload, load_only
+from src.extensions import db
+from src.models.article import Article
+from src.models.category import Category
+from src.models.search_snapshot import SearchDataSnapshot
+
+SNIPPET_LENGTH = 150
+
+class SearchDataStore:
+    """
+    Payload di /api/search-data costruito una sola volta e versionato.
+
+    La versione è l'hash del contenuto, quindi worker diversi che costruiscono
+    lo stesso payload ottengono la stessa versione. Le ultime
+    `history_size` versioni sono salvate in search_data_snapshot, così un
+    delta richiesto con `since` si calcola su qualunque worker; quelle già
+    lette restano anche in memoria.
+    """
+
+    def __init__(self, history_size=20):
+        self.history_size = history_size
+        self._lock = threading.Lock()
+        self._probe = None
+        self._snapshot = None
+        self._history = OrderedDict()
+
+    def _probe_database(self):
+        """Firma economica dei dati da cui dipende il payload"""
+        articles = (
+            db.session.query(func.count(Article.id), func.max(Article.updated_at))
+            .filter(Article.published.is_(True))
+            .one()
+        )
+        categories = db.session.query(func.group_concat(Category.name, "|")).scalar()
+        return tuple(articles) + (categories,)
+
+    def _build_items(self):
+        snippet_source = func.substr(Article.content, 1, SNIPPET_LENGTH + 1)
+        rows = (
+            db.session.query(Article, snippet_source)
+            .options(
+                load_only(Article.id, Article.title, Article.slug, Article.excerpt),
+                joinedload(Article.category).load_only(Category.name),
+            )
+            .filter(Article.published.is_(True))
+            .order_by(Article.id)
+            .all()
+        )
+
+        items = []
+        for article, article_content in rows:
+            article_content = article_content or ""
+            if article.excerpt:
+                snippet = article.excerpt
+            else:
+                snippet = (
+                    (article_content[:SNIPPET_LENGTH] + "...")
+                    if len(article_content) > SNIPPET_LENGTH
+                    else article_content
+                )
+
+            items.append(
+                {
+                    "type": "article",
+                    "title": article.title,
+                    "slug": f"/article/{article.slug}",
+                    "category": (
+                        article.category.name if article.category else "Uncategorized"
+                    ),
+                    "content_snippet": snippet,
+                }
+            )
+        return items
+
+    def snapshot(self):
+        """
+        Restituisce il payload corrente, ricostruendolo solo se i dati sono
+        cambiati.
+
+        Returns:
+            Un dict con `version`, `items`, `body` (JSON in bytes) e `gzip`
+            (lo stesso JSON già compresso).
+        """
+        probe = self._probe_database()
+        with self._lock:
+            if self._snapshot is not None and probe == self._probe:
+                return self._snapshot
+
+            items = self._build_items()
+            body = json.dumps(
+                items, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+            ).encode("utf-8")
+            version = hashlib.sha256(body).hexdigest()[:16]
+
+            self._snapshot = {
+                "version": version,
+                "items": items,
+                "body": body,
+                "gzip": gzip.compress(body, compresslevel=9, mtime=0),
+            }
+            self._probe = probe
+            self._remember(version, items)
+            self._persist(version, self._snapshot["gzip"])
+
+            return self._snapshot
+
+    def _remember(self, version, items):
+        self._history[version] = {item["slug"]: item for item in items}
+        self._history.move_to_end(version)
+        while len(self._history) > self.history_size:
+            self._history.popitem(last=False)
+
+    def _persist(self, version, payload):
+        """
+        Salva la versione per gli altri worker e scarta le più vecchie.
+
+        La scrittura usa una connessione propria con la sua transazione: la
+        sessione della richiesta, che è una GET, non viene né confermata né
+        annullata.
+        """
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(
+                    sqlite_insert(SearchDataSnapshot)
+                    .values(
+                        version=version, payload=payload, created_at=datetime.utcnow()
+                    )
+                    .on_conflict_do_update(
+                        index_elements=[SearchDataSnapshot.version],
+                        set_={"created_at": datetime.utcnow()},
+                    )
+                )
+                recent = (
+                    select(SearchDataSnapshot.version)
+                    .order_by(SearchDataSnapshot.created_at.desc())
+                    .limit(self.history_size)
+                )
+                conn.execute(
+                    delete(SearchDataSnapshot).where(
+                        SearchDataSnapshot.version.not_in(recent.scalar_subquery())
+                    )
+                )
+        except Exception as e:
+            logging.error(f"Errore nel salvataggio della versione di ricerca: {e}")
+
+    def _load_version(self, version):
+        """Gli elementi di una versione, dalla memoria o dal database"""
+        with self._lock:
+            items = self._history.get(version)
+        if items is not None:
+            return items
+
+        payload = db.session.scalar(
+            select(SearchDataSnapshot.payload).where(
+                SearchDataSnapshot.version == version
+            )
+        )
+        if payload is None:
+            return None
+
+        items = json.loads(gzip.decompress(payload))
+        with self._lock:
+            self._remember(version, items)
+            return self._history[version]
+
+    def delta(self, since):
+        """
+        Differenze tra la versione `since` e quella corrente.
+
+        Se `since` non è tra le versioni conservate restituisce tutto il
+        payload come `added` con `reset` a True, così il client riparte da
+        zero.
+        """
+        snapshot = self.snapshot()
+        previous = self._load_version(since)
+
+        if previous is None:
+            return {
+                "version": snapshot["version"],
+                "since": since,
+                "reset": True,
+                "added": snapshot["items"],
+                "changed": [],
+                "removed": [],
+            }
+
+        current = {item["slug"]: item for item in snapshot["items"]}
+        return {
+            "version": snapshot["version"],
+            "since": since,
+            "reset": False,
+            "added": [item for slug, item in current.items() if slug not in previous],
+            "changed": [
+                item
+                for slug, item in current.items()
+                if slug in previous and previous[slug] != item
+            ],
+            "removed": [slug for slug in previous if slug not in current],
+        }
+
+search_data_store = SearchDataStore()
@@ -0,0 +1,116 @@
+# LitInvestorBlog-backend/src/utils/search_index.py
+
+import html
+import re
+import sqlite3
+from sqlalchemy import column, event, func, literal_column, table, text
+from sqlalchemy.engine import Engine
+from src.extensions import db
+from src.models.article import Article
+
+# Tabella virtuale FTS5 ricreata dalla migrazione c4a7e2f9d158 sulla vista
+# article_search_text (il contenuto senza tag) e tenuta allineata ad
+# `article` dai trigger article_fts_ai/ad/au
+article_fts = table("article_fts", column("rowid"))
+
+# Pesi bm25 per colonna: title, excerpt, content
+BM25_WEIGHTS = (10.0, 5.0, 1.0)
+
+SNIPPET_TOKENS = 16
+
+# Blocchi il cui testo non fa parte dell'articolo
+HIDDEN_PATTERN = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+TAG_PATTERN = re.compile(r"<[^>]*>")
+SPACE_PATTERN = re.compile(r"\s+")
+
+# Delimitatori del termine trovato da snippet(): caratteri di controllo che
+# strip_html toglie dal testo, così non si confondono con il contenuto
+MARK_START = "\x02"
+MARK_END = "\x03"
+
+def strip_html(value):
+    """Testo semplice dell'HTML di un articolo, come lo indicizza article_fts"""
+    if value is None:
+        return None
+    value = html.unescape(TAG_PATTERN.sub(" ", HIDDEN_PATTERN.sub(" ", value)))
+    value = value.replace(MARK_START, " ").replace(MARK_END, " ")
+    return SPACE_PATTERN.sub(" ", value).strip()
+
+@event.listens_for(Engine, "connect")
+def register_strip_html(dbapi_connection, connection_record):
+    """
+    Registra strip_html() come funzione SQL su ogni connessione SQLite.
+
+    La usano la vista article_search_text e i trigger di article_fts, quindi
+    chi scrive su `article` da una connessione senza la funzione (per esempio
+    la shell sqlite3) riceve "no such function: strip_html".
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_function(
+            "strip_html", 1, strip_html, deterministic=True
+        )
+
+def _highlighted(snippet):
+    """Escapa il frammento di testo e trasforma i delimitatori in <mark>"""
+    for old, new in (
+        ("&", "&amp;"),
+        ("<", "&lt;"),
+        (">", "&gt;"),
+        (MARK_START, "<mark>"),
+        (MARK_END, "</mark>"),
+    ):
+        snippet = func.replace(snippet, old, new)
+    return snippet
+
+def build_match_query(search_query):
+    """
+    Converte il testo digitato dall'utente in un'espressione MATCH di FTS5.
+
+    Ogni parola viene quotata (niente sintassi FTS5 dall'esterno) e tutte
+    devono comparire. L'ultima parola, e quelle terminate con "*", sono
+    trattate come prefissi, così la ricerca funziona anche mentre si digita.
+    Restituisce None se non resta nessuna parola utile.
+    """
+    terms = re.findall(r"\w+\*?", search_query, re.UNICODE)
+    if not terms:
+        return None
+
+    parts = []
+    for index, term in enumerate(terms):
+        word = term.rstrip("*")
+        is_prefix = term.endswith("*") or index == len(terms) - 1
+        parts.append(f'"{word}"*' if is_prefix else f'"{word}"')
+    return " ".join(parts)
+
+def search_articles(query, match_query):
+    """
+    Restringe una query su Article ai risultati della ricerca full-text.
+
+    Ordina per rilevanza bm25 e aggiunge la colonna `search_snippet` con il
+    frammento di testo evidenziato: gli elementi risultanti sono quindi righe
+    (Article, search_snippet). Il frammento viene dal testo senza tag ed è
+    escapato, quindi l'unico HTML che contiene sono i <mark>.
+    """
+    fts = literal_column("article_fts")
+    rank = func.bm25(fts, *BM25_WEIGHTS)
+    snippet = _highlighted(
+        func.snippet(fts, -1, MARK_START, MARK_END, "…", SNIPPET_TOKENS)
+    )
+
+    return (
+        query.join(article_fts, article_fts.c.rowid == Article.id)
+        .filter(
+            text("article_fts MATCH :match_query").bindparams(match_query=match_query)
+        )
+        .add_columns(snippet.label("search_snippet"))
+        .order_by(None)
+        .order_by(rank)
+    )
+
+def rebuild_search_index():
+    """Ricostruisce l'indice FTS5 da zero a partire dalla tabella article"""
+    db.session.execute(
+        text("INSERT INTO article_fts(article_fts) VALUES ('rebuild')")
+    )
+    db.session.commit()
+    return db.session.execute(text("SELECT count(*) FROM article_fts")).scalar()
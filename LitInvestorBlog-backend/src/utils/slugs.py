@@ -0,0 +1,9 @@
+# LitInvestorBlog-backend/src/utils/slugs.py
+
+import re
+
+def create_slug(text):
+    """Crea uno slug da un titolo o da un nome"""
+    slug = re.sub(r"[^\w\s-]", "", text.lower())
+    slug = re.sub(r"[-\s]+", "-", slug)
+    return slug.strip("-")
@@ -0,0 +1,114 @@
+# LitInvestorBlog-backend/src/utils/time_series.py
+
+from datetime import date, datetime, timedelta
+from sqlalchemy import func
+from src.extensions import db
+
+# Giorni coperti da ciascun range della dashboard; None indica tutto lo storico
+RANGE_DAYS = {"7d": 7, "30d": 30, "90d": 90, "1y": 365, "all": None}
+DEFAULT_RANGE = "30d"
+
+# Granularità ammesse per le serie, dalla più fine alla più grossa
+BUCKETS = ("day", "week", "month")
+
+def resolve_range(time_range, now=None):
+    """
+    Inizio del periodo richiesto e del periodo precedente di pari durata.
+
+    Un range sconosciuto vale DEFAULT_RANGE; per "all" entrambi gli estremi
+    sono None.
+    """
+    now = now or datetime.utcnow()
+    days = RANGE_DAYS.get(time_range, RANGE_DAYS[DEFAULT_RANGE])
+    if days is None:
+        return None, None
+    start_date = now - timedelta(days=days)
+    return start_date, start_date - timedelta(days=days)
+
+def daily_series(column, *aggregates, filters=(), start=None, end=None):
+    """
+    Aggregati per giorno con un solo GROUP BY date(column).
+
+    Returns:
+        Un dict "YYYY-MM-DD" -> tupla degli aggregati, solo per i giorni che
+        hanno dati.
+    """
+    day = func.date(column)
+    query = db.session.query(day, *aggregates).filter(*filters)
+    if start is not None:
+        query = query.filter(column >= start)
+    if end is not None:
+        query = query.filter(column < end)
+    return {row[0]: tuple(row[1:]) for row in query.group_by(day)}
+
+def first_day(*series, default=None):
+    """Il primo giorno con dati tra più serie, per i range senza inizio"""
+    days = [day for values in series for day in values]
+    if not days:
+        return default
+    return date.fromisoformat(min(days))
+
+def bucket_start(day, bucket):
+    """Il primo giorno del bucket ("day", "week" o "month") che contiene `day`"""
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+def next_bucket(day, bucket):
+    """Il primo giorno del bucket successivo a quello che inizia in `day`"""
+    if bucket == "week":
+        return day + timedelta(days=7)
+    if bucket == "month":
+        return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return day + timedelta(days=1)
+
+def bucket_count(start_day, end_day, bucket):
+    """Quanti bucket servono per coprire i giorni da start_day a end_day"""
+    if bucket == "month":
+        months = (end_day.year - start_day.year) * 12
+        return months + end_day.month - start_day.month + 1
+    first = bucket_start(start_day, bucket)
+    days = (bucket_start(end_day, bucket) - first).days
+    return days // (7 if bucket == "week" else 1) + 1
+
+def zero_fill(start_day, end_day, series, names, bucket="day"):
+    """
+    Una voce per ogni bucket da start_day a end_day inclusi.
+
+    I valori dei giorni di `series` compresi nell'intervallo vengono sommati
+    nel loro bucket, identificato dal suo primo giorno; i bucket senza dati
+    valgono 0. `names` sono le chiavi da dare agli aggregati nell'ordine in
+    cui compaiono nelle tuple.
+    """
+    totals = {}
+    for key, values in series.items():
+        day = date.fromisoformat(key)
+        if start_day <= day <= end_day:
+            point = totals.setdefault(bucket_start(day, bucket), [0] * len(names))
+            for position, value in enumerate(values):
+                point[position] += value or 0
+
+    empty = (0,) * len(names)
+    points = []
+    current = bucket_start(start_day, bucket)
+    while current <= end_day:
+        values = totals.get(current, empty)
+        points.append({"date": current.isoformat(), **dict(zip(names, values))})
+        current = next_bucket(current, bucket)
+    return points
+
+def series_totals(series, width, start_day=None, end_day=None):
+    """
+    Somma, posizione per posizione, i valori dei giorni da start_day
+    incluso a end_day escluso; None lascia l'estremo aperto.
+    """
+    totals = [0] * width
+    start = start_day.isoformat() if start_day is not None else None
+    end = end_day.isoformat() if end_day is not None else None
+    for day, values in series.items():
+        if (start is None or day >= start) and (end is None or day < end):
+            for position, value in enumerate(values):
+                totals[position] += value or 0
+    return totals
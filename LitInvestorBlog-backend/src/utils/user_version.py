@@ -0,0 +1,71 @@
+# LitInvestorBlog-backend/src/utils/user_version.py
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from src.extensions import db
+from src.models.catalog_version import CatalogVersion
+from src.models.user import User
+
+CATALOG_NAME = "user"
+
+# Campi degli utenti che finiscono nelle risposte di articoli e commenti
+PUBLIC_USER_FIELDS = (
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "avatar_url",
+    "linkedin_url",
+)
+
+class UserVersion:
+    """
+    Versione dei dati pubblici degli utenti, da usare nelle firme degli ETag.
+
+    Le liste e il dettaglio degli articoli riportano nome e contatti
+    dell'autore: un commit che modifica uno di quei campi (o elimina un
+    utente) incrementa la riga "user" di catalog_version nella stessa
+    transazione, così la firma cambia anche negli altri worker. La lettura
+    è per chiave primaria.
+    """
+
+    def init_app(self, app):
+        app.extensions["user_version"] = self
+
+        if not event.contains(db.session, "before_flush", _bump_user_version):
+            event.listen(db.session, "before_flush", _bump_user_version)
+
+    def version(self):
+        """Versione corrente, 0 se nessun utente è mai stato modificato"""
+        return (
+            db.session.scalar(
+                select(CatalogVersion.version).where(
+                    CatalogVersion.name == CATALOG_NAME
+                )
+            )
+            or 0
+        )
+
+def _public_fields_changed(user):
+    state = inspect(user)
+    return any(state.attrs[name].history.has_changes() for name in PUBLIC_USER_FIELDS)
+
+def _bump_user_version(session, flush_context, instances):
+    deleted = any(isinstance(obj, User) for obj in session.deleted)
+    updated = any(
+        isinstance(obj, User) and _public_fields_changed(obj) for obj in session.dirty
+    )
+    if not deleted and not updated:
+        return
+
+    # Sulla connessione e non sulla sessione, che farebbe un autoflush
+    session.connection().execute(
+        sqlite_insert(CatalogVersion)
+        .values(name=CATALOG_NAME, version=1)
+        .on_conflict_do_update(
+            index_elements=[CatalogVersion.name],
+            set_={"version": CatalogVersion.version + 1},
+        )
+    )
+
+user_version = UserVersion()
@@ -0,0 +1,155 @@
+# LitInvestorBlog-backend/src/utils/view_counter.py
+
+import atexit
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from flask import request, session
+from sqlalchemy import case, func, update
+from src.extensions import db
+from src.models.article import Article
+from src.utils.article_cache import article_cache
+
+CRAWLER_PATTERN = re.compile(
+    r"bot|crawl|spider|slurp|facebookexternalhit|embedly|preview|headless"
+    r"|curl|wget|python-requests|httpclient|monitor",
+    re.IGNORECASE,
+)
+
+# Articoli letti ricordati nella sessione per scartare le riletture, e per
+# quanti secondi: i dati in sessione restano sotto i cento byte
+SESSION_VIEWS_LIMIT = 16
+SESSION_VIEWS_WINDOW = 30 * 60
+
+def _view_token(article_id):
+    """Quattro caratteri esadecimali per articolo, una collisione è innocua"""
+    return hashlib.blake2b(str(article_id).encode(), digest_size=2).hexdigest()
+
+def is_countable_view(article_id):
+    """
+    Decide se la lettura corrente va conteggiata.
+
+    Scarta crawler e client senza User-Agent, e le riletture dello stesso
+    articolo nella stessa sessione entro SESSION_VIEWS_WINDOW secondi. La
+    sessione conserva solo l'inizio della finestra e gli ultimi
+    SESSION_VIEWS_LIMIT token, e viene riscritta solo quando la lettura è
+    conteggiata.
+    """
+    user_agent = request.headers.get("User-Agent", "")
+    if not user_agent or CRAWLER_PATTERN.search(user_agent):
+        return False
+
+    now = int(time.time())
+    started, tokens = session.get("views", (now, ""))
+    if now - started > SESSION_VIEWS_WINDOW:
+        started, tokens = now, ""
+
+    token = _view_token(article_id)
+    seen = [tokens[i : i + 4] for i in range(0, len(tokens), 4)]
+    if token in seen:
+        return False
+
+    session.pop("viewed_articles", None)
+    session["views"] = (started, "".join((seen + [token])[-SESSION_VIEWS_LIMIT:]))
+    return True
+
+class ViewCounter:
+    """
+    Buffer in memoria per i contatori di visualizzazione.
+
+    Le letture accumulano incrementi per articolo senza toccare il database;
+    un thread in background li scrive con un solo UPDATE ... CASE ogni
+    `flush_interval` secondi, o prima se si superano `flush_threshold`
+    eventi. Il buffer viene svuotato anche alla chiusura del processo.
+    """
+
+    def __init__(self, flush_interval=10, flush_threshold=100):
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.app = None
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def init_app(self, app):
+        self.app = app
+        self.flush_interval = app.config.get(
+            "VIEW_COUNTER_FLUSH_INTERVAL", self.flush_interval
+        )
+        self.flush_threshold = app.config.get(
+            "VIEW_COUNTER_FLUSH_THRESHOLD", self.flush_threshold
+        )
+        app.extensions["view_counter"] = self
+        atexit.register(self.flush)
+
+    def record(self, article_id):
+        """Registra una visualizzazione se è conteggiabile"""
+        if not is_countable_view(article_id):
+            return False
+
+        with self._lock:
+            self._pending[article_id] += 1
+            buffered = sum(self._pending.values())
+
+        self._ensure_thread()
+        if buffered >= self.flush_threshold:
+            self._wake.set()
+        return True
+
+    def pending(self, article_id):
+        """Visualizzazioni di un articolo non ancora scritte nel database"""
+        with self._lock:
+            return self._pending.get(article_id, 0)
+
+    def flush(self):
+        """Scrive tutti gli incrementi accumulati con un solo UPDATE"""
+        with self._lock:
+            counts, self._pending = self._pending, Counter()
+
+        if not counts or self.app is None:
+            return 0
+
+        try:
+            with self.app.app_context():
+                db.session.execute(
+                    update(Article)
+                    .where(Article.id.in_(counts))
+                    .values(
+                        views_count=func.coalesce(Article.views_count, 0)
+                        + case(dict(counts), value=Article.id, else_=0),
+                        # Le visualizzazioni non sono una modifica dell'articolo
+                        updated_at=Article.updated_at,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                db.session.commit()
+            article_cache.invalidate(counts)
+        except Exception as e:
+            logging.error(f"Errore nel salvataggio delle visualizzazioni: {e}")
+            with self._lock:
+                self._pending.update(counts)
+            return 0
+
+        return sum(counts.values())
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="view-counter-flush", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+view_counter = ViewCounter()
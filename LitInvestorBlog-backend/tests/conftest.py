@@ -0,0 +1,133 @@
+# LitInvestorBlog-backend/tests/conftest.py
+
+import os
+import shutil
+from datetime import datetime, timedelta
+import pytest
+from flask_migrate import upgrade
+from sqlalchemy import event
+from src.extensions import db
+from src.main import create_app
+from src.models.article import Article
+from src.models.category import Category
+from src.models.user import User
+from src.utils.article_cache import article_cache
+from src.utils.category_catalog import category_catalog
+from src.utils.event_queue import event_queue
+from src.utils.related_articles import related_index
+from src.utils.view_counter import view_counter
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "migrations")
+
+@pytest.fixture(scope="session")
+def migrated_database(tmp_path_factory):
+    """Un database SQLite portato all'ultima migrazione, copiato da ogni test"""
+    path = tmp_path_factory.mktemp("template") / "template.db"
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}"})
+    with app.app_context():
+        upgrade(directory=MIGRATIONS)
+        db.engine.dispose()
+    return path
+
+@pytest.fixture(autouse=True)
+def no_background_threads(monkeypatch):
+    """I thread di flush lavorerebbero sul database mentre il test lo usa"""
+    for extension in (view_counter, event_queue, related_index):
+        monkeypatch.setattr(extension, "_ensure_thread", lambda: None)
+
+@pytest.fixture
+def app(migrated_database, tmp_path):
+    path = tmp_path / "test.db"
+    shutil.copy(migrated_database, path)
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+            "CATEGORY_CATALOG_CHECK_INTERVAL": 0,
+        }
+    )
+    article_cache.clear()
+    category_catalog.invalidate()
+    view_counter.flush()
+
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def queries(app):
+    """Le istruzioni SQL eseguite, come lista di (sql, parametri)"""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(db.engine, "before_cursor_execute", record)
+
+def login(client, user_id):
+    with client.session_transaction() as session:
+        session["user_id"] = user_id
+
+@pytest.fixture
+def blog(app):
+    """
+    Dati minimi: un admin, un lettore, due categorie e cinque articoli
+    pubblicati a un giorno di distanza, più una bozza.
+    """
+    admin = User(username="admin", email="admin@example.com", role="admin")
+    admin.set_password("password")
+    reader = User(username="lettore", email="lettore@example.com")
+    reader.set_password("password")
+    db.session.add_all([admin, reader])
+    db.session.flush()
+
+    markets = Category(
+        name="Mercati", slug="mercati", color="#111111", created_by=admin.id
+    )
+    crypto = Category(
+        name="Crypto", slug="crypto", color="#222222", created_by=admin.id
+    )
+    db.session.add_all([markets, crypto])
+    db.session.flush()
+
+    start = datetime(2025, 9, 1, 9, 0, 0)
+    articles = []
+    for index in range(5):
+        articles.append(
+            Article(
+                title=f"Analisi dei mercati {index}",
+                slug=f"analisi-{index}",
+                content=f"<p>Inflazione, tassi e obbligazioni {index}</p>",
+                excerpt=f"Riassunto {index}",
+                author_id=admin.id,
+                category_id=markets.id if index % 2 == 0 else crypto.id,
+                published=True,
+                created_at=start + timedelta(days=index),
+                updated_at=start + timedelta(days=index),
+            )
+        )
+    draft = Article(
+        title="Bozza",
+        slug="bozza",
+        content="<p>Da finire</p>",
+        author_id=admin.id,
+        category_id=markets.id,
+        published=False,
+    )
+    db.session.add_all([*articles, draft])
+    db.session.commit()
+
+    return {
+        "admin": admin.id,
+        "reader": reader.id,
+        "categories": [markets.id, crypto.id],
+        "articles": [article.id for article in articles],
+        "draft": draft.id,
+    }
@@ -0,0 +1,52 @@
+# LitInvestorBlog-backend/tests/test_article_analytics.py
+
+from datetime import datetime, timedelta
+import pytest
+from src.extensions import db
+from src.models.article import Article
+from src.routes.analytics import MAX_SERIES_POINTS, get_article_analytics
+from src.utils.rollup import run_rollup
+
+def article_analytics(app, article_id, **args):
+    # admin_required di src.middleware.auth non è usabile nei test: si
+    # chiama direttamente la view
+    with app.test_request_context(query_string=args):
+        return get_article_analytics.__wrapped__(article_id)
+
+@pytest.fixture
+def old_and_new(blog):
+    old = db.session.get(Article, blog["articles"][0])
+    old.created_at = datetime.utcnow() - timedelta(days=5 * 365)
+    new = db.session.get(Article, blog["articles"][1])
+    new.created_at = datetime.utcnow() - timedelta(days=2)
+    db.session.commit()
+    run_rollup(full=True)
+    return old.id, new.id
+
+def test_query_count_does_not_grow_with_article_age(app, old_and_new, queries):
+    counts = []
+    for article_id in old_and_new:
+        db.session.expunge_all()
+        queries.clear()
+        response = article_analytics(app, article_id)
+        assert response.status_code == 200
+        counts.append(len(queries))
+
+    # Articolo, tre conteggi, watermark, rollup, tre code dal watermark,
+    # piattaforme, autore e categoria
+    assert counts == [12, 12]
+
+def test_long_range_steps_up_to_a_coarser_bucket(app, old_and_new):
+    old, new = old_and_new
+
+    data = article_analytics(app, old).get_json()
+    assert data["bucket"] == "week"
+    assert len(data["engagement_over_time"]) <= MAX_SERIES_POINTS
+
+    data = article_analytics(app, new).get_json()
+    assert data["bucket"] == "day"
+    assert len(data["engagement_over_time"]) == 3
+
+def test_unknown_bucket_is_rejected(app, old_and_new):
+    response, status = article_analytics(app, old_and_new[0], bucket="year")
+    assert status == 400
@@ -0,0 +1,74 @@
+# LitInvestorBlog-backend/tests/test_article_cache.py
+
+from datetime import datetime
+from sqlalchemy import text
+from src.extensions import db
+from src.models.article import Article
+from src.models.comment import Comment
+from src.utils.article_cache import article_cache, touch_article
+
+def detail(client, article_id):
+    return client.get(f"/api/articles/{article_id}").get_json()["article"]
+
+def reads_article_body(queries):
+    return any("article.content" in statement for statement, _ in queries)
+
+def test_second_read_is_served_from_cache(client, blog, queries):
+    article_id = blog["articles"][0]
+    detail(client, article_id)
+    assert reads_article_body(queries)
+
+    queries.clear()
+    detail(client, article_id)
+
+    assert not reads_article_body(queries)
+
+def test_commit_on_the_article_invalidates_its_entry(client, blog):
+    article_id = blog["articles"][0]
+    detail(client, article_id)
+
+    db.session.get(Article, article_id).title = "Titolo corretto"
+    db.session.commit()
+
+    assert article_cache.get(article_id=article_id) is None
+    assert detail(client, article_id)["title"] == "Titolo corretto"
+
+def test_new_comment_invalidates_the_article(client, blog):
+    article_id = blog["articles"][0]
+    detail(client, article_id)
+
+    db.session.add(
+        Comment(content="Ottima analisi", article_id=article_id, user_id=blog["reader"])
+    )
+    db.session.commit()
+
+    comments = detail(client, article_id)["comments"]
+    assert [comment["content"] for comment in comments] == ["Ottima analisi"]
+
+def test_rollback_keeps_the_entry(client, blog):
+    article_id, other_id = blog["articles"][:2]
+    detail(client, article_id)
+
+    db.session.get(Article, article_id).title = "Modifica annullata"
+    touch_article(article_id)
+    db.session.flush()
+    db.session.rollback()
+    db.session.get(Article, other_id).title = "Altra modifica"
+    db.session.commit()
+
+    assert article_cache.get(article_id=article_id) is not None
+
+def test_commit_from_another_worker_is_a_signature_miss(client, blog):
+    article_id = blog["articles"][0]
+    detail(client, article_id)
+
+    # Un altro processo non passa dagli hook di questo: la voce resta in
+    # memoria ma la firma letta dal database non corrisponde più
+    with db.engine.begin() as conn:
+        conn.execute(
+            text("UPDATE article SET title = :title, updated_at = :now WHERE id = :id"),
+            {"title": "Dall'altro worker", "now": datetime.utcnow(), "id": article_id},
+        )
+    assert article_cache.get(article_id=article_id) is not None
+
+    assert detail(client, article_id)["title"] == "Dall'altro worker"
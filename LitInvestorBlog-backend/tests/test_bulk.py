@@ -0,0 +1,99 @@
+# LitInvestorBlog-backend/tests/test_bulk.py
+
+import pytest
+from src.extensions import db
+from src.models.article import Article
+from src.models.comment import Comment
+from src.models.like import ArticleLike
+from src.models.related import RelatedRefresh
+from src.models.user import User
+from tests.conftest import login
+
+def bulk(client, **body):
+    return client.patch("/api/articles/bulk", json=body)
+
+def queued():
+    return set(db.session.scalars(db.select(RelatedRefresh.article_id)))
+
+@pytest.fixture
+def admin_client(client, blog):
+    login(client, blog["admin"])
+    return client
+
+def test_bulk_delete_removes_articles_and_their_rows(admin_client, blog):
+    first, second = blog["articles"][:2]
+    db.session.add_all(
+        [
+            ArticleLike(article_id=first, user_id=blog["reader"]),
+            Comment(content="Bello", article_id=second, user_id=blog["reader"]),
+        ]
+    )
+    db.session.commit()
+
+    response = bulk(admin_client, operation="delete", ids=[first, second, 999])
+
+    assert response.status_code == 200
+    assert response.get_json()["updated"] == [first, second]
+    assert response.get_json()["skipped"] == [999]
+    db.session.expire_all()
+    assert db.session.get(Article, first) is None
+    assert db.session.get(Article, second) is None
+    assert ArticleLike.query.count() == 0
+    assert Comment.query.count() == 0
+    # Chi li aveva tra i correlati viene ricalcolato in background
+    assert queued() == {first, second}
+
+def test_bulk_unpublish_queues_related_refresh(admin_client, blog):
+    ids = blog["articles"][:3]
+
+    response = bulk(admin_client, operation="unpublish", ids=ids)
+
+    assert response.get_json()["updated"] == ids
+    db.session.expire_all()
+    assert not any(db.session.get(Article, i).published for i in ids)
+    assert queued() == set(ids)
+
+def test_bulk_feature_does_not_touch_the_related_index(admin_client, blog):
+    ids = blog["articles"][:2]
+
+    bulk(admin_client, operation="feature", ids=ids)
+
+    db.session.expire_all()
+    assert all(db.session.get(Article, i).featured for i in ids)
+    assert queued() == set()
+
+def test_collaborators_only_change_their_own_articles(client, blog):
+    writer = User(username="autore", email="autore@example.com", role="collaborator")
+    writer.set_password("password")
+    db.session.add(writer)
+    db.session.flush()
+    own = db.session.get(Article, blog["draft"])
+    own.author_id = writer.id
+    db.session.commit()
+    login(client, writer.id)
+
+    response = bulk(client, operation="publish", ids=[own.id, blog["articles"][0]])
+
+    assert response.get_json()["updated"] == [own.id]
+    assert response.get_json()["skipped"] == [blog["articles"][0]]
+
+@pytest.mark.parametrize(
+    "body, status",
+    [
+        ({"operation": "archive", "ids": [1]}, 400),
+        ({"operation": "publish", "ids": []}, 400),
+        ({"operation": "publish", "ids": [True]}, 400),
+        ({"operation": "set_category", "ids": [1], "category_id": "2"}, 400),
+        ({"operation": "set_category", "ids": [1], "category_id": 999}, 404),
+    ],
+)
+def test_invalid_requests_change_nothing(admin_client, blog, body, status):
+    response = bulk(admin_client, **body)
+
+    assert response.status_code == status
+    assert queued() == set()
+
+def test_readers_cannot_use_bulk(client, blog):
+    login(client, blog["reader"])
+
+    assert bulk(client, operation="delete", ids=blog["articles"]).status_code == 403
@@ -0,0 +1,50 @@
+# LitInvestorBlog-backend/tests/test_category_catalog.py
+
+import pytest
+from sqlalchemy import text
+from src.extensions import db
+from src.models.user import User
+from src.utils.category_catalog import category_catalog
+
+@pytest.fixture
+def slow_checks(app, monkeypatch):
+    """Un controllo ogni ora: solo version() legge la versione dal database"""
+    monkeypatch.setattr(category_catalog, "check_interval", 3600)
+
+def categories(client, headers=None):
+    return client.get("/api/categories/", headers=headers)
+
+def test_creator_rename_refreshes_creator_name(client, blog, slow_checks):
+    response = categories(client)
+
+    db.session.get(User, blog["admin"]).username = "redazione"
+    db.session.commit()
+    renamed = categories(client, {"If-None-Match": response.headers["ETag"]})
+
+    assert renamed.status_code == 200
+    assert {c["creator_name"] for c in renamed.get_json()["categories"]} == {
+        "redazione"
+    }
+
+def test_change_from_another_worker_is_seen_by_the_probe(client, blog, slow_checks):
+    response = categories(client)
+
+    # Un altro processo non invalida il catalogo di questo: solo la riga di
+    # catalog_version racconta la modifica
+    with db.engine.begin() as conn:
+        conn.execute(
+            text("UPDATE category SET name = 'Azioni' WHERE id = :id"),
+            {"id": blog["categories"][0]},
+        )
+        conn.execute(
+            text(
+                "UPDATE catalog_version SET version = version + 1 "
+                "WHERE name = 'category'"
+            )
+        )
+    changed = categories(client, {"If-None-Match": response.headers["ETag"]})
+
+    assert changed.status_code == 200
+    assert "Azioni" in {c["name"] for c in changed.get_json()["categories"]}
+    unchanged = categories(client, {"If-None-Match": changed.headers["ETag"]})
+    assert unchanged.status_code == 304
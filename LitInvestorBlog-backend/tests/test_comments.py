@@ -0,0 +1,97 @@
+# LitInvestorBlog-backend/tests/test_comments.py
+
+from datetime import datetime, timedelta
+import pytest
+from src.extensions import db
+from src.models.comment import Comment, load_comment_thread
+
+START = datetime(2025, 10, 1, 12, 0, 0)
+
+def add_comment(article_id, user_id, minutes, parent_id=None):
+    comment = Comment(
+        content=f"Commento {minutes}",
+        article_id=article_id,
+        user_id=user_id,
+        parent_id=parent_id,
+        created_at=START + timedelta(minutes=minutes),
+    )
+    db.session.add(comment)
+    db.session.flush()
+    return comment.id
+
+@pytest.fixture
+def thread(blog):
+    """Due radici; la seconda ha tre risposte, una delle quali annidata"""
+    article_id = blog["articles"][0]
+    older = add_comment(article_id, blog["reader"], 0)
+    root = add_comment(article_id, blog["reader"], 1)
+    first = add_comment(article_id, blog["admin"], 2, parent_id=root)
+    nested = add_comment(article_id, blog["reader"], 3, parent_id=first)
+    last = add_comment(article_id, blog["admin"], 4, parent_id=root)
+    db.session.commit()
+    return {
+        "article": article_id,
+        "reader": blog["reader"],
+        "older": older,
+        "root": root,
+        "replies": [first, nested, last],
+    }
+
+def test_replies_are_capped_per_root(app, thread):
+    tree, next_cursor = load_comment_thread(thread["article"], replies_per_root=2)
+
+    assert next_cursor is None
+    assert [node["id"] for node in tree] == [thread["root"], thread["older"]]
+    root = tree[0]
+    first, nested, _ = thread["replies"]
+    assert [reply["id"] for reply in root["replies"]] == [first]
+    assert [reply["id"] for reply in root["replies"][0]["replies"]] == [nested]
+    assert root["replies_count"] == 3
+    assert root["replies_next_cursor"]
+    assert tree[1]["replies_count"] == 0
+    assert tree[1]["replies_next_cursor"] is None
+
+def test_remaining_replies_page_from_the_root_cursor(client, thread):
+    tree, _ = load_comment_thread(thread["article"], replies_per_root=2)
+
+    # Il blueprint dei commenti ha il prefisso ripetuto nelle rotte
+    response = client.get(
+        f"/api/comments/api/comments/{thread['root']}/replies",
+        query_string={"cursor": tree[0]["replies_next_cursor"]},
+    )
+
+    data = response.get_json()
+    assert [reply["id"] for reply in data["replies"]] == thread["replies"][2:]
+    assert data["pagination"]["next_cursor"] is None
+
+def test_roots_are_paginated_by_cursor(client, thread):
+    url = f"/api/articles/{thread['article']}/comments"
+
+    first = client.get(url, query_string={"per_page": 1}).get_json()
+    second = client.get(
+        url, query_string={"per_page": 1, "cursor": first["next_cursor"]}
+    ).get_json()
+
+    assert [node["id"] for node in first["comments"]] == [thread["root"]]
+    assert [node["id"] for node in second["comments"]] == [thread["older"]]
+    assert second["next_cursor"] is None
+
+def test_query_count_does_not_depend_on_the_thread_size(client, thread, queries):
+    url = f"/api/articles/{thread['article']}/comments"
+    client.get(url)
+    small = len(queries)
+
+    for minutes in range(10, 30):
+        add_comment(thread["article"], thread["reader"], minutes, thread["root"])
+    db.session.commit()
+    queries.clear()
+    client.get(url)
+
+    assert len(queries) == small
+
+def test_invalid_cursor_is_a_bad_request(client, thread):
+    response = client.get(
+        f"/api/articles/{thread['article']}/comments", query_string={"cursor": "%%"}
+    )
+
+    assert response.status_code == 400
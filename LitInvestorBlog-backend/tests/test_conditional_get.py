@@ -0,0 +1,106 @@
+# LitInvestorBlog-backend/tests/test_conditional_get.py
+
+import pytest
+from src.extensions import db
+from src.models.article import Article
+from src.models.category import Category
+from src.models.comment import Comment
+from src.models.user import User
+from tests.conftest import login
+
+def revalidate(client, url, response):
+    return client.get(url, headers={"If-None-Match": response.headers["ETag"]})
+
+@pytest.mark.parametrize(
+    "url", ["/api/articles/", "/api/filters/options", "/api/categories/"]
+)
+def test_unchanged_lists_answer_304(client, blog, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    cached = revalidate(client, url, response)
+
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == response.headers["ETag"]
+    assert not cached.data
+
+def test_article_list_changes_with_counters_and_author(client, blog):
+    response = client.get("/api/articles/")
+
+    login(client, blog["reader"])
+    client.post(f"/api/articles/{blog['articles'][0]}/like")
+    liked = revalidate(client, "/api/articles/", response)
+    assert liked.status_code == 200
+
+    db.session.get(User, blog["admin"]).first_name = "Giulia"
+    db.session.commit()
+    assert revalidate(client, "/api/articles/", liked).status_code == 200
+
+def test_etag_depends_on_the_session_user(app, blog):
+    anonymous = app.test_client().get("/api/articles/")
+    reader = app.test_client()
+    login(reader, blog["reader"])
+
+    assert revalidate(reader, "/api/articles/", anonymous).status_code == 200
+
+def test_category_change_refreshes_category_list(client, blog):
+    response = client.get("/api/categories/")
+
+    db.session.get(Category, blog["categories"][0]).color = "#333333"
+    db.session.commit()
+
+    assert revalidate(client, "/api/categories/", response).status_code == 200
+
+def test_article_detail_uses_etag_and_last_modified(client, blog):
+    article_id = blog["articles"][0]
+    url = f"/api/articles/{article_id}"
+    response = client.get(url)
+    assert response.headers["Last-Modified"]
+
+    since = client.get(
+        url, headers={"If-Modified-Since": response.headers["Last-Modified"]}
+    )
+    assert since.status_code == 304
+
+    db.session.add(
+        Comment(content="Nuovo", article_id=article_id, user_id=blog["reader"])
+    )
+    db.session.commit()
+    assert revalidate(client, url, response).status_code == 200
+
+def test_missing_article_is_not_cached(client, blog):
+    response = client.get("/api/articles/999")
+
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
+
+def test_list_validators_skip_last_modified(client, blog):
+    # Calcolarlo richiederebbe di leggere tutta la tabella article
+    response = client.get("/api/articles/")
+
+    assert "Last-Modified" not in response.headers
+    db.session.get(Article, blog["articles"][0]).title = "Aggiornato"
+    db.session.commit()
+    assert revalidate(client, "/api/articles/", response).status_code == 200
+
+def test_filter_options_change_when_an_author_is_renamed(client, blog):
+    response = client.get("/api/filters/options")
+
+    db.session.get(User, blog["admin"]).username = "redazione"
+    db.session.commit()
+    renamed = revalidate(client, "/api/filters/options", response)
+
+    assert renamed.status_code == 200
+    labels = [author["label"] for author in renamed.get_json()["authors"]]
+    assert labels == ["redazione"]
+
+def test_new_users_do_not_change_filter_options(client, blog):
+    response = client.get("/api/filters/options")
+
+    reader = User(username="nuovo", email="nuovo@example.com")
+    reader.set_password("password")
+    db.session.add(reader)
+    db.session.commit()
+
+    assert revalidate(client, "/api/filters/options", response).status_code == 304
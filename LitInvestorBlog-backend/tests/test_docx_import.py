@@ -0,0 +1,118 @@
+# LitInvestorBlog-backend/tests/test_docx_import.py
+
+import io
+import zipfile
+import pytest
+from PIL import Image
+from src.extensions import db
+from src.models.article import Article
+from src.models.imported_document import ImportedDocument
+from src.utils.docx_import import import_documents
+
+DOCUMENT = (
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+    ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    "<w:body><w:p><w:r><w:t>{title}</w:t></w:r></w:p>{images}</w:body></w:document>"
+)
+IMAGE = '<w:p><w:r><w:drawing><a:blip r:embed="{id}"/></w:drawing></w:r></w:p>'
+RELATIONSHIPS = (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    "{}</Relationships>"
+)
+RELATIONSHIP = '<Relationship Id="{id}" Target="media/{name}"/>'
+
+def png():
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4), "red").save(buffer, "png")
+    return buffer.getvalue()
+
+def write_docx(path, title, images=()):
+    """Un .docx minimo con un paragrafo e le immagini date come (nome, byte)"""
+    ids = [f"rId{index}" for index in range(len(images))]
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            DOCUMENT.format(
+                title=title, images="".join(IMAGE.format(id=i) for i in ids)
+            ),
+        )
+        archive.writestr(
+            "word/_rels/document.xml.rels",
+            RELATIONSHIPS.format(
+                "".join(
+                    RELATIONSHIP.format(id=i, name=name)
+                    for i, (name, _) in zip(ids, images)
+                )
+            ),
+        )
+        for name, data in images:
+            archive.writestr(f"word/media/{name}", data)
+
+def unsupported_compression(path):
+    """Dichiara i membri compressi con un metodo che zipfile non conosce"""
+    data = bytearray(path.read_bytes())
+    for signature, offset in ((b"PK\x03\x04", 8), (b"PK\x01\x02", 10)):
+        start = data.find(signature)
+        while start != -1:
+            data[start + offset] = 99
+            start = data.find(signature, start + 1)
+    path.write_bytes(bytes(data))
+
+@pytest.fixture
+def folders(tmp_path):
+    documents, uploads = tmp_path / "documenti", tmp_path / "uploads"
+    documents.mkdir()
+    uploads.mkdir()
+    return documents, uploads
+
+def run_import(folders, blog):
+    documents, uploads = folders
+    return import_documents(
+        str(documents), blog["admin"], blog["categories"][0], str(uploads), workers=2
+    )
+
+def test_broken_images_fail_the_document_once_and_leave_no_files(app, blog, folders):
+    documents, uploads = folders
+    write_docx(documents / "1. Buono.docx", "Buono", [("a.png", png())])
+    write_docx(
+        documents / "2. Rotto.docx",
+        "Rotto",
+        [("ok.png", png()), ("x.png", b"non sono un png"), ("y.png", b"nemmeno io")],
+    )
+
+    summary = run_import(folders, blog)
+
+    assert summary["created"] == ["1. Buono.docx"]
+    assert [name for name, _ in summary["failed"]] == ["2. Rotto.docx"]
+    assert summary["failed"][0][1].startswith("immagine: ")
+    # Resta solo il WebP del documento importato
+    assert len(list(uploads.iterdir())) == 1
+    assert Article.query.filter_by(title="Rotto").count() == 0
+    assert db.session.query(ImportedDocument.path).all() == [("1. Buono.docx",)]
+
+def test_unexpected_parse_errors_do_not_abort_the_import(app, blog, folders):
+    documents, _ = folders
+    write_docx(documents / "1. Compresso.docx", "Compresso")
+    unsupported_compression(documents / "1. Compresso.docx")
+    (documents / "2. Vuoto.docx").write_bytes(b"")
+    write_docx(documents / "3. Buono.docx", "Buono")
+
+    summary = run_import(folders, blog)
+
+    assert summary["created"] == ["3. Buono.docx"]
+    failed = dict(summary["failed"])
+    assert failed["1. Compresso.docx"].startswith("errore nella conversione: ")
+    assert failed["2. Vuoto.docx"].startswith("documento non valido: ")
+
+def test_failed_documents_are_retried(app, blog, folders):
+    documents, _ = folders
+    path = documents / "Rotto.docx"
+    write_docx(path, "Rotto", [("x.png", b"non sono un png")])
+    run_import(folders, blog)
+
+    write_docx(path, "Rotto", [("x.png", png())])
+    summary = run_import(folders, blog)
+
+    assert summary["created"] == ["Rotto.docx"]
+    assert summary["failed"] == []
@@ -0,0 +1,92 @@
+# LitInvestorBlog-backend/tests/test_engagement.py
+
+import pytest
+from src.extensions import db
+from src.models.article import Article
+from src.models.comment import Comment
+from src.models.engagement import ArticleEngagement
+from src.models.like import ArticleLike
+from src.models.share import Share
+from src.models.user import User
+from src.utils.counters import reconcile_engagement
+
+def engagement(article_id):
+    db.session.expire_all()
+    row = db.session.get(ArticleEngagement, article_id)
+    return row and (row.likes, row.comments, row.shares, row.views, row.score)
+
+@pytest.fixture
+def readers(blog):
+    users = [
+        User(username=f"lettore{index}", email=f"lettore{index}@example.com")
+        for index in range(3)
+    ]
+    for user in users:
+        user.set_password("password")
+    db.session.add_all(users)
+    db.session.commit()
+    return [user.id for user in users]
+
+def add_activity(article_id, user_ids, comments=0, shares=0):
+    db.session.add_all(
+        [ArticleLike(article_id=article_id, user_id=user_id) for user_id in user_ids]
+        + [
+            Comment(content="Commento", article_id=article_id, user_id=user_ids[0])
+            for _ in range(comments)
+        ]
+        + [Share(article_id=article_id, platform="linkedin") for _ in range(shares)]
+    )
+    db.session.commit()
+
+def test_new_articles_start_at_zero(app, blog):
+    assert engagement(blog["articles"][0]) == (0, 0, 0, 0, 0.0)
+
+def test_triggers_count_each_table_without_fan_out(app, blog, readers):
+    article_id = blog["articles"][0]
+
+    # Un join tra le tre tabelle darebbe 3 x 2 x 2 righe per articolo
+    add_activity(article_id, readers, comments=2, shares=2)
+
+    assert engagement(article_id) == (3, 2, 2, 0, 3 * 3 + 2 * 5 + 2 * 4)
+
+def test_deletes_and_views_update_the_row(app, blog, readers):
+    article_id = blog["articles"][0]
+    add_activity(article_id, readers, comments=1)
+
+    ArticleLike.query.filter_by(user_id=readers[0]).delete()
+    Comment.query.filter_by(article_id=article_id).delete()
+    db.session.get(Article, article_id).views_count = 30
+    db.session.commit()
+
+    assert engagement(article_id) == (2, 0, 0, 30, 2 * 3 + 30 * 0.1)
+
+def test_deleted_article_leaves_the_ranking(app, blog):
+    article_id = blog["articles"][0]
+
+    db.session.delete(db.session.get(Article, article_id))
+    db.session.commit()
+
+    assert engagement(article_id) is None
+
+def test_popular_ranks_by_score_and_skips_drafts(client, blog, readers):
+    first, second, third = blog["articles"][:3]
+    add_activity(second, readers, shares=1)
+    add_activity(third, readers[:1], comments=1)
+    add_activity(blog["draft"], readers, comments=5, shares=5)
+
+    response = client.get("/api/articles/popular", query_string={"limit": 3})
+
+    ranked = [article["id"] for article in response.get_json()["articles"]]
+    # A parità di score vince l'articolo più recente
+    assert ranked == [second, third, blog["articles"][4]]
+
+def test_reconcile_matches_the_triggers(app, blog, readers):
+    add_activity(blog["articles"][0], readers, comments=2, shares=1)
+    add_activity(blog["articles"][1], readers[:2], shares=3)
+    before = [engagement(article_id) for article_id in blog["articles"]]
+
+    ArticleEngagement.query.delete()
+    db.session.commit()
+    reconcile_engagement()
+
+    assert [engagement(article_id) for article_id in blog["articles"]] == before
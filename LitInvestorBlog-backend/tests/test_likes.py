@@ -0,0 +1,52 @@
+# LitInvestorBlog-backend/tests/test_likes.py
+
+from src.extensions import db
+from src.models.article import Article
+from src.models.like import ArticleLike
+from src.utils.counters import reconcile_counters
+from tests.conftest import login
+
+def likes(article_id):
+    db.session.expire_all()
+    rows = ArticleLike.query.filter_by(article_id=article_id).count()
+    return rows, db.session.get(Article, article_id).likes_count
+
+def test_like_toggles_row_and_counter(client, blog):
+    article_id = blog["articles"][0]
+    login(client, blog["reader"])
+
+    liked = client.post(f"/api/articles/{article_id}/like")
+    assert liked.get_json() == {"liked": True, "likes_count": 1}
+    assert likes(article_id) == (1, 1)
+
+    unliked = client.post(f"/api/articles/{article_id}/like")
+    assert unliked.get_json() == {"liked": False, "likes_count": 0}
+    assert likes(article_id) == (0, 0)
+
+def test_likes_from_different_users_add_up(app, blog):
+    article_id = blog["articles"][0]
+    for user_id in (blog["reader"], blog["admin"]):
+        client = app.test_client()
+        login(client, user_id)
+        client.post(f"/api/articles/{article_id}/like")
+
+    assert likes(article_id) == (2, 2)
+
+def test_like_on_missing_article_leaves_nothing_behind(client, blog):
+    login(client, blog["reader"])
+
+    response = client.post("/api/articles/999/like")
+
+    assert response.status_code == 404
+    assert ArticleLike.query.count() == 0
+
+def test_reconcile_counters_fixes_drifted_likes(client, blog):
+    article_id = blog["articles"][0]
+    login(client, blog["reader"])
+    client.post(f"/api/articles/{article_id}/like")
+    db.session.get(Article, article_id).likes_count = 7
+    db.session.commit()
+
+    assert reconcile_counters() == 1
+    assert likes(article_id) == (1, 1)
+    assert reconcile_counters() == 0
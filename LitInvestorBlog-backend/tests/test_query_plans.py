@@ -0,0 +1,107 @@
+# LitInvestorBlog-backend/tests/test_query_plans.py
+
+import re
+import pytest
+from src.extensions import db
+from src.models.comment import Comment
+from src.models.favorite import ArticleFavorite
+from src.models.like import ArticleLike
+from tests.conftest import login
+
+# "SCAN article" senza "USING ... INDEX" significa lettura dell'intera tabella;
+# le tabelle virtuali FTS5 hanno il loro indice
+FULL_SCAN = re.compile(r"\bSCAN (\w+)\b(?! USING (?:COVERING )?INDEX| VIRTUAL TABLE)")
+
+ALIAS_SUFFIX = re.compile(r"_\d+$")
+
+# Tabelle lette per intero di proposito
+ALLOWED_SCANS = {
+    # Una riga per (categoria, autore, mese): è già l'aggregato delle opzioni
+    "article_facet",
+}
+
+# Le GET che il frontend chiama a ogni pagina
+ROUTES = [
+    "/api/articles/",
+    "/api/articles/?cursor=",
+    "/api/articles/?year=2025&month=9",
+    "/api/articles/?category_slug=mercati",
+    "/api/articles/?author_id={admin}",
+    "/api/articles/?q=inflazione",
+    "/api/articles/{article}",
+    "/api/articles/analisi-0",
+    "/api/articles/{article}/related",
+    "/api/articles/{article}/comments",
+    "/api/articles/popular",
+    "/api/articles/favorites",
+    "/api/users/me/likes",
+    "/api/comments/api/comments/{comment}/replies",
+    "/api/filters/options",
+    "/api/categories/",
+    "/api/categories/mercati",
+]
+
+@pytest.fixture
+def activity(blog):
+    """Un commento con risposta, un like e un preferito del lettore"""
+    article_id = blog["articles"][0]
+    root = Comment(content="Domanda", article_id=article_id, user_id=blog["reader"])
+    db.session.add(root)
+    db.session.flush()
+    db.session.add_all(
+        [
+            Comment(
+                content="Risposta",
+                article_id=article_id,
+                user_id=blog["admin"],
+                parent_id=root.id,
+            ),
+            ArticleLike(article_id=article_id, user_id=blog["reader"]),
+            ArticleFavorite(article_id=article_id, user_id=blog["reader"]),
+        ]
+    )
+    db.session.commit()
+    return {
+        "admin": blog["admin"],
+        "reader": blog["reader"],
+        "article": article_id,
+        "comment": root.id,
+    }
+
+def full_scans(statement, parameters):
+    """
+    Le tabelle lette per intero nel piano di una SELECT. Gli alias generati
+    da SQLAlchemy ("article_1") tornano al nome della tabella; CTE e
+    subquery ("thread", "anon_1") non sono tabelle e vengono ignorate.
+    """
+    rows = db.session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    )
+    scans = []
+    for row in rows:
+        for match in FULL_SCAN.finditer(row[-1]):
+            table = ALIAS_SUFFIX.sub("", match.group(1))
+            if table in db.metadata.tables:
+                scans.append(table)
+    return scans
+
+@pytest.mark.parametrize("route", ROUTES)
+def test_route_queries_use_indexes(client, activity, queries, route):
+    login(client, activity["reader"])
+    url = route.format(**activity)
+    response = client.get(url)
+    assert response.status_code == 200, response.get_json()
+
+    reads = [
+        (statement, parameters)
+        for statement, parameters in queries
+        if statement.lstrip().upper().startswith(("SELECT", "WITH"))
+    ]
+    assert reads
+
+    scans = {}
+    for statement, parameters in reads:
+        for table in full_scans(statement, parameters):
+            if table not in ALLOWED_SCANS:
+                scans[table] = statement
+    assert not scans, f"{url} legge per intero {sorted(scans)}"
@@ -0,0 +1,104 @@
+# LitInvestorBlog-backend/tests/test_related_articles.py
+
+from sqlalchemy import or_
+from src.extensions import db
+from src.models.article import Article
+from src.models.like import ArticleLike
+from src.models.related import ArticleRelated
+from src.utils import related_articles
+from src.utils.related_articles import related_index
+
+def index_rows():
+    return sorted(
+        (row.article_id, row.rank, row.related_id, round(row.score, 9))
+        for row in ArticleRelated.query
+    )
+
+def like_all(blog, article_ids):
+    db.session.add_all(
+        ArticleLike(article_id=article_id, user_id=user_id)
+        for article_id in article_ids
+        for user_id in (blog["admin"], blog["reader"])
+    )
+    db.session.commit()
+
+def test_rebuild_blends_text_category_and_likes(app, blog):
+    first, second, third, fourth, fifth = blog["articles"]
+    like_all(blog, [first, third])
+
+    assert related_index.rebuild() == len(blog["articles"])
+
+    neighbours = [
+        row.related_id
+        for row in ArticleRelated.query.filter_by(article_id=first).order_by(
+            ArticleRelated.rank
+        )
+    ]
+    # Il testo è lo stesso per tutti: prima categoria e like, poi la sola
+    # categoria, poi gli altri dal più recente; la bozza non è indicizzata
+    assert neighbours == [third, fifth, fourth, second]
+
+def test_rebuild_in_blocks_matches_single_block(app, blog, monkeypatch):
+    like_all(blog, blog["articles"][:3])
+    related_index.rebuild()
+    expected = index_rows()
+
+    monkeypatch.setattr(related_articles, "BLOCK_CELLS", 1)
+    related_index.rebuild()
+
+    assert index_rows() == expected
+
+def test_refresh_matches_rebuild(app, blog):
+    like_all(blog, blog["articles"][1:])
+    related_index.rebuild()
+    expected = index_rows()
+
+    for article_id in blog["articles"]:
+        related_index.refresh(article_id)
+
+    assert index_rows() == expected
+
+def test_refresh_removes_unpublished_article(app, blog):
+    related_index.rebuild()
+    removed = blog["articles"][0]
+    db.session.get(Article, removed).published = False
+    db.session.commit()
+
+    related_index.refresh(removed)
+
+    assert not ArticleRelated.query.filter(
+        or_(ArticleRelated.article_id == removed, ArticleRelated.related_id == removed)
+    ).count()
+    assert ArticleRelated.query.filter_by(article_id=blog["articles"][1]).count() == 3
+
+def test_refresh_publishes_draft_into_neighbours(app, blog):
+    related_index.rebuild()
+    draft = blog["draft"]
+    db.session.get(Article, draft).published = True
+    db.session.commit()
+
+    related_index.refresh(draft)
+
+    # La bozza non ha termini in comune: la lega agli altri solo la categoria
+    same_category = set(blog["articles"][0::2])
+    assert {
+        row.related_id for row in ArticleRelated.query.filter_by(article_id=draft)
+    } == same_category
+    assert {
+        row.article_id for row in ArticleRelated.query.filter_by(related_id=draft)
+    } == same_category
+
+def test_related_endpoint_serves_index_order(client, blog):
+    related_index.rebuild()
+    article_id = blog["articles"][2]
+    expected = [
+        row.related_id
+        for row in ArticleRelated.query.filter_by(article_id=article_id).order_by(
+            ArticleRelated.rank
+        )
+    ]
+
+    response = client.get(f"/api/articles/{article_id}/related?limit=8")
+
+    assert response.status_code == 200
+    assert [article["id"] for article in response.get_json()["articles"]] == expected
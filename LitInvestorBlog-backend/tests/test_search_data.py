@@ -0,0 +1,44 @@
+# LitInvestorBlog-backend/tests/test_search_data.py
+
+from sqlalchemy import select
+from src.extensions import db
+from src.models.article import Article
+from src.models.search_snapshot import SearchDataSnapshot
+from src.utils.search_data import SearchDataStore
+
+def stored_versions():
+    with db.engine.connect() as conn:
+        return set(conn.scalars(select(SearchDataSnapshot.version)))
+
+def test_snapshot_is_saved_without_touching_the_request_session(app, blog):
+    article = db.session.get(Article, blog["articles"][0])
+
+    snapshot = SearchDataStore().snapshot()
+
+    assert stored_versions() == {snapshot["version"]}
+    # Un commit o un rollback della sessione avrebbe fatto scadere l'oggetto
+    assert "title" in vars(article)
+    assert db.session().in_transaction()
+
+def test_delta_from_a_version_built_by_another_worker(app, blog):
+    first_worker, second_worker = SearchDataStore(), SearchDataStore()
+    since = first_worker.snapshot()["version"]
+
+    db.session.get(Article, blog["articles"][0]).title = "Titolo nuovo"
+    db.session.get(Article, blog["articles"][1]).published = False
+    db.session.commit()
+    delta = second_worker.delta(since)
+
+    assert not delta["reset"]
+    assert [item["title"] for item in delta["changed"]] == ["Titolo nuovo"]
+    assert delta["removed"] == ["/article/analisi-1"]
+
+def test_only_recent_versions_are_kept(app, blog):
+    store = SearchDataStore(history_size=2)
+    versions = []
+    for title in ("Uno", "Due", "Tre"):
+        db.session.get(Article, blog["articles"][0]).title = title
+        db.session.commit()
+        versions.append(store.snapshot()["version"])
+
+    assert stored_versions() == set(versions[1:])
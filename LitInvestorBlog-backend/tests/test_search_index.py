@@ -0,0 +1,50 @@
+# LitInvestorBlog-backend/tests/test_search_index.py
+
+from src.extensions import db
+from src.models.article import Article
+from src.utils.search_index import rebuild_search_index
+
+def set_content(article_id, content):
+    db.session.get(Article, article_id).content = content
+    db.session.commit()
+
+def search(client, q):
+    response = client.get("/api/articles/", query_string={"q": q})
+    return {a["id"]: a.get("search_snippet") for a in response.get_json()["articles"]}
+
+def test_snippet_comes_from_the_text_without_tags(client, blog):
+    article_id = blog["articles"][0]
+    set_content(
+        article_id,
+        '<p>Il <a href="/borsa">rendimento</a> &amp; i tassi</p>'
+        "<script>rendimento()</script>",
+    )
+
+    assert search(client, "rendimento") == {
+        article_id: "Il <mark>rendimento</mark> &amp; i tassi"
+    }
+
+def test_markup_in_the_text_stays_escaped(client, blog):
+    article_id = blog["articles"][0]
+    set_content(article_id, "<p>&lt;img src=x onerror=alert(1)&gt; rendimento</p>")
+
+    assert search(client, "rendimento") == {
+        article_id: "&lt;img src=x onerror=alert(1)&gt; <mark>rendimento</mark>"
+    }
+
+def test_attributes_and_old_content_are_not_indexed(client, blog):
+    article_id = blog["articles"][0]
+    set_content(article_id, '<p class="rendimento">Cedole</p>')
+
+    assert search(client, "rendimento") == {}
+    assert set(search(client, "cedole")) == {article_id}
+
+    set_content(article_id, "<p>Dividendi</p>")
+    assert search(client, "cedole") == {}
+
+def test_rebuild_keeps_the_plain_text(client, blog):
+    article_id = blog["articles"][0]
+    set_content(article_id, "<p><b>Rendimento</b> reale</p>")
+
+    assert rebuild_search_index() == 6
+    assert search(client, "rendimento") == {article_id: "<mark>Rendimento</mark> reale"}
@@ -0,0 +1,53 @@
+# LitInvestorBlog-backend/tests/test_views.py
+
+from src.extensions import db
+from src.models.article import Article
+from src.utils.view_counter import view_counter
+
+BROWSER = {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) Firefox/131.0"}
+
+def stored_views(article_id):
+    db.session.expire_all()
+    return db.session.get(Article, article_id).views_count
+
+def test_rereads_in_the_same_session_count_once(client, blog):
+    article_id = blog["articles"][0]
+
+    first = client.get(f"/api/articles/{article_id}", headers=BROWSER)
+    second = client.get(f"/api/articles/{article_id}", headers=BROWSER)
+
+    assert view_counter.pending(article_id) == 1
+    # Le visualizzazioni ancora nel buffer sono già nella risposta
+    assert first.get_json()["article"]["views_count"] == 1
+    assert second.get_json()["article"]["views_count"] == 1
+    assert stored_views(article_id) == 0
+
+def test_crawlers_and_missing_user_agent_are_not_counted(client, blog):
+    article_id = blog["articles"][0]
+
+    client.get(f"/api/articles/{article_id}", headers={"User-Agent": "Googlebot/2.1"})
+    client.get(f"/api/articles/{article_id}", headers={"User-Agent": ""})
+
+    assert view_counter.pending(article_id) == 0
+
+def test_flush_writes_the_buffer_with_one_update(client, blog, queries):
+    first, second = blog["articles"][:2]
+    updated_at = db.session.get(Article, first).updated_at
+    client.get(f"/api/articles/{first}", headers=BROWSER)
+    client.get(f"/api/articles/{second}", headers=BROWSER)
+    client.get(f"/api/articles/{first}", headers=BROWSER)
+    other_reader = client.application.test_client()
+    other_reader.get(f"/api/articles/{first}", headers=BROWSER)
+
+    queries.clear()
+    assert view_counter.flush() == 3
+
+    updates = [
+        statement for statement, _ in queries if statement.startswith("UPDATE article")
+    ]
+    assert len(updates) == 1
+    assert view_counter.pending(first) == 0
+    assert stored_views(first) == 2
+    assert stored_views(second) == 1
+    # Le visualizzazioni non sono una modifica dell'articolo
+    assert db.session.get(Article, first).updated_at == updated_at
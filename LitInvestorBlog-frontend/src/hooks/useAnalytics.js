@@ -54,13 +54,20 @@ export const useAnalytics = (user) => {
     }
   };
 
-  const fetchArticleAnalytics = async (articleId) => {
+  const fetchArticleAnalytics = async (
+    articleId,
+    { range = 'all', bucket = 'day' } = {},
+  ) => {
     if (!user || user.role !== 'admin') return null;
 
     try {
-      const response = await fetch(`/api/analytics/article/${articleId}`, {
-        credentials: 'include',
-      });
+      const params = new URLSearchParams({ range, bucket });
+      const response = await fetch(
+        `/api/analytics/article/${articleId}?${params}`,
+        {
+          credentials: 'include',
+        },
+      );
 
       if (response.ok) {
         return await response.json();
@@ -0,0 +1,77 @@
+// LitInvestorBlog-frontend/src/hooks/usePageEvents.js
+
+import { useEffect } from 'react';
+
+const EVENTS_URL = '/api/events';
+
+const sendEvents = (events) => {
+  if (events.length === 0) return;
+  const body = JSON.stringify({ events });
+  if (navigator.sendBeacon && navigator.sendBeacon(EVENTS_URL, body)) return;
+  fetch(EVENTS_URL, {
+    method: 'POST',
+    body,
+    credentials: 'include',
+    keepalive: true,
+  }).catch(() => {});
+};
+
+// Invia la lettura della pagina e, quando la pagina viene nascosta o
+// lasciata, la profondità di scroll massima e il tempo di lettura.
+export function usePageEvents(articleId) {
+  useEffect(() => {
+    if (!articleId) return undefined;
+
+    const path = window.location.pathname;
+    const event = (type, value) => ({
+      type,
+      path,
+      article_id: articleId,
+      value,
+      ts: Date.now(),
+    });
+
+    let maxScroll = 0;
+    let visibleSince = document.hidden ? null : Date.now();
+    let readTime = 0;
+
+    const onScroll = () => {
+      const scrollable =
+        document.documentElement.scrollHeight - window.innerHeight;
+      const depth = scrollable > 0 ? (window.scrollY / scrollable) * 100 : 100;
+      maxScroll = Math.max(maxScroll, Math.min(Math.round(depth), 100));
+    };
+
+    const report = () => {
+      if (visibleSince !== null) {
+        readTime += (Date.now() - visibleSince) / 1000;
+        visibleSince = null;
+      }
+      const events = [];
+      if (maxScroll > 0) events.push(event('scroll', maxScroll));
+      if (readTime > 0) events.push(event('read_time', Math.round(readTime)));
+      sendEvents(events);
+      maxScroll = 0;
+      readTime = 0;
+    };
+
+    const onVisibilityChange = () => {
+      if (document.hidden) {
+        report();
+      } else {
+        visibleSince = Date.now();
+      }
+    };
+
+    sendEvents([event('view')]);
+    onScroll();
+    window.addEventListener('scroll', onScroll, { passive: true });
+    document.addEventListener('visibilitychange', onVisibilityChange);
+
+    return () => {
+      window.removeEventListener('scroll', onScroll);
+      document.removeEventListener('visibilitychange', onVisibilityChange);
+      report();
+    };
+  }, [articleId]);
+}
@@ -74,6 +74,7 @@ const AdminAnalyticsPage = () => {
     { value: '30d', label: 'Ultimi 30 giorni' },
     { value: '90d', label: 'Ultimi 3 mesi' },
     { value: '1y', label: 'Ultimo anno' },
+    { value: 'all', label: 'Tutto' },
   ];
 
   const formatNumber = (num) => {
@@ -802,6 +802,7 @@ const AdminPage = () => {
                             </SelectItem>
                             <SelectItem value="90d">Ultimi 3 mesi</SelectItem>
                             <SelectItem value="1y">Ultimo anno</SelectItem>
+                            <SelectItem value="all">Tutto</SelectItem>
                           </SelectContent>
                         </Select>
                         <Button
@@ -13,6 +13,7 @@ import RelatedArticles from '../components/RelatedArticles';
 import ShareLinks from '../components/ShareLinks';
 import ArticleContacts from '../components/ArticleContacts';
 import ArticleActions from '../components/ArticleActions';
+import { usePageEvents } from '../hooks/usePageEvents';
 
 const ArticleDetailPage = () => {
   const { slug } = useParams();
@@ -36,6 +37,8 @@ const ArticleDetailPage = () => {
     if (slug) fetchArticle();
   }, [slug]);
 
+  usePageEvents(article?.id);
+
   const formatDate = (dateString) => {
     try {
       return format(new Date(dateString), 'd MMMM yyyy', { locale: it });
@@ -116,7 +119,7 @@ const ArticleDetailPage = () => {
           <div className="mt-68 is-compact">
             <RelatedArticles
               title="Altro da Lit Investor"
-              fetchUrl={`/api/articles?category_id=${article.category_id}&exclude_id=${article.id}&per_page=4`}
+              fetchUrl={`/api/articles/${article.id}/related?limit=4`}
             />
           </div>
         </article>